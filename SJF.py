@@ -1,7 +1,10 @@
 import tkinter as tk
-import random
+from tkinter import ttk
 import customtkinter as ctk
 
+from scheduler import ALGORITHMS, generate_workload, label, labels, run_schedule
+from scheduler.render import MIXED, decimate, merge_segments
+
 
 
 root = ctk.CTk()
@@ -9,14 +12,24 @@ root.geometry('1000x700')
 root.title('SJF Simulator')
 
 # Global declaration
-process_data = []
+schedule = None
+segments = None
 schedule_order = []
 total_time = 0
 canvas = None
-pool_table_widgets = []
+draw_data = None   # per-step draw data of the current animation (None when idle)
+step_index = 0     # next animation step to draw
+after_id = None    # pending root.after() callback, if any
+pool_columns = []  # per-job result arrays shown in the Pool table
+pool_offset = 0    # index of the first job visible in the Pool table
+pool_rows = []     # recycled Treeview item ids, one per visible row
 queue_label = None
 job_labels = []
-color_map = {}
+
+# Gantt colors: each process cycles through these; fused blocks are grey
+BASE_COLORS = ["#B22222", "#228B22", "#1E90FF", "#DAA520", "#8A2BE2"]
+MIXED_COLOR = "#808080"
+QUEUE_PREVIEW = 8  # ready-queue entries shown at once
 
 
 # Functions
@@ -27,197 +40,251 @@ def job(selected_value):
 
 # Generate random data
 def generate_data():
-    global process_data, schedule_order, total_time, color_map
+    global schedule, segments, schedule_order, total_time, pool_columns
 
-    # Clear previous data and graphics
+    # Stop any running animation, clear previous data and graphics
+    stop_simulation()
     clear_tables_and_canvas()
 
     n = int(combo_box_numJob.get())
-    process_data = []
-
-    # 2) Generate randomized arrival and burst time max 30
-    for i in range(n):
-        pid = f"P{i+1}"
-        arrival = random.randint(0, 30)
-        burst = random.randint(1, 30)
-        process_data.append({
-            "id": pid,
-            "arrival": arrival,
-            "burst": burst,
-            "completion": 0,
-            "tat": 0,
-            "wt": 0
-        })
-
-    # SJF computation
-    time = 0
-    remaining = process_data.copy()
-    schedule_order = []
-    while remaining:
-        # Find all arrived processes at current time
-        arrived = [p for p in remaining if p["arrival"] <= time]
-        if not arrived:
-            # If none arrived, jump time to next arrival
-            time = min(p["arrival"] for p in remaining)
-            arrived = [p for p in remaining if p["arrival"] <= time]
-
-        # Select entity with smallest burst
-        current = min(arrived, key=lambda x: x["burst"])
-        schedule_order.append(current["id"])
-
-        # Compute its metrics
-        start = time
-        finish = time + current["burst"]
-        current["completion"] = finish
-        current["tat"] = finish - current["arrival"]
-        current["wt"] = current["tat"] - current["burst"]
-
-        # Advance time and remove from remaining
-        time = finish
-        remaining.remove(current)
-
-    total_time = time
-
-    # Fill the Pool table
-    process_data.sort(key=lambda x: int(x["id"][1:]))  # Sort by numeric part of ID
-
-    for r in range(len(process_data) + 1):
-        pool_table.grid_rowconfigure(r, weight=1)
-
-    # Insert header row
-    # Insert data rows starting at row=1
-    for i, pdata in enumerate(process_data, start=1):
-        # Create labels for each column with visible cell borders
-        lbl_id    = tk.Label(pool_table, text=pdata["id"],       bg="#FFFFFF", borderwidth=1, relief="solid")
-        lbl_arr   = tk.Label(pool_table, text=str(pdata["arrival"]), bg="#FFFFFF", borderwidth=1, relief="solid")
-        lbl_burst = tk.Label(pool_table, text=str(pdata["burst"]),   bg="#FFFFFF", borderwidth=1, relief="solid")
-        lbl_comp  = tk.Label(pool_table, text=str(pdata["completion"]), bg="#FFFFFF", borderwidth=1, relief="solid")
-        lbl_tat   = tk.Label(pool_table, text=str(pdata["tat"]),    bg="#FFFFFF", borderwidth=1, relief="solid")
-        lbl_wt    = tk.Label(pool_table, text=str(pdata["wt"]),    bg="#FFFFFF", borderwidth=1, relief="solid")
-
-        lbl_id.grid(row=i, column=0, sticky="nsew")
-        lbl_arr.grid(row=i, column=1, sticky="nsew")
-        lbl_burst.grid(row=i, column=2, sticky="nsew")
-        lbl_comp.grid(row=i, column=3, sticky="nsew")
-        lbl_tat.grid(row=i, column=4, sticky="nsew")
-        lbl_wt.grid(row=i, column=5, sticky="nsew")
-
-        pool_table_widgets.append((lbl_id, lbl_arr, lbl_burst, lbl_comp, lbl_tat, lbl_wt))
 
-    # 5) Compute average metrics and fill CPU table
-    avg_wt = sum(p["wt"] for p in process_data) / n
-    avg_tat = sum(p["tat"] for p in process_data) / n
+    # 2) Generate randomized arrival and burst time max 30 (columnar workload)
+    workload = generate_workload(n)
+
+    # Run the selected policy (heap-based SJF or event-driven SRTF);
+    # schedule_order lists one entry per (merged) Gantt segment
+    schedule = run_schedule(workload, combo_box_algorithm.get().lower())
+    segments = merge_segments(*schedule.segments)
+    schedule_order = labels(segments[0])
+    total_time = schedule.total_time
 
+    # Fill the Pool table (rows in job index order); only the visible
+    # window is rendered, by the recycled Treeview rows
+    pool_columns = [schedule.workload.arrival, schedule.workload.burst,
+                    schedule.completion, schedule.tat, schedule.wt]
+    scroll_pool_table(0)
+
+    # 5) Compute average metrics and fill CPU table
     value_job.config(text=str(n))
     value_time.config(text=str(total_time))
-    value_avg_wt.config(text=f"{avg_wt:.2f}")
-    value_avg_tat.config(text=f"{avg_tat:.2f}")
+    value_avg_wt.config(text=f"{schedule.avg_wt:.2f}")
+    value_avg_tat.config(text=f"{schedule.avg_tat:.2f}")
 
     # 6) Populate the Queue table with execution order as initial ready queue display
-    queue_label.config(text="Ready Queue: " + " → ".join(schedule_order))
-
-    # 7) Prepare colors for Gantt chart (each process gets a distinct color)
-    base_colors = ["#B22222", "#228B22", "#1E90FF", "#DAA520", "#8A2BE2"]
-    color_map = {f"P{i+1}": base_colors[i % len(base_colors)] for i in range(n)}
+    show_queue(0)
 
     # Enable Simulate button now that data is generated
-    simulate_btn.configure(state="normal")
+    simulate_btn.configure(text="Simulate", state="normal")
 
 
 
 # Run the simulation: animate Gantt chart drawing and update ready queue
 
+def prepare_draw_data():
+    """
+    Precompute everything each animation step needs (x-extents, color,
+    label, queue position) so a step is O(1) canvas work.
+    """
+    c_width = gantt_canvas.winfo_width()
+    if c_width <= 1:
+        c_width = 955  # fallback if not yet fully rendered
+    scale = c_width / total_time
+
+    # Reduce the timeline to at most ~2 blocks per canvas pixel: tiny adjacent
+    # segments are fused (drawn grey when they span several jobs)
+    seg_job, seg_start, seg_end, seg_first, seg_count = decimate(*segments, 0, total_time, c_width)
+
+    x0 = (seg_start * scale).tolist()
+    x1 = (seg_end * scale).tolist()
+    jobs = seg_job.tolist()
+    return {
+        "x0": x0,
+        "x1": x1,
+        "colors": [MIXED_COLOR if j == MIXED else BASE_COLORS[j % len(BASE_COLORS)] for j in jobs],
+        # Only label bars wide enough to hold the text
+        "texts": [label(j) if j != MIXED and r - l >= 24 else None for j, l, r in zip(jobs, x0, x1)],
+        # Index into schedule_order of the first entry still queued after each step
+        "queue_pos": (seg_first + seg_count).tolist(),
+    }
+
+
+def draw_step(i):
+    """Draw block i of draw_data onto the Gantt canvas."""
+    # Compute vertical centering inside the 80px-high canvas
+    canvas_height = gantt_canvas.winfo_height()
+    if canvas_height <= 1:
+        canvas_height = 80  # fallback if not yet fully rendered
+    bar_height = 50
+    y0 = (canvas_height - bar_height) / 2
+    y1 = y0 + bar_height
+
+    x0, x1 = draw_data["x0"][i], draw_data["x1"][i]
+    gantt_canvas.create_rectangle(x0, y0, x1, y1, fill=draw_data["colors"][i], outline="black")
+    text = draw_data["texts"][i]
+    if text:
+        gantt_canvas.create_text((x0 + x1) / 2, canvas_height / 2,
+                                 text=text, fill="white", font=("Arial", 12, "bold"))
+
+
+def show_queue(pos):
+    """Show the ready queue from schedule_order[pos:], capped at QUEUE_PREVIEW entries."""
+    upcoming = schedule_order[pos:pos + QUEUE_PREVIEW]
+    text = " → ".join(upcoming) if upcoming else "--"
+    hidden = len(schedule_order) - pos - len(upcoming)
+    if hidden > 0:
+        text += f" → … (+{hidden} more)"
+    queue_label.config(text="Ready Queue: " + text)
+
+
+def step_delay():
+    """Milliseconds between steps at the current speed (1x = 1500 ms)."""
+    return max(1, int(1500 / speed_slider.get()))
+
+
 def simulate():
+    global draw_data, step_index
+
+    if total_time == 0:
+        return
+
+    # Start from scratch unless resuming a paused run
+    if draw_data is None:
+        gantt_canvas.delete("all")
+        draw_data = prepare_draw_data()
+        step_index = 0
+
     simulate_btn.configure(state="disabled")
     pause_btn.configure(state="normal")
+    render_btn.configure(state="normal")
+    advance()
 
-    # Clear canvas if anything exists
-    gantt_canvas.delete("all")
 
-    # Compute scale factor so that all rectangles fit in canvas width
-    if total_time == 0:
+def advance():
+    """Draw the next step and schedule the one after it."""
+    global step_index, after_id
+    after_id = None
+    if step_index >= len(draw_data["x0"]):
+        finish_simulation()
         return
-    c_width = gantt_canvas.winfo_width()
-    scale = c_width / total_time
 
-    current_x = 0
-    delay = 1500  # milliseconds per unit burst
-
-    def draw_step(step_index):
-        nonlocal current_x
-        if step_index >= len(schedule_order):
-            # Finished drawing all steps
-            pause_btn.configure(state="disabled")
-            return
-
-        pid = schedule_order[step_index]
-        # Find this process's burst time
-        burst = next(p["burst"] for p in process_data if p["id"] == pid)
-        rect_width = burst * scale
-        x0 = current_x
-        x1 = current_x + rect_width
-
-        # Compute vertical centering inside the 80px-high canvas
-        canvas_height = gantt_canvas.winfo_height()
-        if canvas_height <= 1:
-            canvas_height = 80  # fallback if not yet fully rendered
-        bar_height = 50
-        y0 = (canvas_height - bar_height) / 2
-        y1 = y0 + bar_height
-
-        # Draw rectangle centered vertically
-        color = color_map[pid]
-        gantt_canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="black")
-        # Draw process ID text in the vertical center of that bar
-        gantt_canvas.create_text((x0 + x1) / 2, canvas_height / 2,
-                                 text=pid, fill="white", font=("Arial", 12, "bold"))
+    draw_step(step_index)
+    show_queue(draw_data["queue_pos"][step_index])
+    step_index += 1
+    after_id = root.after(step_delay(), advance)
 
-        # Update ready queue display: remove this pid from queue
-        remaining_queue = schedule_order[step_index + 1:]
-        queue_label.config(text="Ready Queue: " + " → ".join(remaining_queue if remaining_queue else ["--"]))
 
-        current_x = x1
+def render_to_end():
+    """Draw every remaining step in one batch and finish immediately."""
+    global step_index
+    cancel_pending_step()
+    steps = len(draw_data["x0"])
+    for i in range(step_index, steps):
+        draw_step(i)
+    if steps:
+        show_queue(draw_data["queue_pos"][-1])
+    step_index = steps
+    finish_simulation()
 
-        # Schedule next step
-        root.after(delay, lambda: draw_step(step_index + 1))
 
-    # Start drawing steps from index 0
-    draw_step(0)
+def finish_simulation():
+    global draw_data
+    draw_data = None
+    pause_btn.configure(state="disabled")
+    render_btn.configure(state="disabled")
+    simulate_btn.configure(text="Simulate", state="normal")
+
+
+def cancel_pending_step():
+    global after_id
+    if after_id is not None:
+        root.after_cancel(after_id)
+        after_id = None
 
 
 
-# Pause simulation (simply disables further animation)
+# Pause simulation (stops after the current step; Resume continues from there)
 
 def pause():
-    # Simply disable pause; since animation is sequential via after(), it won't progress further
+    cancel_pending_step()
     pause_btn.configure(state="disabled")
-    simulate_btn.configure(state="normal")
+    simulate_btn.configure(text="Resume", state="normal")
 
 
 
 # Reset all tables and Gantt chart
 
 def reset():
-    global process_data, schedule_order, total_time
-    process_data = []
+    global schedule, segments, schedule_order, total_time
+    schedule = None
+    segments = None
     schedule_order = []
     total_time = 0
+    stop_simulation()
     clear_tables_and_canvas()
     combo_box_numJob.set("4")
+    combo_box_algorithm.set("SJF")
     numJob.config(text="Number of Jobs: ")
-    simulate_btn.configure(state="disabled")
+    simulate_btn.configure(text="Simulate", state="disabled")
+    pause_btn.configure(state="disabled")
+
+
+
+# Pool table: recycled rows over a scrollable viewport
+
+def scroll_pool_table(offset):
+    """Show jobs [offset, offset + POOL_VISIBLE_ROWS) in the recycled Treeview rows."""
+    global pool_offset
+    n = len(pool_columns[0]) if pool_columns else 0
+    pool_offset = max(0, min(offset, n - POOL_VISIBLE_ROWS))
+
+    window = [col[pool_offset:pool_offset + POOL_VISIBLE_ROWS].tolist() for col in pool_columns]
+    for k, item in enumerate(pool_rows):
+        i = pool_offset + k
+        values = [label(i)] + [col[k] for col in window] if i < n else [""] * len(headers)
+        pool_tree.item(item, values=values, tags=("odd",) if i % 2 else ())
+
+    if n > POOL_VISIBLE_ROWS:
+        pool_scrollbar.set(pool_offset / n, (pool_offset + POOL_VISIBLE_ROWS) / n)
+    else:
+        pool_scrollbar.set(0, 1)
+
+
+def on_pool_scrollbar(action, amount, unit=None):
+    n = len(pool_columns[0]) if pool_columns else 0
+    if action == "moveto":
+        scroll_pool_table(int(float(amount) * n))
+    elif action == "scroll":
+        step = POOL_VISIBLE_ROWS if unit == "pages" else 1
+        scroll_pool_table(pool_offset + int(amount) * step)
+
+
+def on_pool_wheel(event):
+    if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+        scroll_pool_table(pool_offset - 3)
+    else:
+        scroll_pool_table(pool_offset + 3)
+    return "break"
+
+
+
+# Helper: Stop any animation in progress
+
+def stop_simulation():
+    global draw_data
+    cancel_pending_step()
+    draw_data = None
     pause_btn.configure(state="disabled")
+    render_btn.configure(state="disabled")
 
 
 
 # Helper: Clear Pool, CPU, Queue tables, and Gantt canvas
 
 def clear_tables_and_canvas():
+    global pool_columns
     # Clear Pool table data rows
-    for widgets in pool_table_widgets:
-        for w in widgets:
-            w.destroy()
-    pool_table_widgets.clear()
+    pool_columns = []
+    scroll_pool_table(0)
 
     # Reset CPU values
     value_job.config(text="0")
@@ -242,7 +309,7 @@ numJob.place(x=100, y=550)
 
 combo_box_numJob = ctk.CTkComboBox(
     master=root,
-    values=["4", "5"],
+    values=["4", "5", "10", "100", "1000", "10000", "100000"],
     width=100,
     height=30,
     corner_radius=8,
@@ -258,6 +325,27 @@ combo_box_numJob.place(x=100, y=575)
 combo_box_numJob.set("4")
 combo_box_numJob.configure(command=job)
 
+# Scheduling algorithm label and combo box
+algorithm_label = tk.Label(root, text="Algorithm: ")
+algorithm_label.place(x=250, y=550)
+
+combo_box_algorithm = ctk.CTkComboBox(
+    master=root,
+    values=[name.upper() for name in ALGORITHMS],
+    width=100,
+    height=30,
+    corner_radius=8,
+    fg_color="#F0F0F0",
+    button_color="#028174",
+    button_hover_color="#026F64",
+    text_color="#000000",
+    dropdown_fg_color="#92DE8B",
+    dropdown_hover_color="#0AB68B",
+    dropdown_text_color="#FFFFFF"
+)
+combo_box_algorithm.place(x=250, y=575)
+combo_box_algorithm.set("SJF")
+
 
 # Pool Table (Process Data)
 
@@ -267,16 +355,32 @@ poolFrame.place(x=10, y=50)
 pool_table = ctk.CTkFrame(poolFrame, width=955, height=230, corner_radius=15, fg_color="#FFFFFF")
 pool_table.pack(padx=10, pady=10)
 pool_table.grid_propagate(False)
+pool_table.grid_columnconfigure(0, weight=1)
+pool_table.grid_rowconfigure(0, weight=1)
 
-# Configure 6 columns (Process #, Arrival, Burst, Completion, Turnaround, Wait)
-for col in range(6):
-    pool_table.grid_columnconfigure(col, weight=1)
-
-# Header row
+# Virtualized table: a fixed set of POOL_VISIBLE_ROWS Treeview rows is
+# recycled as the scrollbar moves, so the widget count never depends on n.
+# Columns: Process #, Arrival, Burst, Completion, Turnaround, Wait
+POOL_VISIBLE_ROWS = 9
 headers = ["Process #", "Arrival Time", "Burst Time", "Completion Time", "Turnaround Time", "Wait Time"]
-for idx, text in enumerate(headers):
-    lbl = tk.Label(pool_table, text=text, bg="#FFFFFF", font=("Arial", 10, "bold"))
-    lbl.grid(row=0, column=idx, padx=5, pady=5, sticky="nsew")
+
+ttk.Style().configure("Pool.Treeview.Heading", font=("Arial", 10, "bold"))
+pool_tree = ttk.Treeview(pool_table, columns=headers, show="headings", height=POOL_VISIBLE_ROWS,
+                         style="Pool.Treeview", selectmode="none")
+for text in headers:
+    pool_tree.heading(text, text=text)
+    pool_tree.column(text, anchor="center", width=150)
+pool_tree.tag_configure("odd", background="#F9F9F9")
+pool_tree.grid(row=0, column=0, padx=(10, 0), pady=10, sticky="nsew")
+
+pool_scrollbar = ttk.Scrollbar(pool_table, orient="vertical", command=on_pool_scrollbar)
+pool_scrollbar.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="ns")
+
+pool_rows = [pool_tree.insert("", "end", values=[""] * len(headers)) for _ in range(POOL_VISIBLE_ROWS)]
+
+pool_tree.bind("<MouseWheel>", on_pool_wheel)
+pool_tree.bind("<Button-4>", on_pool_wheel)
+pool_tree.bind("<Button-5>", on_pool_wheel)
 
 
 # Gantt Chart Frame
@@ -342,22 +446,43 @@ queue_label = tk.Label(queue_table, text="Ready Queue: ", bg="#FFFFFF", font=("A
 queue_label.place(relx=0.5, rely=0.5, anchor="center")
 
 
-# Buttons: Simulate, Generate Data, Pause, Reset
+# Animation speed slider (1x = 1500 ms per step)
+
+speed_label = tk.Label(root, text="Speed: 1x")
+speed_label.place(x=420, y=550)
+
+speed_slider = ctk.CTkSlider(
+    master=root,
+    from_=1,
+    to=100,
+    number_of_steps=99,
+    width=200,
+    button_color="#028174",
+    button_hover_color="#026F64",
+    command=lambda value: speed_label.config(text=f"Speed: {int(value)}x"),
+)
+speed_slider.place(x=420, y=580)
+speed_slider.set(1)
+
+
+# Buttons: Simulate, Generate Data, Pause, Render to End, Reset
 
 button_frame = ctk.CTkFrame(root, fg_color="transparent")
-button_frame.place(x=200, y=625)
+button_frame.place(x=130, y=625)
 
-for i in range(4):
+for i in range(5):
     button_frame.grid_columnconfigure(i, weight=1)
 
 simulate_btn = ctk.CTkButton(button_frame, text="Simulate", command=simulate, state="disabled")
 generate_btn = ctk.CTkButton(button_frame, text="Generate Data", command=generate_data)
 pause_btn    = ctk.CTkButton(button_frame, text="Pause", command=pause, state="disabled")
+render_btn   = ctk.CTkButton(button_frame, text="Render to End", command=render_to_end, state="disabled")
 reset_btn    = ctk.CTkButton(button_frame, text="Reset", command=reset)
 
 simulate_btn.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
 generate_btn.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
 pause_btn.grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
-reset_btn.grid(row=0, column=3, padx=5, pady=5, sticky="nsew")
+render_btn.grid(row=0, column=3, padx=5, pady=5, sticky="nsew")
+reset_btn.grid(row=0, column=4, padx=5, pady=5, sticky="nsew")
 
 root.mainloop()
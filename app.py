@@ -1,99 +1,150 @@
 # app.py
 
-import random
-import pandas as pd
-from dash import Dash, html, dcc, dash_table, Input, Output, State
-import plotly.express as px
+import base64
+import os
+import re
+import secrets
+import time
+import numpy as np
+from dash import Dash, html, dcc, dash_table, ctx, Input, Output, State, no_update
+from flask import Response, g, request
+
+from scheduler import (
+    ALGORITHMS, ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS, ResultCache, compare, generate_workload, label, labels,
+    ESTIMATORS, bucket_table, evaluate_prediction, fairness_report, generate_history, run_schedule, schedule_multicore,
+    Schedule, Workload,
+)
+from scheduler.export import export_results, import_schedule
+from scheduler.incremental import POLICIES as EDITABLE_POLICIES, IncrementalScheduler
+from scheduler.predict import DEFAULT_ALPHA
+from scheduler.profiling import Stats, record_schedule
+from scheduler.render import MIXED, decimate, merge_segments
+from scheduler.runs import RunManager
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 1) SJF Logic (core computation)
 # ──────────────────────────────────────────────────────────────────────────────
-def compute_sjf(n):
+def compute_sjf(n, seed=None, arrival="uniform", burst="uniform", algorithm="sjf", progress=None,
+                cores=1, queue="global", steal=False, estimator=None, alpha=DEFAULT_ALPHA, profile=None, **params):
     """
-    Generates n processes with random arrival (0–30) and burst (1–30),
-    then runs non-preemptive SJF and returns a DataFrame with columns:
-      ['id', 'arrival', 'burst', 'start', 'completion', 'tat', 'wt']
+    Generates n processes from the given arrival process and burst
+    distribution (default: arrival 0–30 and burst 1–30, uniform), seeded by
+    `seed`, then runs non-preemptive SJF (or any other policy in ALGORITHMS,
+    with policy parameters such as quantum= or aging= passed through) and
+    returns the per-job table as a dict of arrays in ID order, with keys:
+      ['id', 'arrival', 'burst', 'start', 'completion', 'tat', 'wt', 'response']
     plus:
-      - schedule_order: list of IDs in execution order
+      - schedule_order: list of IDs in (first) execution order
       - total_time: final completion time
       - avg_wt, avg_tat
+      - segments: Gantt timeline as (job, start, end) int32 arrays in time order
+      - extras: dict with 'prediction' (see below), empty otherwise
+    With cores > 1 (or a per-core queue) the jobs run on that many CPUs and
+    `segments` is a list with one such timeline per core.
+    With an `estimator` from ESTIMATORS, SJF orders jobs by bursts predicted
+    from a generated history instead of the actual ones, and the prediction
+    error and WT/TAT degradation vs oracle SJF are returned as
+    extras['prediction'].
+    `progress(done, total)` is forwarded to the scheduling engine; `profile`
+    (a profiling.Stats) receives per-stage timings and scheduler counters.
     """
-    # 1) Generate random processes
-    processes = []
-    for i in range(n):
-        pid = f"P{i+1}"
-        arrival = random.randint(0, 30)
-        burst = random.randint(1, 30)
-        processes.append({
-            "id": pid,
-            "arrival": arrival,
-            "burst": burst,
-            "start": None,
-            "completion": None,
-            "tat": None,
-            "wt": None
-        })
-
-    # 2) SJF scheduling
-    time = 0
-    remaining = processes.copy()
-    schedule_order = []
-
-    while remaining:
-        # a) Find all arrived processes at current time
-        arrived = [p for p in remaining if p["arrival"] <= time]
-        if not arrived:
-            # No one has arrived yet → jump to earliest arrival
-            time = min(p["arrival"] for p in remaining)
-            arrived = [p for p in remaining if p["arrival"] <= time]
+    profile = profile or Stats(enabled=False)
 
-        # b) Pick the one with smallest burst
-        current = min(arrived, key=lambda x: x["burst"])
-        schedule_order.append(current["id"])
+    # 1) Generate random processes (columnar, vectorized, reproducible by seed)
+    with profile.stage("generate"):
+        workload = generate_workload(n, seed, arrival, burst)
 
-        # c) Compute start, completion, tat, wt
-        current["start"] = time
-        finish = time + current["burst"]
-        current["completion"] = finish
-        current["tat"] = current["completion"] - current["arrival"]
-        current["wt"] = current["tat"] - current["burst"]
+    # 2) Scheduling (heap-based SJF, event-driven SRTF, RR, ... or m cores)
+    extras = {}
+    if cores > 1 or queue != "global" or steal:
+        with profile.stage("schedule"):
+            schedule = schedule_multicore(workload, cores, queue, steal, algorithm, progress)
+        record_schedule(profile, schedule)
+        segments = [schedule.timeline(c) for c in range(cores)]
+    elif estimator:
+        if algorithm != "sjf":
+            raise ValueError("burst prediction applies to SJF only")
+        with profile.stage("predict"):
+            history = generate_history(workload, seed=None if seed is None else [seed, 1])
+            schedule, extras["prediction"] = evaluate_prediction(
+                workload, history, estimator, progress, **({"alpha": alpha} if estimator == "exponential" else {})
+            )
+        record_schedule(profile, schedule)
+        segments = schedule.segments
+    else:
+        schedule = run_schedule(workload, algorithm, progress, profile, **params)
+        segments = schedule.segments
+    schedule_order = labels(schedule.order)
 
-        # d) Advance time and remove from pool
-        time = finish
-        remaining.remove(current)
+    # 3) The table is the result arrays themselves (no copies, no pandas)
+    table = schedule.columns()
 
-    total_time = time
-
-    # 3) Build a DataFrame sorted by numeric ID (for consistent display order)
-    df = pd.DataFrame(processes).sort_values(key=lambda col: col["id"].apply(lambda s: int(s[1:])))
-    avg_wt = df["wt"].mean()
-    avg_tat = df["tat"].mean()
-
-    return df, schedule_order, total_time, avg_wt, avg_tat
+    return table, schedule_order, schedule.total_time, schedule.avg_wt, schedule.avg_tat, segments, extras
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 2) Dash App Layout
 # ──────────────────────────────────────────────────────────────────────────────
+JOB_COUNTS = (4, 5, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+MAX_UPLOAD_BYTES = 256 * 2**20  # results files reopened through the browser
+
+# Set SJF_PROFILE=1 to time every stage of a run, show the debug panel and
+# fill the /metrics endpoint; when unset, the instrumentation is a no-op.
+PROFILE = bool(os.environ.get("SJF_PROFILE"))
+profile_stats = Stats(enabled=PROFILE)
+
 app = Dash(__name__)
-server = app.server  # expose the Flask server if you want to deploy on Gunicorn
+server = app.server  # expose the Flask server for Gunicorn: one worker, --threads (see gunicorn.conf.py)
 
 app.layout = html.Div(
     style={"fontFamily": "Arial, sans-serif", "padding": "20px"},
     children=[
         html.H2("SJF Simulator (Web Version)", style={"textAlign": "center"}),
 
-        # ------- Number of Jobs Dropdown and Button -------
+        # ------- Algorithm, Number of Jobs Dropdowns and Button -------
         html.Div(
             style={"display": "flex", "alignItems": "center", "marginBottom": "20px"},
             children=[
+                html.Label("Algorithm:", style={"marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Dropdown(
+                    id="algorithm-dropdown",
+                    options=[{"label": name.upper(), "value": name} for name in ALGORITHMS],
+                    value="sjf",
+                    clearable=False,
+                    style={"width": "120px", "marginRight": "20px"}
+                ),
                 html.Label("Number of Jobs:", style={"marginRight": "10px", "fontWeight": "bold"}),
                 dcc.Dropdown(
                     id="num-job-dropdown",
-                    options=[{"label": str(i), "value": i} for i in (4, 5)],
+                    options=[{"label": f"{i:,}", "value": i} for i in JOB_COUNTS],
                     value=4,
                     clearable=False,
-                    style={"width": "80px"}
+                    style={"width": "110px"}
+                ),
+                html.Label("Arrivals:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Dropdown(
+                    id="arrival-dropdown",
+                    options=[{"label": name.capitalize(), "value": name} for name in ARRIVAL_PROCESSES],
+                    value="uniform",
+                    clearable=False,
+                    style={"width": "120px"}
+                ),
+                html.Label("Bursts:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Dropdown(
+                    id="burst-dropdown",
+                    options=[{"label": name.capitalize(), "value": name} for name in BURST_DISTRIBUTIONS],
+                    value="uniform",
+                    clearable=False,
+                    style={"width": "130px"}
+                ),
+                html.Label("Seed:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Input(
+                    id="seed-input",
+                    type="number",
+                    placeholder="random",
+                    min=0,
+                    step=1,
+                    style={"width": "90px"}
                 ),
                 html.Button(
                     "Generate Data",
@@ -101,26 +152,178 @@ app.layout = html.Div(
                     n_clicks=0,
                     style={"marginLeft": "20px", "padding": "6px 12px"}
                 ),
+                html.Button(
+                    "Cancel",
+                    id="cancel-button",
+                    n_clicks=0,
+                    style={"marginLeft": "10px", "padding": "6px 12px"}
+                ),
+                html.Span(id="run-status", style={"marginLeft": "20px", "color": "#555555"}),
+            ]
+        ),
+
+        # ------- Policy Parameters, CPU Cores and Comparison Button -------
+        html.Div(
+            style={"display": "flex", "alignItems": "center", "marginBottom": "20px"},
+            children=[
+                html.Label("RR Quantum:", style={"marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Input(
+                    id="quantum-input",
+                    type="number",
+                    value=4,
+                    min=1,
+                    step=1,
+                    style={"width": "70px"}
+                ),
+                html.Label("Priority Aging:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Input(
+                    id="aging-input",
+                    type="number",
+                    value=0.1,
+                    min=0,
+                    step=0.05,
+                    style={"width": "70px"}
+                ),
+                html.Button(
+                    "Compare Policies",
+                    id="compare-button",
+                    n_clicks=0,
+                    style={"marginLeft": "20px", "padding": "6px 12px"}
+                ),
+                html.Label("CPU Cores:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Input(
+                    id="cores-input",
+                    type="number",
+                    value=1,
+                    min=1,
+                    max=256,
+                    step=1,
+                    style={"width": "70px"}
+                ),
+                html.Label("Ready Queue:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Dropdown(
+                    id="queue-dropdown",
+                    options=[
+                        {"label": "Global", "value": "global"},
+                        {"label": "Per-core", "value": "per-core"},
+                        {"label": "Per-core + stealing", "value": "per-core+steal"},
+                    ],
+                    value="global",
+                    clearable=False,
+                    style={"width": "190px"}
+                ),
+                html.Label("Burst Knowledge:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Dropdown(
+                    id="predict-dropdown",
+                    options=[{"label": "Exact (oracle)", "value": "oracle"}] + [
+                        {"label": f"Predicted ({name})", "value": name} for name in ESTIMATORS
+                    ],
+                    value="oracle",
+                    clearable=False,
+                    style={"width": "200px"}
+                ),
+                html.Label("α:", style={"marginLeft": "10px", "marginRight": "10px", "fontWeight": "bold"}),
+                dcc.Input(
+                    id="alpha-input",
+                    type="number",
+                    value=DEFAULT_ALPHA,
+                    min=0,
+                    max=1,
+                    step=0.05,
+                    style={"width": "70px"}
+                ),
+                html.Span(id="compare-status", style={"marginLeft": "20px", "color": "#555555"}),
             ]
         ),
 
+        # ------- Debug: per-stage timings (only shown with SJF_PROFILE set) -------
+        html.Div(
+            id="debug-panel",
+            style={"border": "2px dashed #888888", "borderRadius": "8px", "padding": "10px", "marginBottom": "20px",
+                   "display": "block" if PROFILE else "none"},
+            children=[
+                html.H4("Debug: Stage Timings & Counters", style={"marginTop": "0"}),
+                html.Pre(id="debug-stats", style={"margin": "0", "fontSize": "13px"}),
+                html.A("Prometheus metrics", href="/metrics", target="_blank", style={"fontSize": "13px"}),
+            ]
+        ),
+
+        # ------- Background run tracking -------
+        dcc.Store(id="run-store"),
+        dcc.Interval(id="run-poll", interval=500, disabled=True),
+        dcc.Store(id="compare-store"),
+        dcc.Interval(id="compare-poll", interval=500, disabled=True),
+
         # ------- Pool Table Section -------
         html.Div(
             style={"border": "2px solid #028174", "borderRadius": "8px", "padding": "10px", "backgroundColor": "#FFFFFF", "marginBottom": "20px"},
             children=[
                 html.H4("Pool Table (Process Data)", style={"marginTop": "0"}),
+                # Editing (SJF / FCFS on one core): change an arrival or burst
+                # in place, delete a row, or add a job; only the part of the
+                # schedule from the earliest affected time is recomputed.
+                html.Div(
+                    style={"display": "flex", "alignItems": "center", "marginBottom": "10px"},
+                    children=[
+                        html.Label("Arrival:", style={"marginRight": "10px", "fontWeight": "bold"}),
+                        dcc.Input(id="new-arrival-input", type="number", value=0, min=0, step=1, style={"width": "80px"}),
+                        html.Label("Burst:", style={"marginLeft": "20px", "marginRight": "10px", "fontWeight": "bold"}),
+                        dcc.Input(id="new-burst-input", type="number", value=5, min=1, step=1, style={"width": "80px"}),
+                        html.Button(
+                            "Add Job",
+                            id="add-job-button",
+                            n_clicks=0,
+                            style={"marginLeft": "20px", "padding": "6px 12px"}
+                        ),
+                        html.Span(id="edit-status", style={"marginLeft": "20px", "color": "#555555"}),
+                        # Export / reopen results (Parquet or Arrow IPC, zstd-compressed)
+                        html.Button(
+                            "Export Parquet",
+                            id="export-parquet-button",
+                            n_clicks=0,
+                            style={"marginLeft": "auto", "padding": "6px 12px"}
+                        ),
+                        html.Button(
+                            "Export Arrow",
+                            id="export-arrow-button",
+                            n_clicks=0,
+                            style={"marginLeft": "10px", "padding": "6px 12px"}
+                        ),
+                        dcc.Upload(
+                            id="import-upload",
+                            children=html.Button("Open Results File", style={"padding": "6px 12px"}),
+                            accept=".parquet,.pq,.arrow,.feather,.ipc",
+                            max_size=MAX_UPLOAD_BYTES,
+                            style={"marginLeft": "10px"}
+                        ),
+                        dcc.Download(id="export-download"),
+                    ]
+                ),
                 dash_table.DataTable(
                     id="pool-table",
                     columns=[
                         {"name": "Process #",      "id": "id"},
-                        {"name": "Arrival Time",   "id": "arrival"},
-                        {"name": "Burst Time",     "id": "burst"},
+                        {"name": "Arrival Time",   "id": "arrival", "type": "numeric", "editable": True},
+                        {"name": "Burst Time",     "id": "burst", "type": "numeric", "editable": True},
                         {"name": "Start Time",     "id": "start"},
                         {"name": "Completion Time","id": "completion"},
                         {"name": "Turnaround Time","id": "tat"},
                         {"name": "Wait Time",      "id": "wt"},
+                        {"name": "Response Time",  "id": "response"},
                     ],
                     data=[],
+                    # Paging, sorting and filtering run server-side against the
+                    # cached result; only the visible page is sent to the browser.
+                    page_action="custom",
+                    page_current=0,
+                    page_count=0,
+                    sort_action="custom",
+                    sort_mode="single",
+                    sort_by=[],
+                    filter_action="custom",
+                    filter_query="",
+                    editable=False,
+                    row_deletable=True,
                     style_cell={"textAlign": "center", "padding": "6px"},
                     style_header={
                         "backgroundColor": "#028174",
@@ -132,7 +335,8 @@ app.layout = html.Div(
                     ],
                     style_table={"overflowX": "auto"},
                     page_size=10,
-                )
+                ),
+                html.Div(id="filter-status", style={"marginTop": "6px", "color": "#B00020"}),
             ]
         ),
 
@@ -159,12 +363,74 @@ app.layout = html.Div(
 
         # ------- Gantt Chart -------
         html.Div(
-            style={"border": "2px solid #028174", "borderRadius": "8px", "padding": "10px", "backgroundColor": "#FFFFFF"},
+            style={"border": "2px solid #028174", "borderRadius": "8px", "padding": "10px", "backgroundColor": "#FFFFFF", "marginBottom": "20px"},
             children=[
                 html.H4("Gantt Chart", style={"marginTop": "0"}),
                 dcc.Graph(id="gantt-chart", config={"displayModeBar": False})
             ]
         ),
+
+        # ------- Tail Latency & Fairness by Burst Size -------
+        html.Div(
+            style={"border": "2px solid #028174", "borderRadius": "8px", "padding": "10px", "backgroundColor": "#FFFFFF", "marginBottom": "20px"},
+            children=[
+                html.H4("Tail Latency by Burst Size", style={"marginTop": "0"}),
+                dash_table.DataTable(
+                    id="tail-table",
+                    columns=[
+                        {"name": "Burst",            "id": "bucket"},
+                        {"name": "Jobs",             "id": "jobs"},
+                        {"name": "WT p50",           "id": "wt_p50"},
+                        {"name": "WT p95",           "id": "wt_p95"},
+                        {"name": "WT p99",           "id": "wt_p99"},
+                        {"name": "WT max",           "id": "wt_max"},
+                        {"name": "Response p99",     "id": "response_p99"},
+                        {"name": "Slowdown p50",     "id": "slowdown_p50"},
+                        {"name": "Slowdown p99",     "id": "slowdown_p99"},
+                        {"name": "Slowdown max",     "id": "slowdown_max"},
+                    ],
+                    data=[],
+                    style_cell={"textAlign": "center", "padding": "6px"},
+                    style_header={
+                        "backgroundColor": "#028174",
+                        "fontWeight": "bold",
+                        "color": "white"
+                    },
+                    style_data_conditional=[
+                        {"if": {"row_index": "odd"}, "backgroundColor": "#F9F9F9"},
+                    ],
+                )
+            ]
+        ),
+
+        # ------- Policy Comparison -------
+        html.Div(
+            style={"border": "2px solid #028174", "borderRadius": "8px", "padding": "10px", "backgroundColor": "#FFFFFF"},
+            children=[
+                html.H4("Policy Comparison (same workload)", style={"marginTop": "0"}),
+                dash_table.DataTable(
+                    id="compare-table",
+                    columns=[
+                        {"name": "Algorithm",            "id": "algorithm"},
+                        {"name": "Total Time",           "id": "total_time"},
+                        {"name": "Avg Wait Time",        "id": "avg_wt"},
+                        {"name": "Avg Turnaround Time",  "id": "avg_tat"},
+                        {"name": "Avg Response Time",    "id": "avg_response"},
+                        {"name": "Throughput (jobs/unit)", "id": "throughput"},
+                    ],
+                    data=[],
+                    style_cell={"textAlign": "center", "padding": "6px"},
+                    style_header={
+                        "backgroundColor": "#028174",
+                        "fontWeight": "bold",
+                        "color": "white"
+                    },
+                    style_data_conditional=[
+                        {"if": {"row_index": "odd"}, "backgroundColor": "#F9F9F9"},
+                    ],
+                )
+            ]
+        ),
     ]
 )
 
@@ -172,69 +438,835 @@ app.layout = html.Div(
 # ──────────────────────────────────────────────────────────────────────────────
 # 3) Callbacks
 # ──────────────────────────────────────────────────────────────────────────────
+# Computed runs, keyed by (algorithm, seed, job count, arrival, burst, policy
+# or multi-core parameters). Shared by every user of this worker process; bounded in size
+# and age, and by the bytes of the arrays each run holds (a 1M-job run is ~46 MiB when
+# stored). Runs grow in place (table view memo, editor), so callbacks that extend
+# one re-measure it with run_manager.recharge.
+RESULT_CACHE_BYTES = 512 * 2**20
+result_cache = ResultCache(maxsize=64, ttl=600, maxbytes=RESULT_CACHE_BYTES)
+
+# Runs execute on a background pool so a large simulation never blocks the
+# request thread; the browser polls for progress via dcc.Interval. Run state
+# is per process, so polls must reach the process that started the run:
+# serve with a single Gunicorn worker and --threads (gunicorn.conf.py refuses
+# to start with more workers).
+run_manager = RunManager(max_workers=2, cache=result_cache)
+
+
 @app.callback(
     [
-        Output("pool-table", "data"),
+        Output("run-store", "data"),
+        Output("run-poll", "disabled"),
+    ],
+    [Input("generate-button", "n_clicks")],
+    [
+        State("num-job-dropdown", "value"),
+        State("arrival-dropdown", "value"),
+        State("burst-dropdown", "value"),
+        State("seed-input", "value"),
+        State("algorithm-dropdown", "value"),
+        State("quantum-input", "value"),
+        State("aging-input", "value"),
+        State("cores-input", "value"),
+        State("queue-dropdown", "value"),
+        State("predict-dropdown", "value"),
+        State("alpha-input", "value"),
+    ]
+)
+def start_simulation(n_clicks, num_jobs, arrival="uniform", burst="uniform", seed=None, algorithm="sjf",
+                     quantum=4, aging=0.1, cores=1, queue="global", predict="oracle", alpha=DEFAULT_ALPHA):
+    """
+    Whenever the 'Generate Data' button is clicked, submit a run for the
+    selected algorithm and start polling it. A blank seed gives a fresh
+    random workload; a fixed seed reproduces the same run and is served from
+    the result cache.
+    """
+    if n_clicks is None or num_jobs is None:
+        return None, True
+
+    if seed is None:
+        seed = secrets.randbelow(2**32)
+    params = policy_params(algorithm, quantum, aging)
+    queue, _, steal = (queue or "global").partition("+")
+    cores = max(1, int(cores or 1))
+    if cores > 1 or queue != "global":
+        params = {"cores": cores, "queue": queue, "steal": bool(steal)}
+    elif predict and predict != "oracle":
+        alpha = DEFAULT_ALPHA if alpha is None else min(1.0, max(0.0, float(alpha)))
+        params = {"estimator": predict, "alpha": alpha}
+    key = (algorithm, seed, num_jobs, arrival, burst, tuple(sorted(params.items())))
+    run_id = run_manager.submit(
+        key, lambda progress: build_run(num_jobs, seed, arrival, burst, algorithm, progress, **params)
+    )
+    return {"run_id": run_id, "seed": seed}, False
+
+
+def policy_params(algorithm, quantum, aging):
+    """Returns the parameters the selected policy takes (blank inputs fall back to defaults)."""
+    if algorithm == "rr":
+        return {"quantum": max(1, int(quantum or 4))}
+    if algorithm == "priority":
+        return {"aging": max(0.0, float(aging if aging is not None else 0.1))}
+    return {}
+
+
+@app.callback(
+    Output("run-status", "children"),
+    [Input("cancel-button", "n_clicks")],
+    [State("run-store", "data")],
+    prevent_initial_call=True,
+)
+def cancel_simulation(n_clicks, run_info):
+    """Requests cancellation of the run currently being polled."""
+    if run_info and run_manager.cancel(run_info["run_id"]):
+        return "Cancelling…"
+    return no_update
+
+
+@app.callback(
+    [
+        Output("pool-table", "page_current"),
         Output("cpu-stats", "children"),
         Output("ready-queue", "children"),
         Output("gantt-chart", "figure"),
+        Output("run-poll", "disabled", allow_duplicate=True),
+        Output("run-status", "children", allow_duplicate=True),
+        Output("tail-table", "data"),
+        Output("debug-stats", "children"),
     ],
-    [Input("generate-button", "n_clicks")],
-    [State("num-job-dropdown", "value")]
+    [
+        Input("run-store", "data"),
+        Input("run-poll", "n_intervals"),
+    ],
+    prevent_initial_call=True,
 )
-def update_simulation(n_clicks, num_jobs):
+def update_simulation(run_info, n_intervals=None):
     """
-    Whenever the 'Generate Data' button is clicked, regenerate random SJF data—
-    recompute the tables, stats, queue, and Gantt chart.
+    Polls the submitted run: reports progress while it is queued or running,
+    and once it is done fills the tables, stats (with tails and fairness),
+    queue, and Gantt chart.
     """
-    if n_clicks is None or num_jobs is None:
+    if not run_info:
         # Initial empty state
-        return [], "", "", {}
+        return 0, "", "", {}, True, "", [], ""
 
-    # 1) Compute SJF for 'num_jobs' processes
-    df, schedule_order, total_time, avg_wt, avg_tat = compute_sjf(num_jobs)
+    status = run_manager.status(run_info["run_id"])
+    if status is None:
+        return no_update, no_update, no_update, no_update, True, "Run expired — generate again.", no_update, no_update
+    if status["state"] in ("queued", "running"):
+        return no_update, no_update, no_update, no_update, False, f"Running… {status['progress']:.0%}", no_update, no_update
+    if status["state"] != "done":
+        message = "Cancelled." if status["state"] == "cancelled" else f"Failed: {status['error']}"
+        return no_update, no_update, no_update, no_update, True, message, no_update, no_update
 
-    # 2) Pool table data (include all columns)
-    pool_data = df.to_dict("records")
+    run = run_manager.result(run_info["run_id"])
+    if run is None:  # evicted from the result cache since it finished
+        return no_update, no_update, no_update, no_update, True, "Run expired — generate again.", no_update, no_update
 
-    # 3) CPU stats (N, total_time, avg_wt, avg_tat)
+    # CPU stats (N, total_time, avg_wt, avg_tat, tails, fairness, seed)
+    stats = run["stats"]
+    fair = stats["fairness"]
     cpu_stats_children = [
-        html.P(f"Number of Jobs: {num_jobs}"),
-        html.P(f"Total Completion Time: {total_time}"),
-        html.P(f"Average Waiting Time: {avg_wt:.2f}"),
-        html.P(f"Average Turnaround Time: {avg_tat:.2f}"),
+        html.P(f"Number of Jobs: {stats['jobs']}"),
+        html.P(f"Total Completion Time: {stats['total_time']}"),
+        html.P(f"Average Waiting Time: {stats['avg_wt']:.2f}"),
+        html.P(f"Average Turnaround Time: {stats['avg_tat']:.2f}"),
+        html.P(f"Waiting Time p50 / p95 / p99 / max: {fair['wt_p50']:.0f} / {fair['wt_p95']:.0f} / "
+               f"{fair['wt_p99']:.0f} / {fair['wt_max']:.0f}"),
+        html.P(f"Slowdown p99: {fair['slowdown_p99']:.1f} · Jain's Index: {fair['jain_slowdown']:.3f}"),
+        html.P(f"Starved Jobs (wait > {fair['starvation_threshold']:.0f}): {fair['starved']:,} "
+               f"({fair['starved_fraction']:.1%})"),
+        *core_stats(stats),
+        *prediction_stats(stats),
+        *edit_stats(stats),
+        html.P(f"Seed: {run_info['seed']}", style={"color": "#888888", "fontSize": "13px"}),
     ]
 
-    # 4) Ready queue display (just show the schedule order)
-    ready_queue_str = " → ".join(schedule_order)
-
-    # 5) Build Gantt chart via Plotly Express timeline
-    #    We use columns "start" and "completion" from df:
-    gantt_df = df.copy()
-    gantt_df["finish"] = gantt_df["completion"]
-
-    fig = px.timeline(
-        gantt_df,
-        x_start="start",
-        x_end="finish",
-        y="id",
-        color="id",
-        color_discrete_sequence=px.colors.qualitative.Pastel,
-        title="",
+    # Tie the chart's zoom state to this run so a new run resets it
+    figure = {**run["figure"], "layout": {**run["figure"]["layout"], "uirevision": run_info["run_id"]}}
+
+    # Setting the page (0 for a new run, the current one after an edit) makes
+    # update_pool_table fetch it
+    return run_info.get("page", 0), cpu_stats_children, run["ready_queue"], figure, True, "", run["buckets"], profile_text(run["profile"])
+
+
+@app.callback(
+    [
+        Output("pool-table", "data"),
+        Output("pool-table", "page_count"),
+        Output("filter-status", "children"),
+    ],
+    [
+        Input("pool-table", "page_current"),
+        Input("pool-table", "page_size"),
+        Input("pool-table", "sort_by"),
+        Input("pool-table", "filter_query"),
+    ],
+    [State("run-store", "data")],
+)
+def update_pool_table(page_current, page_size, sort_by, filter_query, run_info):
+    """
+    Serves one page of the pool table from the cached columnar result,
+    after applying the table's filter and sort. Only that page is sent.
+    """
+    run = run_manager.result(run_info["run_id"]) if run_info else None
+    if not run:
+        return [], 0, ""
+
+    try:
+        rows = table_rows(run, sort_by, filter_query)
+    except ValueError as exc:
+        return [], 0, f"Filter error: {exc}"
+    run_manager.recharge(run_info["run_id"])  # the view memo may have grown
+    page_size = page_size or 10
+    first = (page_current or 0) * page_size
+    return page_records(run["columns"], rows[first:first + page_size]), -(-len(rows) // page_size), ""
+
+
+@app.callback(
+    [
+        Output("run-store", "data", allow_duplicate=True),
+        Output("run-poll", "disabled", allow_duplicate=True),
+        Output("edit-status", "children"),
+    ],
+    [
+        Input("pool-table", "data_timestamp"),
+        Input("add-job-button", "n_clicks"),
+    ],
+    [
+        State("pool-table", "data"),
+        State("pool-table", "data_previous"),
+        State("new-arrival-input", "value"),
+        State("new-burst-input", "value"),
+        State("pool-table", "page_current"),
+        State("run-store", "data"),
+    ],
+    prevent_initial_call=True,
+)
+def edit_workload(data_timestamp, add_clicks, data, data_previous, new_arrival, new_burst, page_current, run_info):
+    """
+    Turns pool-table edits (changed arrival/burst cells, deleted rows) or an
+    'Add Job' click into a new run derived from the current one, rescheduled
+    incrementally in the background. Invalid edits re-serve the current run,
+    which reverts the table.
+    """
+    run = run_manager.result(run_info["run_id"]) if run_info else None
+    if not run:
+        return no_update, no_update, "Generate a run first."
+    if not editable(run):
+        return run_info, True, "Editing needs single-core SJF or FCFS with exact bursts."
+
+    edits, removed, added = {}, [], []
+    try:
+        if ctx.triggered_id == "add-job-button":
+            added.append((int(new_arrival), int(new_burst)))
+        else:
+            current = {row["id"]: row for row in data or []}
+            for row in data_previous or []:
+                index = int(row["id"][1:]) - 1
+                if row["id"] not in current:
+                    removed.append(index)
+                elif (current[row["id"]]["arrival"], current[row["id"]]["burst"]) != (row["arrival"], row["burst"]):
+                    edits[index] = (int(current[row["id"]]["arrival"]), int(current[row["id"]]["burst"]))
+        if any(a < 0 or b < 1 for a, b in [*edits.values(), *added]):
+            raise ValueError
+    except (TypeError, ValueError):
+        return run_info, True, "Arrival must be ≥ 0 and burst ≥ 1 (whole numbers)."
+    if not (edits or removed or added):
+        return no_update, no_update, ""
+
+    key = ("edit", run_info["run_id"], tuple(sorted(edits.items())), tuple(removed), tuple(added))
+
+    def compute(progress):
+        edited = edit_run(run, edits, removed, added, progress)
+        run_manager.recharge(run_info["run_id"])  # the source run now holds its editor
+        return edited
+
+    run_id = run_manager.submit(key, compute)
+    page = 0 if added else page_current or 0
+    return {"run_id": run_id, "seed": run_info["seed"], "page": page}, False, ""
+
+
+@app.callback(
+    Output("export-download", "data"),
+    [
+        Input("export-parquet-button", "n_clicks"),
+        Input("export-arrow-button", "n_clicks"),
+    ],
+    [State("run-store", "data")],
+    prevent_initial_call=True,
+)
+def export_run(parquet_clicks, arrow_clicks, run_info):
+    """Sends the current run's per-job results and timeline as a Parquet or Arrow IPC file."""
+    run = run_manager.result(run_info["run_id"]) if run_info else None
+    if not run:
+        return no_update
+    fmt = "parquet" if ctx.triggered_id == "export-parquet-button" else "arrow"
+    columns, segments, metadata = export_columns(run)
+    seed = metadata.get("seed")
+    filename = f"{metadata.get('algorithm', 'run')}-{run['stats']['jobs']}-jobs{'' if seed is None else f'-seed-{seed}'}.{fmt}"
+    return dcc.send_bytes(lambda buffer: export_results(columns, buffer, segments, metadata, fmt), filename)
+
+
+@app.callback(
+    [
+        Output("run-store", "data", allow_duplicate=True),
+        Output("run-poll", "disabled", allow_duplicate=True),
+    ],
+    [Input("import-upload", "contents")],
+    [State("import-upload", "filename")],
+    prevent_initial_call=True,
+)
+def import_run(contents, filename):
+    """
+    Reopens an exported results file as a run (in the background, like any
+    other), so the tables, stats and Gantt chart come back without
+    rescheduling.
+    """
+    if not contents:
+        return no_update, no_update
+    key = ("import", filename, hash(contents))
+    run_id = run_manager.submit(key, lambda progress: load_run(contents, progress))
+    return {"run_id": run_id, "seed": f"from {filename}"}, False
+
+
+@app.callback(
+    [
+        Output("compare-store", "data"),
+        Output("compare-poll", "disabled"),
+    ],
+    [Input("compare-button", "n_clicks")],
+    [
+        State("num-job-dropdown", "value"),
+        State("arrival-dropdown", "value"),
+        State("burst-dropdown", "value"),
+        State("seed-input", "value"),
+        State("quantum-input", "value"),
+        State("aging-input", "value"),
+    ],
+    prevent_initial_call=True,
+)
+def start_comparison(n_clicks, num_jobs, arrival="uniform", burst="uniform", seed=None, quantum=4, aging=0.1):
+    """
+    Runs every policy in ALGORITHMS over one generated workload in the
+    background, so their metrics can be compared side by side.
+    """
+    if not n_clicks or num_jobs is None:
+        return no_update, no_update
+
+    if seed is None:
+        seed = secrets.randbelow(2**32)
+    quantum = policy_params("rr", quantum, aging)["quantum"]
+    aging = policy_params("priority", quantum, aging)["aging"]
+    key = ("compare", seed, num_jobs, arrival, burst, quantum, aging)
+    run_id = run_manager.submit(
+        key, lambda progress: compare_rows(num_jobs, seed, arrival, burst, quantum, aging, progress)
+    )
+    return {"run_id": run_id, "seed": seed}, False
+
+
+@app.callback(
+    [
+        Output("compare-table", "data"),
+        Output("compare-poll", "disabled", allow_duplicate=True),
+        Output("compare-status", "children"),
+    ],
+    [
+        Input("compare-store", "data"),
+        Input("compare-poll", "n_intervals"),
+    ],
+    prevent_initial_call=True,
+)
+def update_comparison(compare_info, n_intervals=None):
+    """Polls the comparison run and fills the comparison table when it is done."""
+    if not compare_info:
+        return [], True, ""
+
+    status = run_manager.status(compare_info["run_id"])
+    if status is None:
+        return no_update, True, "Comparison expired — run it again."
+    if status["state"] in ("queued", "running"):
+        return no_update, False, f"Comparing… {status['progress']:.0%}"
+    if status["state"] != "done":
+        message = "Cancelled." if status["state"] == "cancelled" else f"Failed: {status['error']}"
+        return no_update, True, message
+    return run_manager.result(compare_info["run_id"]), True, f"Seed: {compare_info['seed']}"
+
+
+@app.callback(
+    Output("gantt-chart", "figure", allow_duplicate=True),
+    [Input("gantt-chart", "relayoutData")],
+    [State("run-store", "data")],
+    prevent_initial_call=True,
+)
+def zoom_gantt(relayout, run_info):
+    """
+    Re-renders the Gantt chart for the zoomed time window, pulling only the
+    visible segments from the cached schedule (autoscale shows everything).
+    """
+    run = run_manager.result(run_info["run_id"]) if run_info else None
+    if not run or not relayout:
+        return no_update
+    if "xaxis.range[0]" in relayout:
+        x_range = (relayout["xaxis.range[0]"], relayout["xaxis.range[1]"])
+    elif "xaxis.range" in relayout:
+        x_range = tuple(relayout["xaxis.range"])
+    elif relayout.get("xaxis.autorange"):
+        x_range = None
+    else:
+        return no_update
+    return gantt_figure(
+        run["segments"], run["stats"]["jobs"], x_range, uirevision=run_info["run_id"], core_segments=run["core_segments"]
+    )
+
+
+def build_run(num_jobs, seed, arrival, burst, algorithm, progress=None, **params):
+    """
+    Computes one run and returns everything update_simulation needs, in a
+    form that is cheap to serve again: pool-table records, stats, the ready
+    queue string and the Gantt figure serialized to a plain dict. With
+    profiling on, the run's stage timings are kept under "profile" and
+    added to the process-wide profile_stats.
+    """
+    profile = Stats(enabled=PROFILE)
+
+    # 1) Compute the schedule for 'num_jobs' processes
+    result = compute_sjf(num_jobs, seed, arrival, burst, algorithm, progress, profile=profile, **params)
+    run = run_record(*result, profile)
+    run["meta"] = {"algorithm": algorithm, "seed": seed, "arrival": arrival, "burst": burst, **params}
+    return run
+
+
+def editable(run):
+    """Whether a run can be edited job by job: single-core SJF or FCFS with exact bursts."""
+    return (
+        run["meta"].get("algorithm") in EDITABLE_POLICIES
+        and run["core_segments"] is None
+        and "prediction" not in run["stats"]
     )
-    fig.update_yaxes(autorange="reversed")  # so P1 is on top
-    fig.update_layout(
-        margin=dict(l=20, r=20, t=20, b=20),
-        showlegend=False,
-        xaxis_title="Time",
-        yaxis_title="Process"
+
+
+def run_editor(run):
+    """
+    The run's IncrementalScheduler, seeded from its result arrays (no
+    rescheduling) on the first edit and kept on the run for later ones.
+    """
+    if run["editor"] is None:
+        columns = run["columns"]
+        workload = Workload(columns["arrival"], columns["burst"])
+        order = np.argsort(columns["start"], kind="stable")
+        schedule = Schedule(workload, columns["start"], columns["completion"], order)
+        run["editor"] = IncrementalScheduler(workload, run["meta"]["algorithm"], schedule)
+    return run["editor"]
+
+
+def edit_run(run, edits, removed, added, progress=None):
+    """
+    Applies pool-table edits to a finished, editable run and returns the
+    new run. `edits` maps job index → (arrival, burst), `removed` lists job
+    indices and `added` (arrival, burst) pairs; indices refer to the run's
+    jobs as shown. The run's IncrementalScheduler is copied (the cached
+    run stays as it was) and only replays from the first dispatch an edit
+    can change.
+    """
+    profile = Stats(enabled=PROFILE)
+    editor = run_editor(run).copy()
+    for index, (arrival, burst) in edits.items():
+        editor.edit(index, arrival, burst)
+    for index in sorted(removed, reverse=True):
+        editor.remove(index)
+    for arrival, burst in added:
+        editor.add(arrival, burst)
+
+    with profile.stage("reschedule"):
+        schedule = editor.schedule(progress)
+    record_schedule(profile, schedule)
+    edited = run_record(
+        schedule.columns(), labels(schedule.order), schedule.total_time, schedule.avg_wt, schedule.avg_tat,
+        schedule.segments, {}, profile,
     )
+    edited["editor"] = editor
+    edited["stats"]["edit"] = editor.last_resume
+    edited["meta"] = {**run["meta"], "edited": True}
+    return edited
+
+
+def load_run(contents, progress=None):
+    """
+    Reopens a results file exported from this app (or by the CLI's
+    --export) from a dcc.Upload data URL, without rescheduling.
+    """
+    profile = Stats(enabled=PROFILE)
+    with profile.stage("import"):
+        schedule, meta = import_schedule(base64.b64decode(contents.partition(",")[2]))
+    if hasattr(schedule, "core"):
+        segments = [schedule.timeline(c) for c in range(schedule.cores)]
+    else:
+        segments = schedule.segments
+    extras = {"prediction": meta["prediction"]} if meta.get("prediction") else {}
+    run = run_record(
+        schedule.columns(), labels(schedule.order), schedule.total_time, schedule.avg_wt, schedule.avg_tat,
+        segments, extras, profile,
+    )
+    run["meta"] = meta
+    return run
+
+
+def export_columns(run):
+    """
+    Returns (columns, segments, metadata) for export_results: the run's
+    result arrays as they are (no copies), its timeline (single-core) or a
+    core column rebuilt from the per-core timelines (multi-core).
+    """
+    columns = {name: values for name, values in run["columns"].items() if name != "id"}
+    metadata = dict(run["meta"])
+    if "prediction" in run["stats"]:
+        metadata["prediction"] = run["stats"]["prediction"]
+    if run["core_segments"] is None:
+        return columns, run["segments"], metadata
+    core = np.empty(len(columns["arrival"]), dtype=np.int32)
+    for c, (job, _, _) in enumerate(run["core_segments"]):
+        core[job] = c
+    columns["core"] = core
+    metadata["cores"] = len(run["core_segments"])
+    return columns, None, metadata
+
+
+def run_record(table, schedule_order, total_time, avg_wt, avg_tat, segments, extras, profile):
+    """Turns compute_sjf's result into the cached run dict served by the callbacks."""
+    num_jobs = len(table["arrival"])
+
+    # 2) Merge back-to-back pieces once; zooming re-decimates from these arrays.
+    #    Multi-core runs keep one timeline per core plus their utilization.
+    stats = {"jobs": num_jobs, "total_time": total_time, "avg_wt": avg_wt, "avg_tat": avg_tat}
+    core_segments = None
+    if isinstance(segments, list):
+        core_segments = segments
+        busy = np.array([int((end - start).sum()) for _, start, end in core_segments], dtype=np.float64)
+        stats["utilization"] = (busy / total_time if total_time else busy).tolist()
+        stats["imbalance"] = float(busy.max() / busy.mean() - 1.0) if busy.mean() else 0.0
+        segments = (np.empty(0, np.int32),) * 3
+    else:
+        with profile.stage("merge_segments"):
+            segments = merge_segments(*segments)
+
+    # 3) Keep the pool table columnar; pages are formatted on request
+    columns = {name: values for name, values in table.items() if name != "id"}
+    columns["id"] = np.arange(num_jobs)
+
+    if "prediction" in extras:
+        stats["prediction"] = extras["prediction"]
+
+    # 4) Tail and fairness metrics, overall and per burst bucket
+    with profile.stage("fairness"):
+        arrays = (columns["burst"], columns["wt"], columns["response"], columns["tat"])
+        stats["fairness"] = fairness_report(*arrays)
+        buckets = [
+            {k: round(v, 2) if isinstance(v, float) else v for k, v in row.items()} for row in bucket_table(*arrays)
+        ]
+
+    # 5) The ready queue shows the first READY_QUEUE_LIMIT entries only
+    ready_queue = " → ".join(schedule_order[:READY_QUEUE_LIMIT])
+    if len(schedule_order) > READY_QUEUE_LIMIT:
+        ready_queue += f" → … (+{len(schedule_order) - READY_QUEUE_LIMIT:,} more)"
+
+    with profile.stage("figure"):
+        figure = gantt_figure(segments, num_jobs, core_segments=core_segments)
+
+    profile_stats.merge(profile)
+    return {
+        "columns": columns,
+        "views": {},  # memoized (sort_by, filter_query) -> row indices
+        "stats": stats,
+        "buckets": buckets,
+        "ready_queue": ready_queue,
+        "segments": segments,
+        "core_segments": core_segments,
+        "figure": figure,
+        "profile": profile.snapshot() if PROFILE else None,
+        "editor": None,  # IncrementalScheduler, built by run_editor on the first edit
+    }
+
+
+def profile_text(snapshot):
+    """Formats a run's profiling snapshot for the debug panel."""
+    if not snapshot:
+        return ""
+    lines = [f"{'stage':<16}{'ms':>12}"]
+    lines += [f"{name:<16}{entry['seconds'] * 1e3:>12.2f}" for name, entry in snapshot["stages"].items()]
+    lines += [""] + [f"{name:<22}{value:>14,}" for name, value in snapshot["counters"].items()]
+    lines += [f"{name:<22}{value:>14,}" for name, value in snapshot["peaks"].items()]
+    return "\n".join(lines)
+
+
+def prediction_stats(stats):
+    """CPU Statistics lines for predicted-burst SJF: estimator error and loss vs oracle SJF."""
+    if "prediction" not in stats:
+        return []
+    report = stats["prediction"]
+    return [
+        html.P(f"Burst Prediction ({report['estimator']}): MAE {report['mae']:.2f} · "
+               f"MAPE {report['abs_error_ratio']:.1%} · Bias {report['bias']:+.2f}"),
+        html.P(f"vs Oracle SJF: WT +{report['avg_wt_increase']:.2f} ({report['avg_wt_increase_ratio']:+.1%}) · "
+               f"TAT +{report['avg_tat_increase']:.2f} ({report['avg_tat_increase_ratio']:+.1%})"),
+    ]
+
+
+def edit_stats(stats):
+    """CPU Statistics line for an edited run: how much of the schedule was replayed."""
+    if "edit" not in stats:
+        return []
+    edit = stats["edit"]
+    return [
+        html.P(f"Incremental Reschedule: kept {edit['kept']:,} dispatches, replayed {edit['replayed']:,} "
+               f"(from t = {edit['from_time']:,})", style={"fontSize": "13px"}),
+    ]
+
+
+def core_stats(stats):
+    """CPU Statistics lines for multi-core runs: per-core utilization and load balance."""
+    if "utilization" not in stats:
+        return []
+    util = stats["utilization"]
+    shown = ", ".join(f"{u:.0%}" for u in util[:CORE_STATS_LIMIT])
+    if len(util) > CORE_STATS_LIMIT:
+        shown += f", … (+{len(util) - CORE_STATS_LIMIT} cores)"
+    return [
+        html.P(f"Cores: {len(util)} · Mean Utilization: {sum(util) / len(util):.1%}"),
+        html.P(f"Per-core Utilization: {shown}", style={"fontSize": "13px"}),
+        html.P(f"Load Imbalance (max/mean − 1): {stats['imbalance']:.3f}"),
+    ]
+
+
+def compare_rows(num_jobs, seed, arrival, burst, quantum, aging, progress=None):
+    """
+    Runs every policy over the same generated workload and returns one
+    comparison-table record per policy.
+    """
+    workload = generate_workload(num_jobs, seed, arrival, burst)
+    results = compare(workload, progress=progress, quantum=quantum, aging=aging)
+    return [
+        {
+            "algorithm": name.upper() + (f" (q={quantum})" if name == "rr" else ""),
+            "total_time": summary["total_time"],
+            "avg_wt": round(summary["avg_wt"], 2),
+            "avg_tat": round(summary["avg_tat"], 2),
+            "avg_response": round(summary["avg_response"], 2),
+            "throughput": round(summary["throughput"], 4),
+        }
+        for name, summary in results.items()
+    ]
+
+
+READY_QUEUE_LIMIT = 50
+CORE_STATS_LIMIT = 16
+
+FILTER_OPERATORS = {
+    "eq": np.equal, "=": np.equal, "ne": np.not_equal, "!=": np.not_equal,
+    "lt": np.less, "<": np.less, "le": np.less_equal, "<=": np.less_equal,
+    "gt": np.greater, ">": np.greater, "ge": np.greater_equal, ">=": np.greater_equal,
+}
+FILTER_TERM = re.compile(r"\{(\w+)\}\s*(\S+)\s*(.+)")
+
+
+def filter_operator(op):
+    """
+    Splits a DataTable filter operator into (operator, case_insensitive).
+    The table prefixes operators with 's' (case-sensitive, its default) or
+    'i' (case-insensitive), e.g. 's>', 'i=', 'scontains'.
+    """
+    op = op.lower()
+    if op not in FILTER_OPERATORS and op != "contains" and op[:1] in ("s", "i"):
+        return op[1:], op[0] == "i"
+    return op, False
+
+
+def filter_mask(columns, filter_query):
+    """
+    Returns the boolean row mask for a DataTable filter query: terms such as
+    '{burst} s> 20' or '{id} scontains P5' joined by ' && '. Comparisons are
+    numeric ('{id} s= P5' means job P5); 'contains' is a substring match on
+    the value as displayed ("P5" for ids). Raises ValueError for a term it
+    cannot apply, so the user sees why nothing was filtered.
+    """
+    mask = np.ones(len(columns["id"]), dtype=bool)
+    for term in (filter_query or "").split(" && "):
+        term = term.strip()
+        if not term:
+            continue
+        match = FILTER_TERM.fullmatch(term)
+        if not match or match.group(1) not in columns:
+            raise ValueError(f"cannot filter on {term!r}")
+        name, op, value = match.groups()
+        op, insensitive = filter_operator(op)
+        value = value.strip().strip("'\"")
+        if insensitive:
+            value = value.lower()
+
+        if op == "contains":
+            shown = (columns[name] + 1).astype(str) if name == "id" else columns[name].astype(str)
+            if name == "id":
+                shown = np.char.add("p" if insensitive else "P", shown)
+            mask &= np.char.find(shown, value) >= 0
+            continue
+
+        predicate = FILTER_OPERATORS.get(op)
+        if predicate is None:
+            raise ValueError(f"unsupported filter operator {op!r} in {term!r}")
+        if name == "id" and value[:1] in (("p",) if insensitive else ("P",)):
+            value = value[1:]
+        try:
+            number = float(value)
+        except ValueError:
+            raise ValueError(f"{term!r}: {value!r} is not a number") from None
+        mask &= predicate(columns[name], number - 1 if name == "id" else number)
+    return mask
+
+
+def table_rows(run, sort_by, filter_query):
+    """
+    Returns the row indices (job indices) matching the DataTable filter query,
+    in the requested sort order. Results are memoized on the cached run, so
+    paging through the same view costs only a slice.
+    """
+    sort_key = tuple((s["column_id"], s["direction"]) for s in sort_by or [])
+    view_key = (sort_key, filter_query or "")
+    views = run["views"]
+    if view_key in views:
+        return views[view_key]
+
+    columns = run["columns"]
+    mask = filter_mask(columns, filter_query)
+    rows = np.flatnonzero(mask)
+
+    if sort_key:
+        name, direction = sort_key[0]
+        order = np.argsort(columns[name][rows], kind="stable")
+        rows = rows[order[::-1]] if direction == "desc" else rows[order]
+
+    if len(views) >= 8:
+        views.pop(next(iter(views)))
+    views[view_key] = rows
+    return rows
+
+
+def page_records(columns, rows):
+    """Formats the given rows of the columnar result as DataTable records."""
+    page = {"id": labels(rows)}
+    page.update((name, col[rows].tolist()) for name, col in columns.items() if name != "id")
+    return [dict(zip(page, values)) for values in zip(*page.values())]
+
+
+# Pastel qualitative palette; blocks that fuse several jobs are drawn grey
+GANTT_COLORS = ["#66C5CC", "#F6CF71", "#F89C74", "#DCB0F2", "#87C55F",
+                "#9EB9F3", "#FE88B1", "#C9DB74", "#8BE0A4", "#B497E7"]
+GANTT_MIXED_COLOR = "#B3B3B3"
+GANTT_WIDTH_PX = 1200  # decimation target: roughly one block per pixel
+GANTT_ROW_LIMIT = 30   # above this many jobs, draw a single "CPU" row
+
+
+def gantt_figure(segments, num_jobs, x_range=None, uirevision=None, core_segments=None):
+    """
+    Builds the Gantt chart as a plain figure dict for the segments visible in
+    `x_range` (default: the whole run), decimated to GANTT_WIDTH_PX so the
+    payload stays bounded however many jobs there are. Each color is a single
+    WebGL (scattergl) line trace with one None-separated piece per block.
+    Small runs get one row per process (P1 on top); large runs one CPU row;
+    multi-core runs (`core_segments`, one timeline per core) one row per core.
+    """
+    timelines = core_segments if core_segments is not None else [segments]
+    total_time = max((int(end[-1]) for _, _, end in timelines if len(end)), default=0)
+    x0, x1 = x_range if x_range else (0, total_time)
+    blocks = [decimate(job, start, end, x0, x1, GANTT_WIDTH_PX) for job, start, end in timelines]
+    b_job, b_start, b_end = (np.concatenate([b[k] for b in blocks]) for k in range(3))
+    b_count = np.concatenate([b[4] for b in blocks])
+    b_core = np.repeat(np.arange(len(blocks)), [len(b[0]) for b in blocks])
+
+    per_job_rows = core_segments is None and num_jobs <= GANTT_ROW_LIMIT
+    if per_job_rows:
+        line_width = max(4, min(30, 300 // max(num_jobs, 1)))
+    else:
+        line_width = max(4, min(40, 300 // len(timelines)))
+    color_idx = np.where(b_job == MIXED, len(GANTT_COLORS), b_job % len(GANTT_COLORS))
+    hover = [label(j) if j != MIXED else f"{c} jobs" for j, c in zip(b_job.tolist(), b_count.tolist())]
+    core_rows = [f"CPU {c}" for c in range(len(timelines))] if core_segments is not None else ["CPU"]
+
+    traces = []
+    for c in np.unique(color_idx).tolist():
+        idx = np.flatnonzero(color_idx == c)
+        xs = [None] * (3 * len(idx))
+        xs[0::3] = b_start[idx].tolist()
+        xs[1::3] = b_end[idx].tolist()
+        if per_job_rows:
+            rows = [hover[i] for i in idx.tolist()]
+        else:
+            rows = [core_rows[c] for c in b_core[idx].tolist()]
+        ys = [None] * (3 * len(idx))
+        ys[0::3] = rows
+        ys[1::3] = rows
+        text = [None] * (3 * len(idx))
+        text[0::3] = text[1::3] = [hover[i] for i in idx.tolist()]
+        traces.append({
+            "type": "scattergl",
+            "mode": "lines",
+            "x": xs,
+            "y": ys,
+            "text": text,
+            "hovertemplate": "%{text}: %{x}<extra></extra>",
+            "line": {"color": (GANTT_COLORS + [GANTT_MIXED_COLOR])[c], "width": line_width},
+        })
+
+    yaxis = {"title": {"text": "Process" if per_job_rows else ""}, "type": "category", "autorange": "reversed"}
+    if per_job_rows:
+        yaxis.update(categoryorder="array", categoryarray=labels(range(num_jobs)))
+    elif core_segments is not None:
+        yaxis.update(title={"text": "Core"}, categoryorder="array", categoryarray=core_rows)
+    xaxis = {"title": {"text": "Time"}}
+    if x_range:
+        xaxis["range"] = list(x_range)
+    return {
+        "data": traces,
+        "layout": {
+            "margin": {"l": 20, "r": 20, "t": 20, "b": 20},
+            "showlegend": False,
+            "xaxis": xaxis,
+            "yaxis": yaxis,
+            "uirevision": uirevision,
+        },
+    }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 4) Profiling endpoint
+# ──────────────────────────────────────────────────────────────────────────────
+@server.route("/metrics")
+def metrics():
+    """Prometheus text exposition of the stage timers, counters and result-cache stats."""
+    text = profile_stats.prometheus()
+    for name, value in result_cache.stats().items():
+        kind = "counter" if name in ("hits", "misses", "evictions") else "gauge"
+        suffix = "_total" if kind == "counter" else ""
+        text += f"# TYPE sjf_cache_{name}{suffix} {kind}\nsjf_cache_{name}{suffix} {value}\n"
+    return Response(text, mimetype="text/plain; version=0.0.4")
+
+
+if PROFILE:
+    @server.before_request
+    def _start_timer():
+        g.request_started = time.perf_counter()
 
-    return pool_data, cpu_stats_children, ready_queue_str, fig
+    @server.after_request
+    def _record_request(response):
+        # Dash callbacks (including JSON serialization of their outputs)
+        if request.path.endswith("/_dash-update-component") and "request_started" in g:
+            profile_stats.add_time("dash_callback", time.perf_counter() - g.request_started)
+            profile_stats.count("response_bytes", response.calculate_content_length() or 0)
+        return response
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# 4) Run the App
+# 5) Run the App
 # ──────────────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     app.run_server(debug=True)
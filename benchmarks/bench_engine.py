@@ -0,0 +1,79 @@
+# benchmarks/bench_engine.py
+"""
+Compares the original O(n²) SJF loop against the heap-based engine.
+
+Usage:
+    python -m benchmarks.bench_engine [--sizes 10000 100000 1000000] [--legacy-max 20000]
+
+The legacy loop is only timed up to --legacy-max jobs; beyond that its
+runtime is extrapolated quadratically from the largest measured size.
+"""
+
+import argparse
+import time
+
+from scheduler import generate_workload, schedule_sjf
+
+
+def legacy_sjf(processes):
+    """
+    Verbatim copy of the scheduling loop that used to live in compute_sjf,
+    kept here as the baseline for comparison.
+    """
+    time_ = 0
+    remaining = processes.copy()
+    schedule_order = []
+    while remaining:
+        arrived = [p for p in remaining if p["arrival"] <= time_]
+        if not arrived:
+            time_ = min(p["arrival"] for p in remaining)
+            arrived = [p for p in remaining if p["arrival"] <= time_]
+        current = min(arrived, key=lambda x: x["burst"])
+        schedule_order.append(current["id"])
+        current["start"] = time_
+        time_ += current["burst"]
+        current["completion"] = time_
+        remaining.remove(current)
+    return schedule_order, time_
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'jobs':>10} {'legacy (s)':>12} {'heap (s)':>10} {'speedup':>10}")
+    measured = None  # (n, seconds) of the largest legacy run
+    for n in args.sizes:
+        workload = generate_workload(n, args.seed)
+
+        t0 = time.perf_counter()
+        schedule = schedule_sjf(workload)
+        heap_s = time.perf_counter() - t0
+
+        if n <= args.legacy_max:
+            processes = [
+                {"id": i, "arrival": a, "burst": b}
+                for i, (a, b) in enumerate(zip(workload.arrival.tolist(), workload.burst.tolist()))
+            ]
+            t0 = time.perf_counter()
+            _, total = legacy_sjf(processes)
+            legacy_s = time.perf_counter() - t0
+            assert total == schedule.total_time, "engine disagrees with legacy loop"
+            measured = (n, legacy_s)
+            legacy_txt = f"{legacy_s:12.3f}"
+        elif measured:
+            legacy_s = measured[1] * (n / measured[0]) ** 2
+            legacy_txt = f"~{legacy_s:11.0f}"
+        else:
+            legacy_s = None
+            legacy_txt = f"{'skipped':>12}"
+
+        speedup = f"{legacy_s / heap_s:9.0f}x" if legacy_s else f"{'-':>10}"
+        print(f"{n:>10} {legacy_txt} {heap_s:10.3f} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
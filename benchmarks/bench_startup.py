@@ -0,0 +1,80 @@
+# benchmarks/bench_startup.py
+"""
+Measures the cold start of a web worker: import time and resident memory of
+`import app` in a fresh interpreter, against the heavier import sets it used
+to carry.
+
+Usage:
+    python -m benchmarks.bench_startup [--repeat 5]
+
+Each variant runs in its own subprocess (so nothing is cached in
+sys.modules); the import time is the best of --repeat runs and the memory
+is the worker's peak RSS after the imports.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statements run before `import app` to reproduce earlier import sets
+VARIANTS = {
+    "app": "",
+    "app+pandas": "import pandas",  # compute path before it dropped pandas
+    "app+pandas+plotly.express": "import pandas, plotly.express",  # original app.py
+}
+
+_PROBE = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+{preload}
+import app
+seconds = time.perf_counter() - t0
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "seconds": seconds,
+    "rss_bytes": rss if sys.platform == "darwin" else rss * 1024,
+    "pandas": "pandas" in sys.modules,
+}}))
+"""
+
+
+def measure_startup(preload="", repeat=5):
+    """
+    Imports app in `repeat` fresh interpreters (after running `preload`) and
+    returns {'seconds', 'rss_bytes', 'pandas'}: the best import time, the
+    smallest peak RSS and whether pandas ended up loaded.
+    """
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(preload=preload)],
+            capture_output=True, text=True, check=True, cwd=ROOT,
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {
+        "seconds": min(r["seconds"] for r in runs),
+        "rss_bytes": min(r["rss_bytes"] for r in runs),
+        "pandas": runs[0]["pandas"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'imports':<28} {'import (s)':>11} {'RSS (MiB)':>10} {'pandas':>7}")
+    for name, preload in VARIANTS.items():
+        result = measure_startup(preload, args.repeat)
+        print(
+            f"{name:<28} {result['seconds']:>11.3f} {result['rss_bytes'] / 2**20:>10.1f} "
+            f"{'yes' if result['pandas'] else 'no':>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
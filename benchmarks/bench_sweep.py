@@ -0,0 +1,39 @@
+# benchmarks/bench_sweep.py
+"""
+Measures parameter-sweep throughput (trials/s) as the worker count grows.
+
+Usage:
+    python -m benchmarks.bench_sweep [--jobs 1000] [--trials 400] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import time
+
+from scheduler.sweep import run_sweep, sweep_grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--trials", type=int, default=400)
+    parser.add_argument("--chunksize", type=int, default=25)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args(argv)
+
+    grid = sweep_grid([args.jobs], [0.1], ["uniform", "exponential"])
+    total = args.trials * len(grid)
+
+    print(f"{'workers':>8} {'seconds':>10} {'trials/s':>10} {'scaling':>8}")
+    base = None
+    for workers in args.workers:
+        t0 = time.perf_counter()
+        run_sweep(grid, args.trials, workers=workers, chunksize=args.chunksize)
+        elapsed = time.perf_counter() - t0
+        rate = total / elapsed
+        base = base or rate
+        print(f"{workers:>8} {elapsed:10.2f} {rate:10.0f} {rate / base:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
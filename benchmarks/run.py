@@ -0,0 +1,263 @@
+# benchmarks/run.py
+"""
+Reproducible benchmark suite: engine throughput, peak memory, Dash
+callback latency / payload size and web-worker startup, saved as JSON for
+comparison across commits.
+
+Usage:
+    python -m benchmarks.run run [--sizes 10000 100000] [--bursts uniform pareto] [-o results.json]
+    python -m benchmarks.run run --quick
+    python -m benchmarks.run compare benchmarks/results/OLD.json benchmarks/results/NEW.json [--threshold 0.1]
+
+Every case runs on a workload generated from a fixed seed. Timings are the
+best of --repeat runs; peak memory is measured in a separate tracemalloc
+pass so tracing overhead does not skew the timings. Results go to
+benchmarks/results/<commit>.json by default.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from scheduler import ALGORITHMS, BURST_DISTRIBUTIONS, generate_workload, run_schedule, schedule_multicore
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Measurement helpers
+# ──────────────────────────────────────────────────────────────────────────────
+def best_time(fn, repeat):
+    """Best wall time of `repeat` calls of fn(), with GC paused while timing."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        finally:
+            gc.enable()
+    return best
+
+
+def peak_memory(fn):
+    """Peak bytes allocated through Python's allocators (incl. numpy) during fn()."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def json_size(value):
+    """Size in bytes of `value` serialized the way Dash sends it to the browser."""
+    from plotly.utils import PlotlyJSONEncoder
+
+    return len(json.dumps(value, cls=PlotlyJSONEncoder).encode())
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Cases
+# ──────────────────────────────────────────────────────────────────────────────
+def engine_cases(args):
+    """Scheduling throughput and peak memory per algorithm, size and burst distribution."""
+    from benchmarks.bench_engine import legacy_sjf
+
+    for burst in args.bursts:
+        for n in args.sizes:
+            workload = generate_workload(n, args.seed, "poisson", burst, rate=args.rate)
+            runs = {name: (lambda name=name: run_schedule(workload, name)) for name in args.algorithms}
+            if args.cores > 1:
+                runs[f"sjf-{args.cores}core"] = lambda: schedule_multicore(workload, args.cores)
+            if n <= args.legacy_max:
+                processes = [
+                    {"id": i, "arrival": a, "burst": b}
+                    for i, (a, b) in enumerate(zip(workload.arrival.tolist(), workload.burst.tolist()))
+                ]
+                runs["legacy"] = lambda: legacy_sjf([dict(p) for p in processes])
+
+            for name, fn in runs.items():
+                seconds = best_time(fn, args.repeat)
+                yield {
+                    "name": f"engine/{name}",
+                    "params": {"jobs": n, "burst": burst},
+                    "seconds": seconds,
+                    "jobs_per_s": n / seconds,
+                    "peak_bytes": peak_memory(fn),
+                }
+
+
+def dash_cases(args):
+    """
+    Latency and JSON payload of the Dash callbacks for a finished run:
+    build_run (the background computation), update_simulation (stats, queue
+    and figure) and update_pool_table (first page), plus a Gantt zoom.
+    """
+    import app
+
+    for n in args.dash_sizes:
+        built = {}
+
+        def build():
+            built["run"] = app.build_run(n, args.seed, "poisson", "uniform", "sjf")
+
+        build_s = best_time(build, 1)
+        run_id = app.run_manager.submit(("bench", n, time.time_ns()), lambda progress: built["run"])
+        while app.run_manager.status(run_id)["state"] in ("queued", "running"):
+            time.sleep(0.01)
+        info = {"run_id": run_id, "seed": args.seed}
+        total_time = built["run"]["stats"]["total_time"]
+
+        callbacks = {
+            "build_run": (None, build_s),
+            "update_simulation": (lambda: app.update_simulation(info), None),
+            "update_pool_table": (lambda: app.update_pool_table(0, 10, [], "", info), None),
+            "zoom_gantt": (
+                lambda: app.zoom_gantt({"xaxis.range[0]": 0, "xaxis.range[1]": total_time / 10}, info), None
+            ),
+        }
+        for name, (fn, seconds) in callbacks.items():
+            result = {"name": f"dash/{name}", "params": {"jobs": n}}
+            if fn is None:
+                result["seconds"] = seconds
+            else:
+                result["seconds"] = best_time(fn, args.repeat)
+                result["payload_bytes"] = json_size(fn())
+            yield result
+
+
+def startup_cases(args):
+    """Import time and peak RSS of `import app` in a fresh interpreter."""
+    from benchmarks.bench_startup import measure_startup
+
+    result = measure_startup(repeat=args.repeat)
+    yield {"name": "startup/app", "params": {}, "seconds": result["seconds"], "rss_bytes": result["rss_bytes"]}
+
+
+def run_suite(args):
+    results = list(engine_cases(args))
+    if not args.skip_dash:
+        results += list(dash_cases(args))
+        results += list(startup_cases(args))
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} cpus)",
+        "seed": args.seed,
+        "results": results,
+    }
+
+
+def _git(*argv):
+    try:
+        return subprocess.run(
+            ["git", *argv], capture_output=True, text=True, check=True, cwd=os.path.dirname(__file__)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Comparison
+# ──────────────────────────────────────────────────────────────────────────────
+def case_key(result):
+    return result["name"] + "".join(f" {k}={v}" for k, v in sorted(result["params"].items()))
+
+
+def compare_results(base, new, threshold):
+    """
+    Matches cases by name and params and returns (rows, regressions). A case
+    regresses when its time, peak memory, RSS or payload grows by more than
+    `threshold` (a fraction).
+    """
+    old = {case_key(r): r for r in base["results"]}
+    rows, regressions = [], []
+    for result in new["results"]:
+        key = case_key(result)
+        if key not in old:
+            continue
+        for metric in ("seconds", "peak_bytes", "rss_bytes", "payload_bytes"):
+            if metric not in result or metric not in old[key]:
+                continue
+            before, after = old[key][metric], result[metric]
+            change = (after - before) / before if before else 0.0
+            rows.append((key, metric, before, after, change))
+            if change > threshold:
+                regressions.append(key)
+    return rows, regressions
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Entry point
+# ──────────────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the suite and write a JSON result file")
+    run.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    run.add_argument("--bursts", choices=BURST_DISTRIBUTIONS, nargs="+", default=["uniform", "exponential"])
+    run.add_argument("--algorithms", choices=list(ALGORITHMS), nargs="+", default=list(ALGORITHMS))
+    run.add_argument("--rate", type=float, default=0.09, help="poisson arrival rate (default: ~90%% load)")
+    run.add_argument("--cores", type=int, default=8, help="also time SJF on this many cores (1 = skip)")
+    run.add_argument("--legacy-max", type=int, default=10_000, help="largest size for the O(n²) legacy loop")
+    run.add_argument("--dash-sizes", type=int, nargs="+", default=[10_000, 100_000])
+    run.add_argument("--skip-dash", action="store_true", help="engine cases only (no Dash or startup cases)")
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--quick", action="store_true", help="small sizes, one repeat (smoke test)")
+    run.add_argument("-o", "--output", metavar="FILE", help="default: benchmarks/results/<commit>.json")
+
+    comp = sub.add_parser("compare", help="compare two result files and flag regressions")
+    comp.add_argument("base")
+    comp.add_argument("new")
+    comp.add_argument("--threshold", type=float, default=0.10, help="allowed growth before flagging (default: 0.10)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.base) as fh:
+            base = json.load(fh)
+        with open(args.new) as fh:
+            new = json.load(fh)
+        rows, regressions = compare_results(base, new, args.threshold)
+        print(f"{base.get('commit', '?')} → {new.get('commit', '?')}")
+        for key, metric, before, after, change in rows:
+            flag = "  REGRESSION" if change > args.threshold else ""
+            print(f"{key:<55} {metric:<14} {before:>14.6g} {after:>14.6g} {change:+8.1%}{flag}")
+        return 1 if regressions else 0
+
+    if args.quick:
+        args.sizes, args.dash_sizes, args.repeat, args.legacy_max = [1_000, 10_000], [1_000], 1, 1_000
+    report = run_suite(args)
+    for result in report["results"]:
+        extra = "".join(
+            f"  {k}={result[k]:,.0f}" for k in ("jobs_per_s", "peak_bytes", "rss_bytes", "payload_bytes") if k in result
+        )
+        print(f"{case_key(result):<55} {result['seconds'] * 1e3:10.2f} ms{extra}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['commit'] or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+# gunicorn.conf.py
+"""
+Gunicorn settings for the Dash app (gunicorn app:server; this file is
+picked up from the working directory).
+
+Background runs, their progress and the result cache live in the memory of
+the process that started them (see RunManager in app.py), so the browser's
+polls must reach that same process. Serve with ONE worker and scale with
+threads: polls and table pages are short requests, and the runs themselves
+execute on the RunManager's pool, not on request threads. With several
+workers a poll landing on another process would report the run as expired,
+so startup is refused instead.
+"""
+
+workers = 1
+threads = 8
+
+
+def on_starting(server):
+    if server.cfg.workers > 1:
+        raise RuntimeError(
+            f"app:server keeps run state in process memory and needs a single worker, got "
+            f"workers={server.cfg.workers}; use --threads to serve more requests at once"
+        )
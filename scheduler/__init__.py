@@ -0,0 +1,69 @@
+# scheduler/__init__.py
+"""
+Scheduling engine shared by the Dash app (app.py) and the Tk simulator (SJF.py).
+"""
+
+from scheduler.cache import ResultCache
+from scheduler.engine import (
+    ALGORITHMS,
+    compare,
+    iter_sjf,
+    run_schedule,
+    schedule_fcfs,
+    schedule_hrrn,
+    schedule_priority,
+    schedule_rr,
+    schedule_sjf,
+    schedule_srtf,
+)
+from scheduler.export import export_schedule, import_schedule
+from scheduler.generate import ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS, generate_history, generate_workload
+from scheduler.incremental import IncrementalScheduler
+from scheduler.metrics import bucket_table, fairness_report, jain_index
+from scheduler.multicore import QUEUE_MODES, MultiCoreSchedule, schedule_multicore
+from scheduler.online import OnlineScheduler, P2Quantile, RunningStats
+from scheduler.predict import ESTIMATORS, evaluate_prediction, predict_bursts
+from scheduler.profiling import Stats
+from scheduler.sweep import iter_sweep, run_sweep, sweep_grid
+from scheduler.workload import Schedule, Workload, label, labels
+
+__all__ = [
+    "ALGORITHMS",
+    "ARRIVAL_PROCESSES",
+    "BURST_DISTRIBUTIONS",
+    "ESTIMATORS",
+    "IncrementalScheduler",
+    "MultiCoreSchedule",
+    "OnlineScheduler",
+    "P2Quantile",
+    "QUEUE_MODES",
+    "ResultCache",
+    "RunningStats",
+    "Schedule",
+    "Stats",
+    "Workload",
+    "bucket_table",
+    "compare",
+    "evaluate_prediction",
+    "export_schedule",
+    "fairness_report",
+    "generate_history",
+    "generate_workload",
+    "import_schedule",
+    "iter_sjf",
+    "iter_sweep",
+    "jain_index",
+    "label",
+    "labels",
+    "predict_bursts",
+    "run_schedule",
+    "run_sweep",
+    "schedule_fcfs",
+    "schedule_hrrn",
+    "schedule_multicore",
+    "schedule_priority",
+    "schedule_rr",
+    "schedule_sjf",
+    "schedule_srtf",
+    "sweep_grid",
+]
@@ -0,0 +1,5 @@
+# scheduler/__main__.py
+
+from scheduler.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,105 @@
+# scheduler/binary.py
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from scheduler.workload import Schedule, Workload
+
+# Fixed-width little-endian records. The .npy header stores dtype and shape,
+# so the field names double as the format tag (workload vs. schedule).
+JOB_DTYPE = np.dtype([("arrival", "<i4"), ("burst", "<i4")])
+RESULT_DTYPE = np.dtype([("arrival", "<i4"), ("burst", "<i4"), ("start", "<i4"), ("completion", "<i4")])
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Save / load (.npy structured arrays, memory-mapped on load)
+# ──────────────────────────────────────────────────────────────────────────────
+def save_workload(workload, path):
+    """Writes a Workload as a JOB_DTYPE .npy file."""
+    out = open_memmap(path, mode="w+", dtype=JOB_DTYPE, shape=(len(workload),))
+    out["arrival"] = workload.arrival
+    out["burst"] = workload.burst
+    out.flush()
+
+
+def save_schedule(schedule, path):
+    """Writes a Schedule's per-job results as a RESULT_DTYPE .npy file."""
+    out = open_memmap(path, mode="w+", dtype=RESULT_DTYPE, shape=(len(schedule),))
+    out["arrival"] = schedule.workload.arrival
+    out["burst"] = schedule.workload.burst
+    out["start"] = schedule.start
+    out["completion"] = schedule.completion
+    out.flush()
+
+
+def load_records(path, mmap=True):
+    """
+    Opens a workload or schedule .npy file. With mmap=True (default) nothing
+    is read up front: the records are paged in on access.
+    """
+    records = np.load(path, mmap_mode="r" if mmap else None)
+    if records.dtype not in (JOB_DTYPE, RESULT_DTYPE):
+        raise ValueError(f"{path}: not a workload/schedule file (dtype {records.dtype})")
+    return records
+
+
+def load_workload(path, mmap=True):
+    """
+    Returns a Workload whose arrival/burst arrays are zero-copy views into
+    the (memory-mapped) file. Works on both workload and schedule files.
+    """
+    records = load_records(path, mmap)
+    return Workload(records["arrival"], records["burst"])
+
+
+def load_schedule(path, mmap=True):
+    """
+    Returns the Schedule stored by save_schedule. Per-job results only: the
+    Gantt timeline is rebuilt as one segment per job, in start order.
+    """
+    records = load_records(path, mmap)
+    if records.dtype != RESULT_DTYPE:
+        raise ValueError(f"{path}: holds a workload, not schedule results")
+    workload = Workload(records["arrival"], records["burst"])
+    order = np.argsort(records["start"], kind="stable")
+    return Schedule(workload, records["start"], records["completion"], order)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Converters
+# ──────────────────────────────────────────────────────────────────────────────
+def convert_trace(src, dst, chunk_size=None):
+    """
+    Converts a CSV/JSONL trace into a JOB_DTYPE .npy file in two streaming
+    passes (count rows, then fill a pre-sized memmap), so memory stays at
+    one chunk regardless of trace size. Traces that do not fit int32 (see
+    trace.Int32Check) raise ValueError in the first pass, before `dst` is
+    created. Returns the number of jobs.
+    """
+    from scheduler.trace import DEFAULT_CHUNK_SIZE, Int32Check, iter_trace_chunks
+
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    check = Int32Check(src)
+    for _, arrival, burst in iter_trace_chunks(src, chunk_size):
+        check(arrival, burst)
+    n = check.rows
+    out = open_memmap(dst, mode="w+", dtype=JOB_DTYPE, shape=(n,))
+    row = 0
+    for _, arrival, burst in iter_trace_chunks(src, chunk_size):
+        out["arrival"][row:row + len(arrival)] = arrival
+        out["burst"][row:row + len(burst)] = burst
+        row += len(arrival)
+    out.flush()
+    return n
+
+
+def save_dataframe(df, path):
+    """
+    Writes the per-job table returned by compute_sjf (a dict of arrays, or
+    any DataFrame, with columns arrival, burst, start, completion; rows in
+    job order) as a RESULT_DTYPE .npy file.
+    """
+    out = open_memmap(path, mode="w+", dtype=RESULT_DTYPE, shape=(len(df["arrival"]),))
+    for name in RESULT_DTYPE.names:
+        out[name] = np.asarray(df[name])
+    out.flush()
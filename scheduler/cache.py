@@ -0,0 +1,158 @@
+# scheduler/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Bounded LRU + TTL cache for computed runs
+# ──────────────────────────────────────────────────────────────────────────────
+class ResultCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live. At most `maxsize`
+    entries are kept and, with `maxbytes`, at most that many bytes as
+    estimated by `sizeof` (default: estimate_nbytes); the least recently
+    used entry is evicted first. A value larger than `maxbytes` on its own
+    is not kept and evicts nothing else. Sizes are taken when an entry is
+    stored; a value that grows in place afterwards (memoized views, say)
+    must be re-measured with recharge(). Entries older than `ttl` seconds
+    are treated as misses. Hit, miss and eviction counts are kept for
+    monitoring.
+    """
+
+    def __init__(self, maxsize=64, ttl=600.0, clock=time.monotonic, maxbytes=None, sizeof=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.clock = clock
+        self.sizeof = sizeof or estimate_nbytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._data = OrderedDict()  # key -> (expires_at, value, nbytes)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.peek(key) is not None
+
+    def get(self, key, default=None):
+        """Returns the cached value (refreshing its LRU position) or `default`."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                self._discard(key)
+            self.misses += 1
+            return default
+
+    def peek(self, key, fresh=True):
+        """
+        Like get() but without touching LRU order or the counters. With
+        fresh=False an expired entry that has not been dropped yet is still
+        returned.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (not fresh or entry[0] > self.clock()):
+                return entry[1]
+            return None
+
+    def put(self, key, value):
+        nbytes = self.sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._discard(key)
+            if self._too_big(nbytes):
+                return
+            self._data[key] = (self.clock() + self.ttl, value, nbytes)
+            self.nbytes += nbytes
+            self._evict()
+
+    def recharge(self, key):
+        """
+        Re-measures the value cached under `key` after it grew (or shrank) in
+        place and evicts least recently used entries to fit. If it no longer
+        fits on its own, only that entry is dropped. Returns False when `key`
+        is not cached (any more).
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False
+            nbytes = self.sizeof(entry[1])
+            if self._too_big(nbytes):
+                self._discard(key)
+                self.evictions += 1
+                return False
+            self._data[key] = (entry[0], entry[1], nbytes)
+            self.nbytes += nbytes - entry[2]
+            self._data.move_to_end(key)
+            self._evict()
+            return True
+
+    def _too_big(self, nbytes):
+        return self.maxbytes is not None and nbytes > self.maxbytes
+
+    def _evict(self):
+        # Least recently used first; the newest entry fits on its own, so it stays
+        while len(self._data) > self.maxsize or self._too_big(self.nbytes):
+            self._discard(next(iter(self._data)))
+            self.evictions += 1
+
+    def _discard(self, key):
+        self.nbytes -= self._data.pop(key)[2]
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached value for `key`, calling compute() and caching its
+        result on a miss. Concurrent misses on the same key may both compute;
+        the last result wins.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self.nbytes,
+                **({"maxbytes": self.maxbytes} if self.maxbytes is not None else {}),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def estimate_nbytes(value):
+    """
+    Bytes held by the numpy arrays in `value`, found through nested dicts,
+    lists and tuples (e.g. a run's result columns and Gantt segments), plus
+    any other object reporting an integer `nbytes` (e.g. an
+    IncrementalScheduler). Everything else counts as zero.
+    """
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(item) for item in value if not isinstance(item, (int, float, str)))
+    nbytes = getattr(value, "nbytes", None)
+    return int(nbytes) if isinstance(nbytes, (int, np.integer)) else 0
@@ -0,0 +1,270 @@
+# scheduler/cli.py
+"""
+Headless command-line entry point (no Dash, pandas or Tk imports).
+
+    python -m scheduler run   --jobs 1000000 --seed 1 --algorithm srtf
+    python -m scheduler run   --input workload.csv --format json -o metrics.json
+    python -m scheduler run   --jobs 1000000 --cores 64 --queue per-core --steal
+    python -m scheduler run   --jobs 100000 --seed 1 --predict exponential --alpha 0.5
+    python -m scheduler run   --jobs 10000000 --seed 1 --export results.parquet
+    python -m scheduler compare --jobs 10000 --seed 1 --quantum 2
+    python -m scheduler sweep --jobs 100 1000 --rates 0.05 0.1 --trials 500
+    python -m scheduler replay trace.csv --results per_job.csv
+    python -m scheduler replay trace.csv --percentiles --report-every 100000
+    python -m scheduler convert trace.csv trace.npy
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from scheduler.engine import ALGORITHMS, compare, iter_sjf, run_schedule
+from scheduler.generate import ARRIVAL_PROCESSES, BURST_DISTRIBUTIONS, generate_history, generate_workload
+from scheduler.metrics import bucket_table, fairness_report
+from scheduler.multicore import QUEUE_MODES, schedule_multicore
+from scheduler.online import OnlineScheduler
+from scheduler.predict import DEFAULT_ALPHA, ESTIMATORS, evaluate_prediction
+from scheduler.trace import DEFAULT_CHUNK_SIZE, iter_jobs, read_workload, summarize, write_results
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m scheduler", description="CPU scheduling simulator (headless).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    # ------- run: one workload, one policy -------
+    run = sub.add_parser("run", help="schedule one workload and print its metrics")
+    source = run.add_mutually_exclusive_group()
+    source.add_argument("--input", metavar="FILE", help="workload file (.csv, .jsonl or .npy) instead of generating one")
+    source.add_argument("--jobs", type=int, default=4, help="number of jobs to generate (default: 4)")
+    _add_generator_args(run)
+    run.add_argument("--algorithm", choices=list(ALGORITHMS), default="sjf")
+    _add_policy_args(run)
+    run.add_argument("--cores", type=int, default=1, help="simulated processors (default: 1; >1 supports sjf and fcfs)")
+    run.add_argument("--queue", choices=QUEUE_MODES, default="global", help="ready queue layout for --cores > 1")
+    run.add_argument("--steal", action="store_true", help="let idle cores steal from other per-core queues")
+    run.add_argument("--predict", choices=list(ESTIMATORS), default=None,
+                     help="order SJF by bursts predicted from a generated history; report error vs oracle SJF")
+    run.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="exponential averaging weight (default: 0.5)")
+    run.add_argument("--history", type=int, default=8, help="past bursts per job for --predict (default: 8)")
+    run.add_argument("--noise", type=float, default=0.5,
+                     help="log-normal spread of past bursts around the actual one (default: 0.5)")
+    run.add_argument("--tails", action="store_true",
+                     help="add p50/p95/p99/max WT, response and slowdown, Jain's index and starvation "
+                          "(per-burst-bucket table in JSON output)")
+    run.add_argument("--export", metavar="FILE",
+                     help="also write per-job results and the timeline to FILE (.parquet or .arrow; needs pyarrow)")
+    _add_output_args(run)
+
+    # ------- compare: one workload, every policy -------
+    comp = sub.add_parser("compare", help="run several policies over the same workload side by side")
+    source = comp.add_mutually_exclusive_group()
+    source.add_argument("--input", metavar="FILE", help="workload file (.csv, .jsonl or .npy) instead of generating one")
+    source.add_argument("--jobs", type=int, default=4, help="number of jobs to generate (default: 4)")
+    _add_generator_args(comp)
+    comp.add_argument("--algorithms", choices=list(ALGORITHMS), nargs="+", default=list(ALGORITHMS))
+    _add_policy_args(comp)
+    _add_output_args(comp)
+
+    # ------- sweep: parameter grid over a process pool -------
+    sweep = sub.add_parser("sweep", help="run seeded trials over a parameter grid")
+    sweep.add_argument("--jobs", type=int, nargs="+", default=[100, 1000])
+    sweep.add_argument("--rates", type=float, nargs="+", default=[0.1])
+    sweep.add_argument("--bursts", choices=BURST_DISTRIBUTIONS, nargs="+", default=["uniform"])
+    sweep.add_argument("--arrival", choices=ARRIVAL_PROCESSES, default="poisson")
+    sweep.add_argument("--trials", type=int, default=100)
+    sweep.add_argument("--algorithm", choices=list(ALGORITHMS), default="sjf")
+    sweep.add_argument("--seed", type=int, default=0)
+    sweep.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    sweep.add_argument("--chunksize", type=int, default=16, help="trials per task (default: 16)")
+    _add_output_args(sweep)
+
+    # ------- replay: stream a large trace through SJF -------
+    replay = sub.add_parser("replay", help="stream a .csv/.jsonl trace (sorted by arrival) through SJF")
+    replay.add_argument("trace", help="trace file with id, arrival, burst columns")
+    replay.add_argument("--results", metavar="FILE", help="write per-job results (CSV) as jobs complete")
+    replay.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows read per chunk")
+    replay.add_argument("--percentiles", action="store_true", help="also report WT/TAT std, p50/p95/p99 and max")
+    replay.add_argument("--report-every", type=int, default=0, metavar="N",
+                        help="print rolling WT/TAT metrics to stderr every N completions")
+    _add_output_args(replay)
+
+    # ------- convert: text trace → memory-mappable binary -------
+    convert = sub.add_parser("convert", help="convert a .csv/.jsonl trace to the binary .npy format")
+    convert.add_argument("src", help="source trace (.csv or .jsonl)")
+    convert.add_argument("dst", help="destination .npy file")
+    convert.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows read per chunk")
+    _add_output_args(convert)
+
+    return parser
+
+
+def _add_generator_args(parser):
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--arrival", choices=ARRIVAL_PROCESSES, default="uniform")
+    parser.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--rate", type=float, default=1.0, help="arrival rate for poisson/bursty arrivals")
+
+
+def _add_policy_args(parser):
+    parser.add_argument("--quantum", type=int, default=4, help="time slice for rr (default: 4)")
+    parser.add_argument("--aging", type=float, default=0.1, help="priority aging per time unit waited (default: 0.1)")
+
+
+def _add_output_args(parser):
+    parser.add_argument("-o", "--output", metavar="FILE", help="write metrics here instead of stdout")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Commands
+# ──────────────────────────────────────────────────────────────────────────────
+def _load_workload(args):
+    if args.input:
+        return read_workload(args.input)
+    return generate_workload(args.jobs, args.seed, args.arrival, args.burst, rate=args.rate)
+
+
+def _policy_params(args, algorithm):
+    if algorithm == "rr":
+        return {"quantum": args.quantum}
+    if algorithm == "priority":
+        return {"aging": args.aging}
+    return {}
+
+
+def cmd_run(args):
+    if args.export:
+        from scheduler.export import detect_format
+
+        detect_format(args.export)  # fail before scheduling, not after
+    workload = _load_workload(args)
+
+    multicore = args.cores > 1 or args.queue != "global" or args.steal
+    if args.predict and (multicore or args.algorithm != "sjf"):
+        raise ValueError("--predict runs single-core sjf only")
+    report = None
+    t0 = time.perf_counter()
+    if multicore:
+        schedule = schedule_multicore(workload, args.cores, args.queue, args.steal, args.algorithm)
+    elif args.predict:
+        history_seed = None if args.seed is None else [args.seed, 1]
+        history = generate_history(workload, args.history, args.noise, history_seed)
+        params = {"alpha": args.alpha} if args.predict == "exponential" else {}
+        schedule, report = evaluate_prediction(workload, history, args.predict, **params)
+    else:
+        schedule = run_schedule(workload, args.algorithm, **_policy_params(args, args.algorithm))
+    elapsed = time.perf_counter() - t0
+
+    result = {"algorithm": args.algorithm, **schedule.summary(), "schedule_seconds": elapsed}
+    if report is not None:
+        result.update(report)
+    if multicore:
+        result["utilization"] = [round(u, 4) for u in schedule.utilization().tolist()]
+    if args.tails:
+        arrays = (schedule.workload.burst, schedule.wt, schedule.response, schedule.tat)
+        result.update(fairness_report(*arrays))
+        if args.format == "json":
+            result["buckets"] = bucket_table(*arrays)
+    if args.export:
+        from scheduler.export import export_schedule
+
+        metadata = {"algorithm": args.algorithm, "seed": args.seed, "input": args.input}
+        if multicore:
+            metadata.update(queue=args.queue, steal=args.steal)
+        elif args.predict:
+            metadata["prediction"] = report
+        else:
+            metadata.update(_policy_params(args, args.algorithm))
+        t0 = time.perf_counter()
+        result["export_format"] = export_schedule(schedule, args.export, metadata)
+        result["export_seconds"] = time.perf_counter() - t0
+    return result
+
+
+def cmd_compare(args):
+    workload = _load_workload(args)
+    results = compare(workload, args.algorithms, quantum=args.quantum, aging=args.aging)
+    return [{"algorithm": name, **summary} for name, summary in results.items()]
+
+
+def cmd_sweep(args):
+    from scheduler.sweep import run_sweep, sweep_grid
+
+    grid = sweep_grid(args.jobs, args.rates, args.bursts, args.arrival)
+    return run_sweep(grid, args.trials, args.algorithm, args.seed, args.workers, args.chunksize)
+
+
+def cmd_replay(args):
+    jobs = iter_jobs(args.trace, args.chunk_size)
+    online = None
+    if args.percentiles or args.report_every:
+        online = OnlineScheduler()
+        results = online.feed(jobs)
+        if args.report_every:
+            results = _report_every(results, online, args.report_every)
+    else:
+        results = iter_sjf(jobs)
+
+    if not args.results:
+        summary = summarize(results)
+    else:
+        with open(args.results, "w") as fh:
+            summary = write_results(results, fh)
+    if online is not None:
+        summary.update(
+            (k, v) for k, v in online.metrics().items() if k.startswith(("wt_", "tat_")) and not k.endswith("_mean")
+        )
+    return summary
+
+
+def _report_every(results, online, every):
+    """Passes results through, writing the scheduler's rolling metrics to stderr every `every` jobs."""
+    for count, result in enumerate(results, 1):
+        yield result
+        if not count % every:
+            sys.stderr.write(json.dumps(online.metrics()) + "\n")
+
+
+def cmd_convert(args):
+    from scheduler.binary import convert_trace
+
+    return {"jobs": convert_trace(args.src, args.dst, args.chunk_size), "output": args.dst}
+
+
+COMMANDS = {"run": cmd_run, "compare": cmd_compare, "sweep": cmd_sweep, "replay": cmd_replay, "convert": cmd_convert}
+
+
+def format_text(result):
+    """Renders a metrics dict as 'key: value' lines, or a list of dicts as a table."""
+    if isinstance(result, dict):
+        return "\n".join(f"{key}: {_fmt(value)}" for key, value in result.items())
+    if not result:
+        return ""
+    keys = list(result[0])
+    rows = [[_fmt(row[key]) for key in keys] for row in result]
+    widths = [max(len(key), *(len(r[i]) for r in rows)) for i, key in enumerate(keys)]
+    lines = ["  ".join(key.rjust(w) for key, w in zip(keys, widths))]
+    lines += ["  ".join(cell.rjust(w) for cell, w in zip(r, widths)) for r in rows]
+    return "\n".join(lines)
+
+
+def _fmt(value):
+    return f"{value:.4f}" if isinstance(value, float) else str(value)
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        result = COMMANDS[args.command](args)
+    except (ImportError, OSError, OverflowError, ValueError) as exc:
+        parser.exit(2, f"{parser.prog}: error: {exc}\n")
+
+    text = json.dumps(result, indent=2) if args.format == "json" else format_text(result)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+    return 0
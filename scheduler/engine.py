@@ -0,0 +1,466 @@
+# scheduler/engine.py
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from scheduler.profiling import record_schedule
+from scheduler.workload import Schedule
+
+PROGRESS_EVERY = 8192  # dispatches between progress callbacks
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Non-preemptive SJF
+# ──────────────────────────────────────────────────────────────────────────────
+def schedule_sjf(workload, progress=None, predicted=None):
+    """
+    Runs non-preemptive SJF over a Workload and returns a Schedule.
+
+    Jobs are pre-sorted by arrival once; arrived jobs wait in a min-heap keyed
+    by (burst, arrival, id), so the whole run is O(n log n). If `predicted`
+    (one burst estimate per job) is given, the heap is keyed by it instead:
+    SJF as it runs in practice, where jobs still take their actual burst.
+
+    If given, progress(done, total) is called every PROGRESS_EVERY dispatches;
+    it may raise to abort the run.
+    """
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    key = burst if predicted is None else np.asarray(predicted, dtype=np.float64).tolist()
+    if len(key) != n:
+        raise ValueError("predicted must have one entry per job")
+    start = [0] * n
+    completion = [0] * n
+    order = []
+
+    # 1) Job indices by arrival (stable, so ties keep index order)
+    by_arrival = workload.arrival_order().tolist()
+
+    # 2) Dispatch loop
+    ready = []
+    nxt = 0
+    time = 0
+    while nxt < n or ready:
+        # a) Nothing ready → jump to the next arrival
+        if not ready and arrival[by_arrival[nxt]] > time:
+            time = arrival[by_arrival[nxt]]
+
+        # b) Move every job that has arrived by `time` into the ready heap
+        while nxt < n and arrival[by_arrival[nxt]] <= time:
+            i = by_arrival[nxt]
+            heapq.heappush(ready, (key[i], arrival[i], i))
+            nxt += 1
+
+        # c) Run the shortest (or shortest-predicted) ready job to completion
+        _, _, i = heapq.heappop(ready)
+        order.append(i)
+        start[i] = time
+        time += burst[i]
+        completion[i] = time
+
+        if progress is not None and not len(order) % PROGRESS_EVERY:
+            progress(len(order), n)
+
+    return Schedule(workload, start, completion, order, heap_ops=2 * n)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Preemptive SRTF (discrete-event core)
+# ──────────────────────────────────────────────────────────────────────────────
+_COMPLETION = 0  # sorts before an arrival at the same instant
+_ARRIVAL = 1
+
+
+def schedule_srtf(workload, progress=None):
+    """
+    Runs preemptive Shortest-Remaining-Time-First over a Workload and returns
+    a Schedule with a segmented Gantt timeline.
+
+    The simulation is driven by a priority queue of (time, kind, job, token)
+    events: every job contributes one arrival event, and each dispatch
+    schedules one completion event. A preemption invalidates the pending
+    completion by bumping `token`, so stale events are skipped when popped.
+    Cost is O(events · log n) and does not depend on simulated time units.
+    progress(done, total) is called as for schedule_sjf, counting completions.
+    """
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    remaining = list(burst)
+    start = [-1] * n
+    completion = [0] * n
+    order = []
+    seg_job, seg_start, seg_end = [], [], []
+
+    # 1) Seed the event queue with every arrival
+    events = [(a, _ARRIVAL, i, 0) for i, a in enumerate(arrival)]
+    heapq.heapify(events)
+
+    ready = []  # (remaining, arrival, id)
+    running = -1
+    run_since = 0
+    token = 0
+    finished = 0
+
+    # 2) Event loop
+    while events:
+        time, kind, i, tok = heapq.heappop(events)
+
+        # a) Apply the event
+        if kind == _COMPLETION:
+            # (a stale token means the job was preempted since; ignore it)
+            if tok == token:
+                seg_job.append(i)
+                seg_start.append(run_since)
+                seg_end.append(time)
+                completion[i] = time
+                remaining[i] = 0
+                running = -1
+                finished += 1
+                if progress is not None and not finished % PROGRESS_EVERY:
+                    progress(finished, n)
+        else:
+            heapq.heappush(ready, (remaining[i], arrival[i], i))
+
+        # b) Handle every event at this instant before making a decision
+        if events and events[0][0] == time:
+            continue
+
+        # c) Preempt the running job if a ready job has less work left
+        if running >= 0:
+            left = remaining[running] - (time - run_since)
+            if not ready or ready[0] >= (left, arrival[running], running):
+                continue
+            if time > run_since:
+                seg_job.append(running)
+                seg_start.append(run_since)
+                seg_end.append(time)
+            remaining[running] = left
+            heapq.heappush(ready, (left, arrival[running], running))
+            running = -1
+
+        # d) Dispatch the job with the shortest remaining time
+        if ready:
+            left, _, running = heapq.heappop(ready)
+            run_since = time
+            if start[running] < 0:
+                start[running] = time
+                order.append(running)
+            token += 1
+            heapq.heappush(events, (time + left, _COMPLETION, running, token))
+
+    # Heap operations: each of the `token` dispatches is one ready pop (matched
+    # by one ready push) plus one completion event pushed and popped; the n
+    # arrival events were heapified, then popped
+    return Schedule(workload, start, completion, order, (seg_job, seg_start, seg_end), heap_ops=n + 4 * token)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# First-Come First-Served (vectorized)
+# ──────────────────────────────────────────────────────────────────────────────
+def schedule_fcfs(workload, progress=None):
+    """
+    Runs FCFS over a Workload and returns a Schedule.
+
+    With jobs in arrival order, completion[k] = max(completion[k-1], a[k]) + b[k].
+    Writing S[k] for the running burst total, this unrolls to
+    completion[k] = S[k] + max(0, max over j<=k of (a[j] - S[j-1])), which is
+    one cumsum and one maximum.accumulate — no Python loop at all.
+    `progress` is accepted for interface parity; the run is a single step.
+    """
+    order = workload.arrival_order()
+    a = workload.arrival[order].astype(np.int64)
+    b = workload.burst[order].astype(np.int64)
+    total = np.cumsum(b)
+    idle = np.maximum.accumulate(a - (total - b))
+    done = total + np.maximum(idle, 0)
+
+    start = np.empty(len(workload), dtype=np.int64)
+    completion = np.empty(len(workload), dtype=np.int64)
+    start[order] = done - b
+    completion[order] = done
+    return Schedule(workload, start, completion, order, heap_ops=0)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Round Robin
+# ──────────────────────────────────────────────────────────────────────────────
+def schedule_rr(workload, progress=None, quantum=4):
+    """
+    Runs Round Robin with a fixed time quantum over a Workload and returns a
+    Schedule with a segmented Gantt timeline.
+
+    Jobs that arrive while a slice is running join the queue ahead of the
+    preempted job. A job that is alone in the system keeps the CPU for as
+    many whole quanta as it takes to reach the next arrival, so idle stretches
+    and long solo bursts cost one step instead of one per quantum.
+    """
+    if quantum < 1:
+        raise ValueError("quantum must be at least 1")
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    remaining = workload.burst.tolist()
+    by_arrival = workload.arrival_order().tolist()
+    start = [-1] * n
+    completion = [0] * n
+    order = []
+    seg_job, seg_start, seg_end = [], [], []
+
+    queue = deque()
+    nxt = 0
+    time = 0
+    finished = 0
+    while nxt < n or queue:
+        # a) Nothing queued → jump to the next arrival
+        if not queue and arrival[by_arrival[nxt]] > time:
+            time = arrival[by_arrival[nxt]]
+
+        # b) Admit every job that has arrived by `time`
+        while nxt < n and arrival[by_arrival[nxt]] <= time:
+            queue.append(by_arrival[nxt])
+            nxt += 1
+
+        # c) Run the head of the queue for one slice
+        i = queue.popleft()
+        if start[i] < 0:
+            start[i] = time
+            order.append(i)
+        run = min(quantum, remaining[i])
+        if not queue and run < remaining[i]:
+            # Alone: run whole quanta up to the next arrival (or to the end)
+            if nxt < n:
+                quanta = -(-(arrival[by_arrival[nxt]] - time) // quantum)
+                run = min(remaining[i], quanta * quantum)
+            else:
+                run = remaining[i]
+        if seg_job and seg_job[-1] == i and seg_end[-1] == time:
+            seg_end[-1] = time + run
+        else:
+            seg_job.append(i)
+            seg_start.append(time)
+            seg_end.append(time + run)
+        time += run
+        remaining[i] -= run
+
+        # d) Arrivals during the slice queue up before the preempted job
+        while nxt < n and arrival[by_arrival[nxt]] <= time:
+            queue.append(by_arrival[nxt])
+            nxt += 1
+        if remaining[i]:
+            queue.append(i)
+        else:
+            completion[i] = time
+            finished += 1
+            if progress is not None and not finished % PROGRESS_EVERY:
+                progress(finished, n)
+
+    return Schedule(workload, start, completion, order, (seg_job, seg_start, seg_end), heap_ops=0)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Priority with aging
+# ──────────────────────────────────────────────────────────────────────────────
+def schedule_priority(workload, progress=None, aging=0.1):
+    """
+    Runs non-preemptive priority scheduling with linear aging over a Workload
+    and returns a Schedule. Lower priority values run first.
+
+    A job's effective priority at time t is priority - aging * (t - arrival).
+    Since t is common to every waiting job, ranking by priority + aging *
+    arrival gives the same order at any instant, so the ready heap keys never
+    need updating and the run stays O(n log n).
+    """
+    if aging < 0:
+        raise ValueError("aging must be non-negative")
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    key = (workload.priority + aging * workload.arrival.astype(np.float64)).tolist()
+    by_arrival = workload.arrival_order().tolist()
+    start = [0] * n
+    completion = [0] * n
+    order = []
+
+    ready = []
+    nxt = 0
+    time = 0
+    while nxt < n or ready:
+        # a) Nothing ready → jump to the next arrival
+        if not ready and arrival[by_arrival[nxt]] > time:
+            time = arrival[by_arrival[nxt]]
+
+        # b) Admit every job that has arrived by `time`
+        while nxt < n and arrival[by_arrival[nxt]] <= time:
+            i = by_arrival[nxt]
+            heapq.heappush(ready, (key[i], arrival[i], i))
+            nxt += 1
+
+        # c) Run the most urgent ready job to completion
+        _, _, i = heapq.heappop(ready)
+        order.append(i)
+        start[i] = time
+        time += burst[i]
+        completion[i] = time
+
+        if progress is not None and not len(order) % PROGRESS_EVERY:
+            progress(len(order), n)
+
+    return Schedule(workload, start, completion, order, heap_ops=2 * n)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Highest Response Ratio Next
+# ──────────────────────────────────────────────────────────────────────────────
+def schedule_hrrn(workload, progress=None):
+    """
+    Runs non-preemptive HRRN over a Workload and returns a Schedule.
+
+    The response ratio (wait + burst) / burst changes with time, but among
+    ready jobs with the same burst the earliest arrival always has the
+    highest ratio. Ready jobs are therefore kept in one FIFO per distinct
+    burst, and each decision is a vectorized argmax over the bucket heads:
+    O(n · distinct bursts) in numpy rather than O(n²) in Python. Ties go to
+    the shorter burst.
+    """
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    by_arrival = workload.arrival_order().tolist()
+    start = [0] * n
+    completion = [0] * n
+    order = []
+
+    # 1) One bucket per distinct burst; head_arrival is inf for empty buckets
+    values, slot = np.unique(workload.burst, return_inverse=True)
+    values = values.astype(np.float64)
+    slot = slot.tolist()
+    buckets = [deque() for _ in range(len(values))]
+    head_arrival = np.full(len(values), np.inf)
+
+    # 2) Dispatch loop
+    waiting = 0
+    nxt = 0
+    time = 0
+    while nxt < n or waiting:
+        # a) Nothing ready → jump to the next arrival
+        if not waiting and arrival[by_arrival[nxt]] > time:
+            time = arrival[by_arrival[nxt]]
+
+        # b) Admit every job that has arrived by `time`
+        while nxt < n and arrival[by_arrival[nxt]] <= time:
+            i = by_arrival[nxt]
+            bucket = buckets[slot[i]]
+            if not bucket:
+                head_arrival[slot[i]] = arrival[i]
+            bucket.append(i)
+            waiting += 1
+            nxt += 1
+
+        # c) Run the bucket head with the highest response ratio
+        k = int(np.argmax((time - head_arrival) / values))
+        bucket = buckets[k]
+        i = bucket.popleft()
+        head_arrival[k] = arrival[bucket[0]] if bucket else np.inf
+        waiting -= 1
+        order.append(i)
+        start[i] = time
+        time += burst[i]
+        completion[i] = time
+
+        if progress is not None and not len(order) % PROGRESS_EVERY:
+            progress(len(order), n)
+
+    return Schedule(workload, start, completion, order, heap_ops=0)
+
+
+ALGORITHMS = {
+    "fcfs": schedule_fcfs,
+    "sjf": schedule_sjf,
+    "srtf": schedule_srtf,
+    "rr": schedule_rr,
+    "priority": schedule_priority,
+    "hrrn": schedule_hrrn,
+}
+
+
+def run_schedule(workload, algorithm="sjf", progress=None, stats=None, **params):
+    """
+    Runs the named policy from ALGORITHMS over a Workload. Extra keyword
+    arguments are policy parameters (quantum for rr, aging for priority,
+    predicted for sjf). If a profiling.Stats is given, the run is timed as
+    the "schedule" stage and its counters are recorded.
+    """
+    try:
+        policy = ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"unknown algorithm {algorithm!r}; expected one of {tuple(ALGORITHMS)}") from None
+    if stats is None:
+        return policy(workload, progress, **params)
+    with stats.stage("schedule"):
+        schedule = policy(workload, progress, **params)
+    record_schedule(stats, schedule)
+    return schedule
+
+
+def _offset_progress(progress, k, count):
+    """Maps one policy's progress(done, total) onto policy k of `count`."""
+    return lambda done, total: progress(k + done / total, count)
+
+
+def compare(workload, algorithms=None, progress=None, quantum=4, aging=0.1):
+    """
+    Runs several policies over the same Workload and returns
+    {algorithm: Schedule.summary()} in the order given (default: ALGORITHMS).
+
+    The workload's arrival order is sorted once and shared by every policy.
+    progress(done, total) is forwarded with done counted in whole policies,
+    so a caller can cancel between or during runs.
+    """
+    algorithms = list(algorithms or ALGORITHMS)
+    params = {"rr": {"quantum": quantum}, "priority": {"aging": aging}}
+    results = {}
+    for k, name in enumerate(algorithms):
+        step = None if progress is None else _offset_progress(progress, k, len(algorithms))
+        results[name] = run_schedule(workload, name, step, **params.get(name, {})).summary()
+        if progress is not None:
+            progress(k + 1, len(algorithms))
+    return results
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Streaming non-preemptive SJF
+# ──────────────────────────────────────────────────────────────────────────────
+def iter_sjf(jobs):
+    """
+    Streaming non-preemptive SJF. Consumes an iterable of (id, arrival, burst)
+    tuples in arrival order and yields (id, arrival, burst, start, completion)
+    as each job completes.
+
+    Only the ready heap and one look-ahead job are held in memory, so memory
+    is bounded by the ready-queue length, not by the trace length. For jobs
+    numbered in file order it yields the same schedule as schedule_sjf.
+    """
+    jobs = iter(jobs)
+    pending = next(jobs, None)
+    ready = []
+    seq = 0
+    time = 0
+    while pending is not None or ready:
+        # a) Nothing ready → jump to the next arrival
+        if not ready and pending[1] > time:
+            time = pending[1]
+
+        # b) Admit every job that has arrived by `time`
+        while pending is not None and pending[1] <= time:
+            job, a, b = pending
+            heapq.heappush(ready, (b, a, seq, job))
+            seq += 1
+            pending = next(jobs, None)
+
+        # c) Run the shortest ready job to completion
+        b, a, _, job = heapq.heappop(ready)
+        yield job, a, b, time, time + b
+        time += b
@@ -0,0 +1,201 @@
+# scheduler/export.py
+"""
+Per-job results and Gantt timelines as compressed Parquet or Arrow IPC
+files, for offline analysis (pandas, polars, DuckDB, Spark, ...) and for
+reopening a finished run without recomputing it.
+
+One row per job with int32 columns arrival, burst, start, completion, tat,
+wt and response (plus priority and, for multi-core runs, core). Preemptive
+runs add a `segments` column, list<struct<start, end>>, holding the job's
+CPU bursts in time order. Run parameters travel as JSON in the schema
+metadata under the "sjf" key.
+
+pyarrow is imported on first use, so importing this module costs nothing.
+"""
+
+import json
+
+import numpy as np
+
+from scheduler.workload import Schedule, Workload
+
+FORMATS = {".parquet": "parquet", ".pq": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow"}
+DEFAULT_COMPRESSION = "zstd"
+RESULT_COLUMNS = ("arrival", "burst", "start", "completion", "tat", "wt", "response")
+OPTIONAL_COLUMNS = ("priority", "core")
+METADATA_KEY = b"sjf"
+
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_MAGIC = b"ARROW1"
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet/Arrow export needs pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+def detect_format(path):
+    """Returns 'parquet' or 'arrow' from a file name's extension."""
+    for ext, fmt in FORMATS.items():
+        if str(path).lower().endswith(ext):
+            return fmt
+    raise ValueError(f"{path}: unknown extension; expected one of {tuple(FORMATS)}")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Export
+# ──────────────────────────────────────────────────────────────────────────────
+def results_table(columns, segments=None, metadata=None):
+    """
+    Builds the pyarrow Table for a dict of per-job arrays (RESULT_COLUMNS,
+    plus any OPTIONAL_COLUMNS present). int32 arrays are wrapped without
+    copying. `segments` (job, start, end arrays in time order) becomes the
+    list column, laid out with one stable argsort by job and an offsets
+    array from the per-job counts; it is left out when every job ran in a
+    single piece, since start/completion already say it all.
+    """
+    pa = _pyarrow()
+    names = [name for name in RESULT_COLUMNS + OPTIONAL_COLUMNS if name in columns]
+    arrays = [pa.array(np.ascontiguousarray(columns[name], dtype=np.int32)) for name in names]
+    n = len(columns["arrival"])
+
+    if segments is not None and len(segments[0]) != n:
+        job, start, end = (np.asarray(col, dtype=np.int32) for col in segments)
+        by_job = np.argsort(job, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(job, minlength=n), out=offsets[1:])
+        pieces = pa.StructArray.from_arrays([pa.array(start[by_job]), pa.array(end[by_job])], names=["start", "end"])
+        names.append("segments")
+        arrays.append(pa.ListArray.from_arrays(pa.array(offsets), pieces))
+
+    schema_metadata = {METADATA_KEY: json.dumps(metadata or {}).encode()}
+    return pa.Table.from_arrays(arrays, names=names).replace_schema_metadata(schema_metadata)
+
+
+def export_results(columns, dest, segments=None, metadata=None, format=None, compression=DEFAULT_COMPRESSION):
+    """
+    Writes per-job results (see results_table) to `dest`, a path or a
+    binary file object. The format is taken from the path's extension
+    unless given; compression applies per column (Parquet) or per buffer
+    (Arrow IPC). Returns the format written.
+    """
+    pa = _pyarrow()
+    format = format or detect_format(dest)
+    table = results_table(columns, segments, metadata)
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        # Sorted, high-cardinality integers: skip the dictionary pass
+        pq.write_table(table, dest, compression=compression, use_dictionary=False)
+    elif format == "arrow":
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.ipc.new_file(dest, table.schema, options=options) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"unknown format {format!r}; expected 'parquet' or 'arrow'")
+    return format
+
+
+def export_schedule(schedule, dest, metadata=None, format=None, compression=DEFAULT_COMPRESSION):
+    """Writes a Schedule (or MultiCoreSchedule) with export_results."""
+    columns = {
+        "arrival": schedule.workload.arrival,
+        "burst": schedule.workload.burst,
+        "start": schedule.start,
+        "completion": schedule.completion,
+        "tat": schedule.tat,
+        "wt": schedule.wt,
+        "response": schedule.response,
+        "priority": schedule.workload.priority,
+    }
+    segments = schedule.segments
+    if hasattr(schedule, "core"):
+        columns["core"] = schedule.core
+        metadata = {"cores": schedule.cores, "steals": schedule.steals, **(metadata or {})}
+        segments = None
+    return export_results(columns, dest, segments, metadata, format, compression)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Import
+# ──────────────────────────────────────────────────────────────────────────────
+def read_table(source):
+    """
+    Opens a results file written by export_results: a path (memory-mapped),
+    bytes, or a binary file object. The format is sniffed from the magic
+    bytes, so the extension does not matter.
+    """
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = pa.BufferReader(source)
+    elif isinstance(source, str):
+        source = pa.memory_map(source)
+    head = source.read(6)
+    source.seek(0)
+    if head[:4] == _PARQUET_MAGIC:
+        return pq.read_table(source)
+    if head == _ARROW_MAGIC:
+        return pa.ipc.open_file(source).read_all()
+    raise ValueError("not a Parquet or Arrow IPC file")
+
+
+def _numpy(column):
+    # Single-chunk, null-free int32 columns come back as views, not copies
+    array = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+    return array.to_numpy(zero_copy_only=False)
+
+
+def import_results(source):
+    """
+    Reads a results file. Returns (columns, segments, metadata): a dict of
+    per-job numpy arrays, the (job, start, end) timeline in time order (None
+    when the file has no segments column) and the run metadata dict.
+    """
+    table = read_table(source)
+    missing = [name for name in ("arrival", "burst", "start", "completion") if name not in table.column_names]
+    if missing:
+        raise ValueError(f"not a results file: missing column(s) {', '.join(missing)}")
+    columns = {
+        name: _numpy(table.column(name))
+        for name in RESULT_COLUMNS + OPTIONAL_COLUMNS
+        if name in table.column_names
+    }
+    metadata = json.loads((table.schema.metadata or {}).get(METADATA_KEY, b"{}"))
+
+    segments = None
+    if "segments" in table.column_names:
+        lists = table.column("segments").combine_chunks()
+        offsets = lists.offsets.to_numpy()
+        offsets = offsets - offsets[0]
+        pieces = lists.flatten().flatten()
+        job = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+        start, end = (p.to_numpy(zero_copy_only=False) for p in pieces)
+        by_time = np.argsort(start, kind="stable")
+        segments = (job[by_time], start[by_time], end[by_time])
+    return columns, segments, metadata
+
+
+def import_schedule(source):
+    """
+    Reads a results file back into a Schedule (a MultiCoreSchedule when it
+    has a core column) without rescheduling. Returns (schedule, metadata).
+    """
+    columns, segments, metadata = import_results(source)
+    workload = Workload(columns["arrival"], columns["burst"], columns.get("priority"))
+    order = np.argsort(columns["start"], kind="stable")
+    if "core" in columns:
+        from scheduler.multicore import MultiCoreSchedule
+
+        core = columns["core"]
+        cores = metadata.get("cores") or (int(core.max()) + 1 if len(core) else 1)
+        schedule = MultiCoreSchedule(
+            workload, columns["start"], columns["completion"], order, core, cores, metadata.get("steals", 0)
+        )
+    else:
+        schedule = Schedule(workload, columns["start"], columns["completion"], order, segments)
+    return schedule, metadata
@@ -0,0 +1,102 @@
+# scheduler/generate.py
+
+import numpy as np
+
+from scheduler.workload import Workload
+
+ARRIVAL_PROCESSES = ("uniform", "poisson", "bursty")
+BURST_DISTRIBUTIONS = ("uniform", "exponential", "pareto")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Random workload generation (vectorized, seeded)
+# ──────────────────────────────────────────────────────────────────────────────
+def generate_workload(
+    n,
+    seed=None,
+    arrival="uniform",
+    burst="uniform",
+    *,
+    max_arrival=30,
+    rate=1.0,
+    batch_size=8,
+    jitter=2,
+    min_burst=1,
+    max_burst=30,
+    mean_burst=10.0,
+    pareto_shape=1.5,
+    burst_cap=1_000_000,
+    priority_levels=10,
+):
+    """
+    Generates a Workload of n jobs in a single vectorized call.
+
+    Arrival processes:
+      - "uniform": integer arrivals in [0, max_arrival] (the original behaviour)
+      - "poisson": exponential inter-arrival times with mean 1/rate
+      - "bursty":  batches of ~batch_size jobs; batches arrive as a Poisson
+                   process with the same overall rate, each job offset by up
+                   to `jitter` time units
+    Burst distributions:
+      - "uniform":     integer bursts in [min_burst, max_burst] (original)
+      - "exponential": exponential with mean `mean_burst`
+      - "pareto":      heavy-tailed Pareto with scale min_burst and shape
+                       `pareto_shape`
+    Non-uniform bursts are rounded to integers and clipped to
+    [min_burst, burst_cap]. Priorities are uniform in [0, priority_levels).
+
+    The same seed always yields the same workload.
+    """
+    rng = np.random.default_rng(seed)
+    arrivals = _arrivals(rng, n, arrival, max_arrival, rate, batch_size, jitter)
+    bursts = _bursts(rng, n, burst, min_burst, max_burst, mean_burst, pareto_shape, burst_cap)
+    # Drawn last so arrivals and bursts stay the same for a given seed
+    priorities = rng.integers(0, priority_levels, size=n, dtype=np.int32)
+    return Workload(arrivals, bursts, priorities)
+
+
+def _arrivals(rng, n, kind, max_arrival, rate, batch_size, jitter):
+    if kind == "uniform":
+        return rng.integers(0, max_arrival + 1, size=n, dtype=np.int32)
+    if kind == "poisson":
+        gaps = rng.exponential(1.0 / rate, size=n)
+        return np.floor(np.cumsum(gaps)).astype(np.int32)
+    if kind == "bursty":
+        # Job k opens a new batch with probability 1/batch_size (job 0 always does)
+        new_batch = rng.random(n) < 1.0 / batch_size
+        if n:
+            new_batch[0] = True
+        batch = np.cumsum(new_batch) - 1
+        n_batches = int(batch[-1]) + 1 if n else 0
+        batch_times = np.cumsum(rng.exponential(batch_size / rate, size=n_batches))
+        offsets = rng.integers(0, jitter + 1, size=n)
+        return (np.floor(batch_times)[batch] + offsets).astype(np.int32)
+    raise ValueError(f"unknown arrival process {kind!r}; expected one of {ARRIVAL_PROCESSES}")
+
+
+def _bursts(rng, n, kind, min_burst, max_burst, mean_burst, pareto_shape, burst_cap):
+    if kind == "uniform":
+        return rng.integers(min_burst, max_burst + 1, size=n, dtype=np.int32)
+    if kind == "exponential":
+        raw = np.ceil(rng.exponential(mean_burst, size=n))
+    elif kind == "pareto":
+        raw = np.floor((rng.pareto(pareto_shape, size=n) + 1.0) * min_burst)
+    else:
+        raise ValueError(f"unknown burst distribution {kind!r}; expected one of {BURST_DISTRIBUTIONS}")
+    return np.clip(raw, min_burst, burst_cap).astype(np.int32)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Burst histories (for burst-time prediction)
+# ──────────────────────────────────────────────────────────────────────────────
+def generate_history(workload, length=8, noise=0.5, seed=None):
+    """
+    Generates an (n, length) int32 array of past bursts per job, oldest
+    first. Each past burst is the job's actual burst scaled by an
+    independent log-normal factor exp(N(0, noise)), rounded and at least 1,
+    so noise=0 gives a perfect history and larger values a worse one.
+    """
+    rng = np.random.default_rng(seed)
+    factor = np.exp(rng.normal(0.0, noise, size=(len(workload), length)))
+    history = np.rint(workload.burst[:, None] * factor)
+    return np.clip(history, 1, np.iinfo(np.int32).max).astype(np.int32)
@@ -0,0 +1,111 @@
+# scheduler/metrics.py
+
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+STARVATION_FACTOR = 10.0  # waits this many times the typical wait count as starved
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tail latency (vectorized over the result arrays)
+# ──────────────────────────────────────────────────────────────────────────────
+def tail_stats(values, prefix):
+    """Returns {prefix_p50, prefix_p95, prefix_p99, prefix_max} of one array."""
+    if not len(values):
+        return {**{f"{prefix}_p{p}": 0.0 for p in PERCENTILES}, f"{prefix}_max": 0.0}
+    out = dict(zip((f"{prefix}_p{p}" for p in PERCENTILES), np.percentile(values, PERCENTILES).tolist()))
+    out[f"{prefix}_max"] = float(values.max())
+    return out
+
+
+def slowdown(tat, burst):
+    """Per-job slowdown: turnaround time over burst (1.0 = never waited)."""
+    return tat / burst.astype(np.float64)
+
+
+def burst_buckets(burst):
+    """
+    Assigns each job a power-of-two burst bucket: bucket k holds bursts in
+    [2**k, 2**(k+1)). Returns the int8 bucket array.
+    """
+    return np.floor(np.log2(np.maximum(burst, 1))).astype(np.int8)
+
+
+def bucket_table(burst, wt, response, tat):
+    """
+    Tail metrics per burst bucket. Returns one row per non-empty bucket with
+    'bucket' (e.g. "8–15"), 'jobs', and p50/p95/p99/max of wt, response and
+    slowdown.
+
+    Jobs are grouped with a single stable sort of the small-integer bucket
+    ids (a linear-time radix sort), then each group is a contiguous slice.
+    """
+    bucket = burst_buckets(burst)
+    order = np.argsort(bucket, kind="stable")
+    ids, first, counts = np.unique(bucket[order], return_index=True, return_counts=True)
+    metrics = {"wt": wt[order], "response": response[order], "slowdown": slowdown(tat, burst)[order]}
+
+    rows = []
+    for k, lo, count in zip(ids.tolist(), first.tolist(), counts.tolist()):
+        row = {"bucket": f"{2**k}–{2**(k + 1) - 1}", "jobs": count}
+        for name, values in metrics.items():
+            row.update(tail_stats(values[lo:lo + count], name))
+        rows.append(row)
+    return rows
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fairness
+# ──────────────────────────────────────────────────────────────────────────────
+def jain_index(values):
+    """
+    Jain's fairness index (Σx)² / (n·Σx²): 1.0 when every x is equal, down
+    to 1/n when one job gets everything.
+    """
+    if not len(values):
+        return 1.0
+    values = values.astype(np.float64)
+    square_sum = float(np.dot(values, values))
+    return float(values.sum()) ** 2 / (len(values) * square_sum) if square_sum else 1.0
+
+
+def starvation(wt, burst, factor=STARVATION_FACTOR):
+    """
+    Flags jobs whose wait exceeds `factor` times the typical wait, taken as
+    the larger of the median wait and the mean burst (so a lightly loaded
+    CPU with a zero median does not flag every queued job). Returns the
+    threshold, the starved count and fraction, the mean burst of starved
+    jobs (SJF starves the long ones), and the job with the longest wait.
+    """
+    n = len(wt)
+    threshold = factor * max(float(np.median(wt)), float(burst.mean())) if n else 0.0
+    starved = wt > threshold
+    count = int(starved.sum())
+    worst = int(wt.argmax()) if n else -1
+    return {
+        "starvation_threshold": threshold,
+        "starved": count,
+        "starved_fraction": count / n if n else 0.0,
+        "starved_mean_burst": float(burst[starved].mean()) if count else 0.0,
+        "longest_wait_job": worst,
+        "longest_wait": int(wt[worst]) if n else 0,
+    }
+
+
+def fairness_report(burst, wt, response, tat, factor=STARVATION_FACTOR):
+    """
+    Overall tail and fairness metrics for one run, as a flat dict:
+      - p50/p95/p99/max of wt, response and slowdown
+      - jain_slowdown: Jain's index over 1/slowdown (each job's share of
+        the CPU while it was in the system)
+      - the starvation() fields
+    Use bucket_table() for the same tails broken down by burst size.
+    """
+    sd = slowdown(tat, burst)
+    report = {}
+    report.update(tail_stats(wt, "wt"))
+    report.update(tail_stats(response, "response"))
+    report.update(tail_stats(sd, "slowdown"))
+    report["jain_slowdown"] = jain_index(1.0 / sd)
+    report.update(starvation(wt, burst, factor))
+    return report
@@ -0,0 +1,263 @@
+# scheduler/online.py
+
+import heapq
+import math
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Ready-queue ordering for the non-preemptive online policies
+_KEYS = {
+    "fcfs": lambda arrival, burst, seq: (arrival, seq),
+    "sjf": lambda arrival, burst, seq: (burst, arrival, seq),
+}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Streaming statistics (O(1) memory)
+# ──────────────────────────────────────────────────────────────────────────────
+class P2Quantile:
+    """
+    P² estimate of one quantile (Jain & Chlamtac, 1985). Keeps five markers
+    whose heights track the min, p/2, p, (1+p)/2 and max quantiles and are
+    adjusted with piecewise-parabolic interpolation on every observation.
+    Exact for the first five values; O(1) memory and time afterwards.
+    """
+
+    __slots__ = ("p", "heights", "positions", "count", "increments")
+
+    def __init__(self, p):
+        if not 0 < p < 1:
+            raise ValueError("p must be in (0, 1)")
+        self.p = p
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.count = 0
+        # Desired positions of the middle markers are 1 + (count-1)·increment
+        self.increments = (None, p / 2, p, (1 + p) / 2)
+
+    def add(self, x):
+        q = self.heights
+        self.count += 1
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        # 1) Find the cell holding x, widen the extremes and shift the
+        #    positions of every marker above it
+        n = self.positions
+        if x < q[1]:
+            if x < q[0]:
+                q[0] = x
+            n[1] += 1
+            n[2] += 1
+            n[3] += 1
+        elif x < q[2]:
+            n[2] += 1
+            n[3] += 1
+        elif x < q[3]:
+            n[3] += 1
+        elif x > q[4]:
+            q[4] = x
+        n[4] += 1
+
+        # 2) Move the three middle markers toward their desired positions
+        c = self.count - 1
+        for i in (1, 2, 3):
+            delta = 1 + c * self.increments[i] - n[i]
+            if (delta >= 1 and n[i + 1] - n[i] > 1) or (delta <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if delta > 0 else -1
+                height = self._parabolic(i, step)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = height
+                n[i] += step
+
+    def _parabolic(self, i, step):
+        q, n = self.heights, self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self):
+        q = self.heights
+        if not q:
+            return float("nan")
+        if self.count <= 5:
+            # Still the sorted observations themselves: exact order statistic for p
+            return float(q[int(round(self.p * (len(q) - 1)))])
+        return float(q[2])
+
+
+class RunningStats:
+    """
+    Count, mean, variance (Welford), min, max and streaming quantiles (one
+    P2Quantile per entry of `quantiles`) of a stream of numbers.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max", "sketches")
+
+    def __init__(self, quantiles=QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketches = [P2Quantile(p) for p in quantiles]
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        for sketch in self.sketches:
+            sketch.add(x)
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, p):
+        for sketch in self.sketches:
+            if sketch.p == p:
+                return sketch.value()
+        raise KeyError(f"no sketch for quantile {p}")
+
+    def summary(self, prefix):
+        """Returns {prefix_mean, prefix_std, prefix_p50, ..., prefix_max} as plain floats."""
+        out = {f"{prefix}_mean": self.mean, f"{prefix}_std": self.std}
+        for sketch in self.sketches:
+            out[f"{prefix}_p{sketch.p * 100:g}"] = sketch.value()
+        out[f"{prefix}_max"] = float(self.max) if self.count else 0.0
+        return out
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Online scheduler
+# ──────────────────────────────────────────────────────────────────────────────
+class OnlineScheduler:
+    """
+    Non-preemptive SJF (or FCFS) over a live job feed.
+
+    submit() jobs as they become known and call advance(until) to move the
+    clock forward; advance is a generator of (id, arrival, burst, start,
+    completion) tuples for the jobs that finish by `until`. A dispatch at
+    time t happens only once the clock has passed t, so every job arriving
+    at or before t has had the chance to compete, and a feed submitted in
+    arrival order yields the same schedule as schedule_sjf.
+
+    Only waiting jobs are held in memory; completed jobs are folded into
+    `wt` and `tat` RunningStats and forgotten.
+    """
+
+    def __init__(self, policy="sjf", quantiles=QUANTILES):
+        try:
+            self._key = _KEYS[policy]
+        except KeyError:
+            raise ValueError(f"online mode supports {tuple(_KEYS)}, not {policy!r}") from None
+        self.policy = policy
+        self.clock = 0  # every future submission arrives at or after this
+        self.wt = RunningStats(quantiles)
+        self.tat = RunningStats(quantiles)
+        self.completed = 0
+        self.total_time = 0
+        self._future = []  # (arrival, seq, id, burst) not yet arrived at the CPU's time
+        self._ready = []  # (policy key..., id, arrival, burst)
+        self._running = None  # (completion, id, arrival, burst, start)
+        self._free = 0  # time the CPU becomes free
+        self._seq = 0
+
+    def __len__(self):
+        """Jobs submitted but not yet completed."""
+        return len(self._future) + len(self._ready) + (self._running is not None)
+
+    def submit(self, arrival, burst, job_id=None):
+        """
+        Adds a job and returns its id (a running counter unless `job_id` is
+        given). `arrival` may not lie before the clock.
+        """
+        if arrival < self.clock:
+            raise ValueError(f"arrival {arrival} is before the clock ({self.clock})")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if job_id is None:
+            job_id = self._seq
+        heapq.heappush(self._future, (arrival, self._seq, job_id, burst))
+        self._seq += 1
+        return job_id
+
+    def advance(self, until=None):
+        """
+        Runs the CPU up to time `until` (or until every submitted job is done
+        when None), yielding each completion as it happens.
+        """
+        if until is not None and until < self.clock:
+            raise ValueError(f"cannot advance to {until}; the clock is already at {self.clock}")
+        future, ready = self._future, self._ready
+        while True:
+            # a) Retire the running job if it finishes in the window
+            if self._running is not None:
+                completion, job, a, b, s = self._running
+                if until is not None and completion > until:
+                    break
+                self._running = None
+                self.completed += 1
+                self.total_time = completion
+                self.wt.add(s - a)
+                self.tat.add(completion - a)
+                yield job, a, b, s, completion
+
+            # b) Idle CPU → jump to the next arrival
+            time = self._free
+            if not ready and future and future[0][0] > time:
+                time = future[0][0]
+            if until is not None and time >= until:
+                break
+
+            # c) Admit every job that has arrived by `time`
+            while future and future[0][0] <= time:
+                a, seq, job, b = heapq.heappop(future)
+                heapq.heappush(ready, (*self._key(a, b, seq), job, a, b))
+            if not ready:
+                break
+
+            # d) Dispatch the head of the ready heap
+            *_, job, a, b = heapq.heappop(ready)
+            self._free = time + b
+            self._running = (self._free, job, a, b, time)
+
+        if until is None:
+            until = max(self._free, self.clock)
+        self.clock = until
+        self._free = max(self._free, until)
+
+    def feed(self, jobs):
+        """
+        Schedules an iterable of (id, arrival, burst) tuples in arrival order
+        as a live feed: each job is submitted when the clock reaches its
+        arrival. Yields completions; drains the queue at the end.
+        """
+        for job, a, b in jobs:
+            yield from self.advance(a)
+            self.submit(a, b, job)
+        yield from self.advance()
+
+    def metrics(self):
+        """Rolling metrics: counts, clock, and WT/TAT mean, std, quantiles and max."""
+        return {
+            "jobs": self.completed,
+            "queued": len(self),
+            "clock": self.clock,
+            "total_time": self.total_time,
+            **self.wt.summary("wt"),
+            **self.tat.summary("tat"),
+        }
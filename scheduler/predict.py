@@ -0,0 +1,107 @@
+# scheduler/predict.py
+
+import numpy as np
+
+from scheduler.engine import schedule_sjf
+
+DEFAULT_ALPHA = 0.5
+DEFAULT_INITIAL = 10.0  # τ0: the estimate before any burst has been seen
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Estimators: (n, length) history of past bursts → (n,) predicted next burst
+# ──────────────────────────────────────────────────────────────────────────────
+def predict_exponential(history, alpha=DEFAULT_ALPHA, initial=DEFAULT_INITIAL):
+    """
+    Exponential averaging τ ← α·t + (1−α)·τ, applied over each row of
+    `history` (oldest first) starting from τ0 = initial.
+
+    Unrolled, the final estimate is a fixed weighted sum,
+        τ = Σ_j α(1−α)^(length−1−j) · t_j + (1−α)^length · τ0,
+    so the whole trace is predicted with one matrix-vector product.
+    """
+    if not 0 <= alpha <= 1:
+        raise ValueError("alpha must be in [0, 1]")
+    length = history.shape[1]
+    decay = (1.0 - alpha) ** np.arange(length - 1, -1, -1)
+    return history @ (alpha * decay) + (1.0 - alpha) ** length * initial
+
+
+def predict_mean(history):
+    """Mean of the past bursts."""
+    return history.mean(axis=1)
+
+
+def predict_last(history):
+    """The most recent burst."""
+    return history[:, -1].astype(np.float64)
+
+
+ESTIMATORS = {
+    "exponential": predict_exponential,
+    "mean": predict_mean,
+    "last": predict_last,
+}
+
+
+def predict_bursts(history, estimator="exponential", **params):
+    """Runs the named estimator from ESTIMATORS over a burst history."""
+    try:
+        predict = ESTIMATORS[estimator]
+    except KeyError:
+        raise ValueError(f"unknown estimator {estimator!r}; expected one of {tuple(ESTIMATORS)}") from None
+    history = np.asarray(history, dtype=np.float64)
+    if history.ndim != 2 or not history.shape[1]:
+        raise ValueError("history must be a 2-D array with at least one past burst per job")
+    return predict(history, **params)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Evaluation against oracle SJF
+# ──────────────────────────────────────────────────────────────────────────────
+def prediction_error(burst, predicted):
+    """
+    Error of the predicted bursts against the actual ones: mae, rmse,
+    abs_error_ratio (mean of |error| / burst, a fraction: 0.25 is 25%) and
+    bias (mean of predicted − actual).
+    """
+    if not len(burst):
+        return {"mae": 0.0, "rmse": 0.0, "abs_error_ratio": 0.0, "bias": 0.0}
+    error = predicted - burst
+    return {
+        "mae": float(np.abs(error).mean()),
+        "rmse": float(np.sqrt(np.dot(error, error) / len(error))),
+        "abs_error_ratio": float((np.abs(error) / burst).mean()),
+        "bias": float(error.mean()),
+    }
+
+
+def degradation(predicted_schedule, oracle_schedule):
+    """
+    How much worse SJF on predicted bursts does than oracle SJF on the same
+    workload: absolute and relative increase in average WT and TAT (the
+    *_increase_ratio fields are fractions of the oracle value: 0.1 is 10%).
+    """
+    out = {}
+    for name in ("avg_wt", "avg_tat"):
+        ours, best = getattr(predicted_schedule, name), getattr(oracle_schedule, name)
+        out[f"oracle_{name}"] = best
+        out[f"{name}_increase"] = ours - best
+        out[f"{name}_increase_ratio"] = (ours - best) / best if best else 0.0
+    return out
+
+
+def evaluate_prediction(workload, history, estimator="exponential", progress=None, **params):
+    """
+    Predicts every job's burst from `history`, runs SJF on the predictions
+    and on the actual bursts (the oracle), and returns
+    (predicted_schedule, report) where report holds the estimator name, the
+    prediction_error() fields and the degradation() fields.
+    """
+    predicted = predict_bursts(history, estimator, **params)
+    schedule = schedule_sjf(workload, progress, predicted)
+    oracle = schedule_sjf(workload)
+    report = {"estimator": estimator}
+    report.update(prediction_error(workload.burst.astype(np.float64), predicted))
+    report.update(degradation(schedule, oracle))
+    return schedule, report
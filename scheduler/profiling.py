@@ -0,0 +1,144 @@
+# scheduler/profiling.py
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+_NULL_STAGE = nullcontext()
+
+
+class Stats:
+    """
+    Stage timers, counters and peak gauges for one run (or, merged, for a
+    whole process). Thread-safe.
+
+    A disabled Stats (enabled=False) turns every call into an immediate
+    return — stage() hands back a shared no-op context manager — so
+    instrumented code pays only a method call per stage when profiling is off.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stages = {}  # name -> [calls, seconds]
+        self.counters = {}
+        self.peaks = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """Context manager that adds the wall time of its block to stage `name`."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    def add_time(self, name, seconds, calls=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self.stages.setdefault(name, [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def peak(self, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            if value > self.peaks.get(name, value - 1):
+                self.peaks[name] = value
+
+    def merge(self, other):
+        """Folds another Stats (e.g. one run's) into this one."""
+        if not self.enabled or not other.enabled:
+            return
+        snapshot = other.snapshot()
+        for name, entry in snapshot["stages"].items():
+            self.add_time(name, entry["seconds"], entry["calls"])
+        for name, n in snapshot["counters"].items():
+            self.count(name, n)
+        for name, value in snapshot["peaks"].items():
+            self.peak(name, value)
+
+    def snapshot(self):
+        """Returns {'stages': {name: {'calls', 'seconds'}}, 'counters': {...}, 'peaks': {...}}."""
+        with self._lock:
+            return {
+                "stages": {name: {"calls": c, "seconds": s} for name, (c, s) in self.stages.items()},
+                "counters": dict(self.counters),
+                "peaks": dict(self.peaks),
+            }
+
+    def prometheus(self, prefix="sjf"):
+        """Renders the snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_stage_seconds_total Wall time spent per stage.",
+            f"# TYPE {prefix}_stage_seconds_total counter",
+        ]
+        lines += [f'{prefix}_stage_seconds_total{{stage="{name}"}} {e["seconds"]:.6f}'
+                  for name, e in snapshot["stages"].items()]
+        lines += [
+            f"# HELP {prefix}_stage_calls_total Times each stage ran.",
+            f"# TYPE {prefix}_stage_calls_total counter",
+        ]
+        lines += [f'{prefix}_stage_calls_total{{stage="{name}"}} {e["calls"]}'
+                  for name, e in snapshot["stages"].items()]
+        for name, n in snapshot["counters"].items():
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {n}"]
+        for name, value in snapshot["peaks"].items():
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+
+def record_schedule(stats, schedule):
+    """
+    Adds a finished schedule's counters to `stats` (no-op when disabled):
+    jobs, dispatches (CPU bursts on the timeline), preemptions,
+    heap_operations and the ready_queue_peak gauge. Everything is derived
+    after the run, vectorized, so the scheduling loops stay uninstrumented;
+    heap_operations is the engine's own total (Schedule.heap_ops) and is
+    left out for schedules that do not carry one.
+    """
+    if not stats.enabled:
+        return
+    n = len(schedule)
+    job, seg_start, seg_end = schedule.segments
+    dispatches = len(job)
+    stats.count("jobs", n)
+    stats.count("dispatches", dispatches)
+    stats.count("preemptions", max(0, dispatches - n))
+    if schedule.heap_ops is not None:
+        stats.count("heap_operations", schedule.heap_ops)
+    stats.peak("ready_queue_peak", ready_queue_peak(schedule))
+
+
+def ready_queue_peak(schedule):
+    """
+    Largest number of jobs waiting (arrived, unfinished, not on a CPU) at
+    any arrival instant: arrived(≤t) − completed(≤t) − busy CPUs(t), with
+    every count a binary search on sorted event times.
+    """
+    if not len(schedule):
+        return 0
+    arrival = np.sort(schedule.workload.arrival)
+    completion = np.sort(schedule.completion)
+    _, seg_start, seg_end = schedule.segments
+    seg_start, seg_end = np.sort(seg_start), np.sort(seg_end)
+    t = np.unique(arrival)
+    in_system = np.searchsorted(arrival, t, side="right") - np.searchsorted(completion, t, side="right")
+    busy = np.searchsorted(seg_start, t, side="right") - np.searchsorted(seg_end, t, side="right")
+    return int((in_system - busy).max())
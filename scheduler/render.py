@@ -0,0 +1,64 @@
+# scheduler/render.py
+
+import numpy as np
+
+MIXED = -1  # job id reported for a block that covers several jobs
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Gantt segment reduction (front-end independent)
+# ──────────────────────────────────────────────────────────────────────────────
+def merge_segments(job, start, end):
+    """
+    Merges back-to-back segments of the same job (end == next start) into
+    one. Input and output are parallel arrays in time order.
+    """
+    if len(job) < 2:
+        return job, start, end
+    joined = (job[1:] == job[:-1]) & (start[1:] == end[:-1])
+    keep_start = np.concatenate(([True], ~joined))
+    keep_end = np.concatenate((~joined, [True]))
+    return job[keep_start], start[keep_start], end[keep_end]
+
+
+def visible_range(start, end, x0, x1):
+    """
+    Returns the slice (lo, hi) of time-ordered, non-overlapping segments that
+    intersect [x0, x1]. O(log n) via binary search on the sorted arrays.
+    """
+    lo = int(np.searchsorted(end, x0, side="right"))
+    hi = int(np.searchsorted(start, x1, side="left"))
+    return lo, max(lo, hi)
+
+
+def decimate(job, start, end, x0, x1, width_px):
+    """
+    Reduces the segments that intersect [x0, x1] to at most ~2·width_px
+    blocks for a chart `width_px` pixels wide.
+
+    Consecutive segments are fused into one block while both they and the
+    idle gap between them are narrower than a pixel; segments at least one
+    pixel wide always stay separate. Returns parallel arrays
+    (job, start, end, first, count): `first` is the index of the block's
+    first segment and `count` how many segments it covers. A block covering
+    more than one job has job == MIXED.
+    """
+    lo, hi = visible_range(start, end, x0, x1)
+    job, start, end = job[lo:hi], start[lo:hi], end[lo:hi]
+    first = np.arange(lo, hi)
+    if len(job) <= width_px:
+        return job, start, end, first, np.ones(len(job), dtype=np.int64)
+
+    px = (x1 - x0) / width_px
+    wide = (end - start) >= px
+    # A block boundary falls before segment k when the gap before it is at
+    # least a pixel, or when segment k-1 or k is itself a pixel wide.
+    breaks = np.concatenate(([True], ((start[1:] - end[:-1]) >= px) | wide[1:] | wide[:-1]))
+    heads = np.flatnonzero(breaks)
+    tails = np.concatenate((heads[1:], [len(job)])) - 1
+    count = tails - heads + 1
+
+    block_job = job[heads].copy()
+    same_job = np.maximum.reduceat(job, heads) == np.minimum.reduceat(job, heads)
+    block_job[~same_job] = MIXED
+    return block_job, start[heads], end[tails], first[heads], count
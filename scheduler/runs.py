@@ -0,0 +1,140 @@
+# scheduler/runs.py
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Cancelled(Exception):
+    """Raised inside a run's progress callback once the run is cancelled."""
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Background run manager
+# ──────────────────────────────────────────────────────────────────────────────
+class RunManager:
+    """
+    Runs long computations on a small background thread pool so request
+    threads return immediately. Each submitted run gets a run ID whose
+    state ('queued', 'running', 'done', 'error', 'cancelled'), progress
+    (0–1) and result can be polled.
+
+    compute(progress) receives a progress(done, total) callback. Calling it
+    raises Cancelled once cancel() was requested, which is how a run stops
+    cooperatively. With a `cache` (see ResultCache) finished results are
+    stored by key, a submit for a cached key completes immediately, and a
+    submit for a key that is already in flight joins the existing run.
+    Results then live in the cache only, so its entry and byte bounds cap
+    the memory held: a run whose result was evicted reads as expired. A
+    result the cache refused (larger than its byte bound) is kept on the
+    run until the next such result arrives.
+    """
+
+    def __init__(self, max_workers=2, cache=None, max_runs=256):
+        self.cache = cache
+        self.max_runs = max_runs
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="run")
+        self._runs = OrderedDict()  # run_id -> record dict
+        self._inflight = {}         # key -> run_id
+        self._lock = threading.Lock()
+
+    def submit(self, key, compute):
+        """Starts (or reuses) a run for `key` and returns its run ID."""
+        cached = self.cache.get(key) if self.cache is not None else None
+        with self._lock:
+            if cached is None and key in self._inflight:
+                return self._inflight[key]
+            run_id = uuid.uuid4().hex
+            record = {"key": key, "state": "queued", "progress": 0.0, "result": None, "error": None, "cancel": False}
+            self._runs[run_id] = record
+            self._trim()
+            if cached is not None:
+                record.update(state="done", progress=1.0)
+                return run_id
+            self._inflight[key] = run_id
+        self._pool.submit(self._run, run_id, record, compute)
+        return run_id
+
+    def status(self, run_id):
+        """Returns a snapshot {'state', 'progress', 'error'} or None for unknown IDs."""
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is None:
+                return None
+            return {"state": record["state"], "progress": record["progress"], "error": record["error"]}
+
+    def result(self, run_id):
+        """Returns the result of a finished run, else None (also once it was evicted from the cache)."""
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is None or record["state"] != "done":
+                return None
+            if record["result"] is not None or self.cache is None:
+                return record["result"]
+        return self.cache.peek(record["key"], fresh=False)
+
+    def recharge(self, run_id):
+        """
+        Re-measures a finished run's cached result after it was extended in
+        place (see ResultCache.recharge); a no-op without a cache or for a
+        result the cache did not keep.
+        """
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is None or record["state"] != "done" or self.cache is None:
+                return
+        self.cache.recharge(record["key"])
+
+    def cancel(self, run_id):
+        """Requests cancellation; returns False if the run already finished."""
+        with self._lock:
+            record = self._runs.get(run_id)
+            if record is None or record["state"] in ("done", "error", "cancelled"):
+                return False
+            record["cancel"] = True
+            return True
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            for record in self._runs.values():
+                record["cancel"] = True
+        self._pool.shutdown(wait=wait)
+
+    def _run(self, run_id, record, compute):
+        def progress(done, total):
+            if record["cancel"]:
+                raise Cancelled(run_id)
+            record["progress"] = done / total if total else 1.0
+
+        try:
+            if record["cancel"]:
+                raise Cancelled(run_id)
+            record["state"] = "running"
+            result = compute(progress)
+        except Cancelled:
+            state = {"state": "cancelled"}
+        except Exception as exc:  # surfaced to the poller, not the worker thread
+            state = {"state": "error", "error": f"{type(exc).__name__}: {exc}"}
+        else:
+            state = {"state": "done", "progress": 1.0, "result": result}
+            if self.cache is not None:
+                self.cache.put(record["key"], result)
+                if self.cache.peek(record["key"], fresh=False) is result:
+                    state["result"] = None  # held by the cache
+        with self._lock:
+            if state.get("result") is not None and self.cache is not None:
+                # Pin at most one result the cache refused
+                for other in self._runs.values():
+                    other["result"] = None
+            record.update(state)
+            if self._inflight.get(record["key"]) == run_id:
+                del self._inflight[record["key"]]
+
+    def _trim(self):
+        # Forget the oldest finished runs beyond max_runs (called with the lock held)
+        for run_id in list(self._runs):
+            if len(self._runs) <= self.max_runs:
+                break
+            if self._runs[run_id]["state"] in ("done", "error", "cancelled"):
+                del self._runs[run_id]
@@ -0,0 +1,135 @@
+# scheduler/sweep.py
+
+import itertools
+import math
+
+from scheduler.engine import run_schedule
+from scheduler.generate import generate_workload
+
+Z_95 = 1.96  # normal approximation for 95% confidence intervals
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Worker side: run one chunk of trials for a single grid cell
+# ──────────────────────────────────────────────────────────────────────────────
+def _run_chunk(cell, params, first_trial, n_trials, seed, algorithm):
+    """
+    Runs trials [first_trial, first_trial + n_trials) of one grid cell and
+    returns (cell, wt_moments, tat_moments), each moments tuple being
+    (count, mean, M2) of the per-trial averages.
+    """
+    wt = _Moments()
+    tat = _Moments()
+    for trial in range(first_trial, first_trial + n_trials):
+        workload = generate_workload(
+            params["jobs"],
+            [seed, cell, trial],
+            params["arrival"],
+            params["burst"],
+            rate=params["rate"],
+        )
+        schedule = run_schedule(workload, algorithm)
+        wt.add(schedule.avg_wt)
+        tat.add(schedule.avg_tat)
+    return cell, wt.state(), tat.state()
+
+
+class _Moments:
+    """Running count/mean/M2 (Welford), mergeable across chunks (Chan et al.)."""
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, state):
+        count, mean, m2 = state
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def state(self):
+        return self.count, self.mean, self.m2
+
+    def ci(self):
+        """
+        Half-width of the 95% confidence interval of the mean; None with
+        fewer than two trials (no spread to measure), which JSON writes as
+        null where NaN would make the file invalid.
+        """
+        if self.count < 2:
+            return None
+        return Z_95 * math.sqrt(self.m2 / (self.count - 1) / self.count)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Driver side: fan trials out over a process pool and aggregate
+# ──────────────────────────────────────────────────────────────────────────────
+def sweep_grid(job_counts, rates, bursts, arrival="poisson"):
+    """Returns the list of parameter dicts for every grid cell."""
+    return [
+        {"jobs": jobs, "rate": rate, "burst": burst, "arrival": arrival}
+        for jobs, rate, burst in itertools.product(job_counts, rates, bursts)
+    ]
+
+
+def iter_sweep(grid, trials, algorithm="sjf", seed=0, workers=None, chunksize=16):
+    """
+    Runs `trials` seeded trials for every cell of `grid` (see sweep_grid) on
+    a ProcessPoolExecutor and yields the aggregated table (one row dict per
+    cell) each time a chunk of `chunksize` trials completes.
+
+    Trial t of cell c is always generated from the seed [seed, c, t], so the
+    final table does not depend on `workers` or `chunksize`.
+    """
+    # Deferred: the process pool machinery is only needed once a sweep runs
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    wt = [_Moments() for _ in grid]
+    tat = [_Moments() for _ in grid]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_chunk, cell, params, first, min(chunksize, trials - first), seed, algorithm)
+            for cell, params in enumerate(grid)
+            for first in range(0, trials, chunksize)
+        ]
+        for future in as_completed(futures):
+            cell, wt_state, tat_state = future.result()
+            wt[cell].merge(wt_state)
+            tat[cell].merge(tat_state)
+            yield _table(grid, wt, tat)
+
+
+def run_sweep(grid, trials, algorithm="sjf", seed=0, workers=None, chunksize=16):
+    """Runs iter_sweep to completion and returns the final aggregated table."""
+    table = _table(grid, [_Moments() for _ in grid], [_Moments() for _ in grid])
+    for table in iter_sweep(grid, trials, algorithm, seed, workers, chunksize):
+        pass
+    return table
+
+
+def _table(grid, wt, tat):
+    return [
+        {
+            **params,
+            "trials": wt[cell].count,
+            "avg_wt": wt[cell].mean,
+            "avg_wt_ci": wt[cell].ci(),
+            "avg_tat": tat[cell].mean,
+            "avg_tat_ci": tat[cell].ci(),
+        }
+        for cell, params in enumerate(grid)
+    ]
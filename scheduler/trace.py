@@ -0,0 +1,201 @@
+# scheduler/trace.py
+
+import itertools
+import json
+import os
+
+import numpy as np
+
+from scheduler.workload import Workload
+
+DEFAULT_CHUNK_SIZE = 65536
+RESULT_FIELDS = ("id", "arrival", "burst", "start", "completion", "tat", "wt")
+INT32 = np.iinfo(np.int32)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Chunked readers (CSV / JSONL)
+# ──────────────────────────────────────────────────────────────────────────────
+def iter_trace_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads a job trace in chunks of at most `chunk_size` rows and yields
+    (ids, arrival, burst) per chunk: ids is a list of strings, arrival and
+    burst are int64 arrays. Only one chunk is held in memory at a time.
+
+    CSV files need a header row naming at least 'arrival' and 'burst'; JSONL
+    files hold one {"arrival": ..., "burst": ...} object per line. An 'id'
+    column/key is optional; missing ids default to the row index.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return _iter_csv(path, chunk_size)
+    if ext in (".jsonl", ".ndjson"):
+        return _iter_jsonl(path, chunk_size)
+    raise ValueError(f"unsupported trace file {path!r}; expected .csv or .jsonl")
+
+
+def _iter_csv(path, chunk_size):
+    with open(path) as fh:
+        header = [name.strip().lower() for name in fh.readline().split(",")]
+        cols = (header.index("arrival"), header.index("burst"))
+        id_col = header.index("id") if "id" in header else None
+        row = 0
+        while True:
+            lines = [line for line in itertools.islice(fh, chunk_size) if line.strip()]
+            if not lines:
+                return
+            data = np.loadtxt(lines, delimiter=",", usecols=cols, dtype=np.int64, ndmin=2)
+            if id_col is None:
+                ids = [str(i) for i in range(row, row + len(lines))]
+            else:
+                ids = [line.split(",")[id_col].strip() for line in lines]
+            row += len(lines)
+            yield ids, data[:, 0], data[:, 1]
+
+
+def _iter_jsonl(path, chunk_size):
+    with open(path) as fh:
+        row = 0
+        while True:
+            records = [json.loads(line) for line in itertools.islice(fh, chunk_size) if line.strip()]
+            if not records:
+                return
+            ids = [str(r.get("id", row + k)) for k, r in enumerate(records)]
+            row += len(records)
+            yield (
+                ids,
+                np.fromiter((r["arrival"] for r in records), dtype=np.int64, count=len(records)),
+                np.fromiter((r["burst"] for r in records), dtype=np.int64, count=len(records)),
+            )
+
+
+def iter_jobs(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Streams (id, arrival, burst) tuples from a trace file in file order,
+    checking that arrivals never decrease (the streaming scheduler needs the
+    trace in arrival order).
+    """
+    last = None
+    row = 0
+    for ids, arrival, burst in iter_trace_chunks(path, chunk_size):
+        if len(arrival):
+            # Prepend the previous chunk's last arrival so chunk boundaries are checked too
+            check = arrival if last is None else np.concatenate(([last], arrival))
+            drops = np.flatnonzero(np.diff(check) < 0)
+            if drops.size:
+                bad = row + int(drops[0]) + (1 if last is None else 0)
+                raise ValueError(f"{path}: trace is not sorted by arrival (data row {bad + 1})")
+            last = arrival[-1]
+        row += len(ids)
+        yield from zip(ids, arrival.tolist(), burst.tolist())
+
+
+class Int32Check:
+    """
+    Checks trace chunks, fed in file order, against the int32 job and
+    schedule arrays. Every arrival and burst must fit, and so must the
+    latest completion any policy could produce from the rows seen so far:
+    the largest arrival plus the sum of all bursts. Raises ValueError naming
+    the first data row that breaks either bound (e.g. epoch-millisecond
+    arrivals, or bursts that add up past 2^31).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self.latest_arrival = 0
+        self.total_burst = 0
+
+    def __call__(self, arrival, burst):
+        if not len(arrival):
+            return
+        # 1) Each value on its own
+        bad = (np.minimum(arrival, burst) < INT32.min) | (np.maximum(arrival, burst) > INT32.max)
+
+        # 2) Worst-case completion after each row (values clipped, so int64 cannot overflow)
+        a = np.clip(arrival, INT32.min, INT32.max)
+        b = np.clip(burst, INT32.min, INT32.max)
+        horizon = np.maximum(np.maximum.accumulate(a), self.latest_arrival) + self.total_burst + np.cumsum(b)
+        bad |= horizon > INT32.max
+
+        hits = np.flatnonzero(bad)
+        if hits.size:
+            k = int(hits[0])
+            raise ValueError(
+                f"{self.path}: data row {self.rows + k + 1} (arrival {arrival[k]}, burst {burst[k]}) does not fit "
+                f"32-bit times: completions could reach {int(horizon[k]):,} (largest arrival + total burst so far), "
+                f"past {INT32.max:,}"
+            )
+        self.rows += len(arrival)
+        self.latest_arrival = max(self.latest_arrival, int(a.max()))
+        self.total_burst += int(b.sum())
+
+
+def read_workload(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads a whole trace file (see iter_trace_chunks) into a Workload. Job
+    indices follow file order; the trace does not need to be sorted.
+    Traces whose values or completion times could leave int32 raise
+    ValueError (see Int32Check). Binary .npy traces (see scheduler.binary)
+    are memory-mapped instead; their values are int32 already, so only the
+    completion bound is checked.
+    """
+    if os.path.splitext(path)[1].lower() == ".npy":
+        from scheduler.binary import load_workload
+        workload = load_workload(path)
+        if len(workload):
+            horizon = int(workload.arrival.max()) + int(workload.burst.sum(dtype=np.int64))
+            if horizon > INT32.max:
+                raise ValueError(
+                    f"{path}: completions could reach {horizon:,} (largest arrival + total burst), past {INT32.max:,}"
+                )
+        return workload
+
+    arrival, burst = [], []
+    check = Int32Check(path)
+    for _, a, b in iter_trace_chunks(path, chunk_size):
+        check(a, b)
+        arrival.append(a)
+        burst.append(b)
+    if not arrival:
+        return Workload([], [])
+    return Workload(np.concatenate(arrival), np.concatenate(burst))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Incremental result writer
+# ──────────────────────────────────────────────────────────────────────────────
+def write_results(results, fh):
+    """
+    Writes (id, arrival, burst, start, completion) tuples to `fh` as CSV rows
+    (with tat and wt appended) as they arrive, and returns summary metrics
+    accumulated on the fly: jobs, total_time, avg_wt, avg_tat.
+    """
+    fh.write(",".join(RESULT_FIELDS) + "\n")
+    return summarize(results, lambda job, a, b, s, c: fh.write(f"{job},{a},{b},{s},{c},{c - a},{c - a - b}\n"))
+
+
+def summarize(results, on_job=None):
+    """
+    Consumes (id, arrival, burst, start, completion) tuples, optionally
+    calling on_job(*result) for each, and returns the summary metrics
+    without keeping the per-job results.
+    """
+    jobs = 0
+    total_time = 0
+    sum_tat = 0
+    sum_wt = 0
+    for result in results:
+        _, a, b, _, c = result
+        jobs += 1
+        total_time = max(total_time, c)
+        sum_tat += c - a
+        sum_wt += c - a - b
+        if on_job is not None:
+            on_job(*result)
+    return {
+        "jobs": jobs,
+        "total_time": total_time,
+        "avg_wt": sum_wt / jobs if jobs else 0.0,
+        "avg_tat": sum_tat / jobs if jobs else 0.0,
+    }
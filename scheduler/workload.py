@@ -0,0 +1,143 @@
+# scheduler/workload.py
+
+import numpy as np
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Columnar job set and schedule result
+# ──────────────────────────────────────────────────────────────────────────────
+class Workload:
+    """
+    Struct-of-arrays job set. Job i is described by arrival[i] and burst[i]
+    (both int32) and, optionally, priority[i] (int32, lower runs first; all
+    zero when not given). Its display label is "P{i+1}".
+    """
+
+    __slots__ = ("arrival", "burst", "priority", "_arrival_order")
+
+    def __init__(self, arrival, burst, priority=None):
+        self.arrival = np.asarray(arrival, dtype=np.int32)
+        self.burst = np.asarray(burst, dtype=np.int32)
+        if self.arrival.shape != self.burst.shape or self.arrival.ndim != 1:
+            raise ValueError("arrival and burst must be 1-D arrays of equal length")
+        if priority is None:
+            priority = np.zeros(len(self.arrival), dtype=np.int32)
+        self.priority = np.asarray(priority, dtype=np.int32)
+        if self.priority.shape != self.arrival.shape:
+            raise ValueError("priority must have the same length as arrival")
+        self._arrival_order = None
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def arrival_order(self):
+        """
+        Job indices sorted by arrival (stable, so ties keep index order).
+        Computed once and shared by every policy run on this workload.
+        """
+        if self._arrival_order is None:
+            self._arrival_order = self.arrival.argsort(kind="stable")
+        return self._arrival_order
+
+
+class Schedule:
+    """
+    Result of running a policy over a Workload. `start` (first dispatch) and
+    `completion` are int32 arrays indexed by job; `order` holds job indices
+    in first-dispatch order. tat, wt, response and the averages are derived
+    with vectorized array math.
+
+    `segments` is the Gantt timeline as three parallel int32 arrays
+    (job, start, end) in time order. Preemptive policies pass it in; for
+    non-preemptive runs it is one segment per job, built on first access.
+
+    `heap_ops` is the number of heap pushes and pops the engine made, for
+    profiling; None when unknown (e.g. a schedule read back from a file).
+    """
+
+    __slots__ = ("workload", "start", "completion", "order", "heap_ops", "_segments")
+
+    def __init__(self, workload, start, completion, order, segments=None, heap_ops=None):
+        self.workload = workload
+        self.heap_ops = heap_ops
+        self.start = np.asarray(start, dtype=np.int32)
+        self.completion = np.asarray(completion, dtype=np.int32)
+        self.order = np.asarray(order, dtype=np.int32)
+        if segments is not None:
+            segments = tuple(np.asarray(col, dtype=np.int32) for col in segments)
+        self._segments = segments
+
+    @property
+    def segments(self):
+        if self._segments is None:
+            self._segments = (self.order, self.start[self.order], self.completion[self.order])
+        return self._segments
+
+    def __len__(self):
+        return len(self.workload)
+
+    @property
+    def tat(self):
+        return self.completion - self.workload.arrival
+
+    @property
+    def wt(self):
+        return self.tat - self.workload.burst
+
+    @property
+    def response(self):
+        return self.start - self.workload.arrival
+
+    @property
+    def total_time(self):
+        return int(self.completion.max()) if len(self) else 0
+
+    @property
+    def avg_wt(self):
+        return float(self.wt.mean()) if len(self) else 0.0
+
+    @property
+    def avg_tat(self):
+        return float(self.tat.mean()) if len(self) else 0.0
+
+    def summary(self):
+        """
+        Returns the headline metrics: jobs, total_time, avg_wt, avg_tat,
+        avg_response and throughput (jobs completed per time unit).
+        """
+        n = len(self)
+        total_time = self.total_time
+        return {
+            "jobs": n,
+            "total_time": total_time,
+            "avg_wt": self.avg_wt,
+            "avg_tat": self.avg_tat,
+            "avg_response": float(self.response.mean()) if n else 0.0,
+            "throughput": n / total_time if total_time else 0.0,
+        }
+
+    def columns(self):
+        """
+        Returns the per-job table as a dict of arrays (job order), with keys:
+          ['id', 'arrival', 'burst', 'start', 'completion', 'tat', 'wt', 'response']
+        """
+        return {
+            "id": labels(np.arange(len(self))),
+            "arrival": self.workload.arrival,
+            "burst": self.workload.burst,
+            "start": self.start,
+            "completion": self.completion,
+            "tat": self.tat,
+            "wt": self.wt,
+            "response": self.response,
+        }
+
+
+def label(i):
+    """Display label of job index i."""
+    return f"P{i + 1}"
+
+
+def labels(indices):
+    """Display labels for an iterable of job indices."""
+    return [f"P{i + 1}" for i in np.asarray(indices).tolist()]
@@ -0,0 +1,106 @@
+# tests/test_cache.py
+"""
+ResultCache bounds (entries, estimated bytes, age) and how RunManager
+serves finished runs through it.
+"""
+
+import time
+
+import numpy as np
+
+from scheduler import Workload
+from scheduler.cache import ResultCache, estimate_nbytes
+from scheduler.incremental import IncrementalScheduler
+from scheduler.runs import RunManager
+
+
+def result(kb):
+    return {"columns": {"start": np.zeros(kb * 256, dtype=np.int32)}, "segments": (np.zeros(0), [np.zeros(0)])}
+
+
+def test_estimate_nbytes():
+    assert estimate_nbytes(result(4)) == 4096
+    assert estimate_nbytes({"a": [np.zeros(3), (np.zeros(2, dtype=np.int8), "x", None)], "b": 7}) == 26
+    editor = IncrementalScheduler(Workload(np.arange(100), np.ones(100)), "fcfs")
+    assert estimate_nbytes({"editor": editor}) == editor.nbytes > 0
+
+
+def test_byte_bound_evicts_least_recently_used():
+    cache = ResultCache(maxsize=64, maxbytes=10 * 1024)
+    for key in "abc":
+        cache.put(key, result(3))
+    assert cache.nbytes == 9 * 1024
+    cache.get("a")
+    cache.put("d", result(3))
+    assert "b" not in cache and "a" in cache
+    assert cache.nbytes == 9 * 1024
+    assert cache.stats()["evictions"] == 1
+
+
+def test_replacing_and_oversized_values():
+    cache = ResultCache(maxbytes=8 * 1024)
+    cache.put("a", result(4))
+    cache.put("a", result(2))
+    assert cache.nbytes == 2 * 1024
+    cache.put("b", result(3))
+    # Too big on its own: refused without evicting anyone else
+    cache.put("big", result(9))
+    assert "big" not in cache and "a" in cache and "b" in cache
+    assert cache.nbytes == 5 * 1024 and cache.stats()["evictions"] == 0
+    # ...but it does replace a same-named entry
+    cache.put("b", result(9))
+    assert "b" not in cache and "a" in cache
+    assert cache.nbytes == 2 * 1024
+
+
+def test_recharge_accounts_for_growth_in_place():
+    cache = ResultCache(maxbytes=10 * 1024)
+    cache.put("a", result(3))
+    cache.put("b", result(3))
+    grown = cache.peek("a")
+    grown["views"] = {"x": np.zeros(1024, dtype=np.int64)}  # +8 KiB
+    # 11 KiB no longer fits on its own: only "a" is dropped
+    assert not cache.recharge("a")
+    assert "a" not in cache and "b" in cache and cache.nbytes == 3 * 1024
+    cache.peek("b")["views"] = {"x": np.zeros(512, dtype=np.int64)}  # +4 KiB
+    cache.put("c", result(2))
+    assert cache.recharge("b")
+    assert "b" in cache and "c" in cache and cache.nbytes == 9 * 1024
+    assert not cache.recharge("missing")
+
+
+def test_expired_entries_free_their_bytes():
+    now = [0.0]
+    cache = ResultCache(ttl=10, clock=lambda: now[0], maxbytes=1 << 20)
+    cache.put("a", result(4))
+    now[0] = 11
+    assert cache.peek("a") is None and cache.peek("a", fresh=False) is not None
+    assert cache.get("a") is None
+    assert cache.nbytes == 0
+
+
+def wait(manager, run_id):
+    while manager.status(run_id)["state"] in ("queued", "running"):
+        time.sleep(0.005)
+
+
+def test_run_manager_serves_results_from_the_cache():
+    manager = RunManager(max_workers=1, cache=ResultCache(maxsize=2))
+    ids = []
+    for k in range(3):
+        ids.append(manager.submit(k, lambda progress, k=k: {"k": k}))
+        wait(manager, ids[-1])
+    # The first result was evicted: its run reads as expired, not as a stale copy
+    assert manager.result(ids[0]) is None
+    assert [manager.result(run_id)["k"] for run_id in ids[1:]] == [1, 2]
+    manager.shutdown()
+
+
+def test_run_manager_pins_one_refused_result():
+    manager = RunManager(max_workers=1, cache=ResultCache(maxbytes=4 * 1024))
+    big = [manager.submit(k, lambda progress: result(8)) for k in ("x", "y")]
+    for run_id in big:
+        wait(manager, run_id)
+    assert manager.result(big[0]) is None
+    assert manager.result(big[1]) is not None
+    manager.shutdown()
@@ -0,0 +1,67 @@
+# tests/test_cli.py
+"""
+CLI smoke tests: every command runs on small inputs, and bad input ends in
+exit code 2 with a one-line error on stderr, never a traceback.
+"""
+
+import json
+
+import pytest
+
+from scheduler.cli import main
+
+
+@pytest.fixture
+def trace(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("id,arrival,burst\nP1,0,5\nP2,1,3\nP3,4,1\n")
+    return str(path)
+
+
+@pytest.fixture
+def unsorted(tmp_path):
+    path = tmp_path / "unsorted.csv"
+    path.write_text("id,arrival,burst\nP1,4,5\nP2,1,3\n")
+    return str(path)
+
+
+def run_cli(argv, capsys):
+    """Runs main(argv) and returns (exit code, stdout, stderr)."""
+    try:
+        code = main(argv)
+    except SystemExit as exc:
+        code = exc.code
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+def test_commands_succeed(tmp_path, trace, capsys):
+    for argv in (
+        ["run", "--input", trace, "--algorithm", "srtf"],
+        ["compare", "--input", trace],
+        ["replay", trace, "--percentiles"],
+        ["convert", trace, str(tmp_path / "trace.npy")],
+    ):
+        code, out, err = run_cli(argv + ["--format", "json"], capsys)
+        assert code == 0, err
+        json.loads(out)
+
+
+@pytest.mark.parametrize("argv", [
+    ["run", "--input", "missing.csv"],
+    ["run", "--input", "{trace}", "--export", "results.xlsx"],
+    ["run", "--input", "{trace}", "--predict", "last", "--algorithm", "rr"],
+    ["compare", "--input", "trace.txt"],
+    ["sweep", "--jobs", "10", "--trials", "2", "--workers", "0"],
+    ["replay", "{unsorted}"],
+    ["replay", "missing.jsonl"],
+    ["convert", "trace.txt", "out.npy"],
+    ["convert", "{unsorted}", "{tmp}/missing-dir/out.npy"],
+])
+def test_bad_input_exits_2(tmp_path, trace, unsorted, capsys, argv):
+    argv = [arg.format(trace=trace, unsorted=unsorted, tmp=tmp_path) for arg in argv]
+    code, out, err = run_cli(argv, capsys)
+    assert code == 2
+    assert out == ""
+    assert err.startswith("python -m scheduler: error: ")
+    assert "Traceback" not in err
@@ -0,0 +1,248 @@
+# tests/test_engine.py
+"""
+Every engine policy against a brute-force reference: small workloads with
+equal bursts, equal arrivals and idle gaps must give exactly the same
+start, completion, dispatch order and (for preemptive policies) segments.
+"""
+
+from collections import deque
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from scheduler import Workload, run_schedule
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Reference schedulers (quadratic or tick by tick, written for clarity)
+# ──────────────────────────────────────────────────────────────────────────────
+def merge(slices):
+    """Joins (job, start, end) slices where one job runs on without a break."""
+    segments = []
+    for job, s, e in slices:
+        if segments and segments[-1][0] == job and segments[-1][2] == s:
+            segments[-1][2] = e
+        else:
+            segments.append([job, s, e])
+    return [tuple(seg) for seg in segments]
+
+
+def reference_nonpreemptive(arrival, burst, pick):
+    """Runs to completion whichever arrived job pick(time, ready) returns."""
+    n = len(arrival)
+    start, completion, order = [0] * n, [0] * n, []
+    left = set(range(n))
+    time = 0
+    while left:
+        ready = [i for i in left if arrival[i] <= time]
+        if not ready:
+            time = min(arrival[i] for i in left)
+            continue
+        i = pick(time, ready)
+        left.remove(i)
+        order.append(i)
+        start[i] = time
+        time += burst[i]
+        completion[i] = time
+    return start, completion, order, None
+
+
+def reference_sjf(arrival, burst, priority):
+    return reference_nonpreemptive(arrival, burst, lambda t, ready: min(ready, key=lambda i: (burst[i], arrival[i], i)))
+
+
+def reference_fcfs(arrival, burst, priority):
+    return reference_nonpreemptive(arrival, burst, lambda t, ready: min(ready, key=lambda i: (arrival[i], i)))
+
+
+def reference_priority(arrival, burst, priority, aging=0.1):
+    # Effective priority at the decision time, exactly as the docstring states it
+    def urgency(t, i):
+        return Fraction(priority[i]) - Fraction(aging) * (t - arrival[i])
+
+    return reference_nonpreemptive(
+        arrival, burst, lambda t, ready: min(ready, key=lambda i: (urgency(t, i), arrival[i], i))
+    )
+
+
+def reference_hrrn(arrival, burst, priority):
+    # Highest (wait + burst) / burst; ties go to the shorter burst, then FCFS
+    def rank(t, i):
+        return (-Fraction(t - arrival[i] + burst[i], burst[i]), burst[i], arrival[i], i)
+
+    return reference_nonpreemptive(arrival, burst, lambda t, ready: min(ready, key=lambda i: rank(t, i)))
+
+
+def reference_srtf(arrival, burst, priority):
+    """One time unit at a time: run the job with the least work left."""
+    n = len(arrival)
+    remaining = list(burst)
+    start, completion, order, slices = [-1] * n, [0] * n, [], []
+    time = 0
+    while any(remaining):
+        ready = [i for i in range(n) if remaining[i] and arrival[i] <= time]
+        if not ready:
+            time += 1
+            continue
+        i = min(ready, key=lambda i: (remaining[i], arrival[i], i))
+        if start[i] < 0:
+            start[i] = time
+            order.append(i)
+        slices.append((i, time, time + 1))
+        time += 1
+        remaining[i] -= 1
+        if not remaining[i]:
+            completion[i] = time
+    return start, completion, order, merge(slices)
+
+
+def reference_rr(arrival, burst, priority, quantum=4):
+    """Plain quantum-by-quantum Round Robin; arrivals queue ahead of the preempted job."""
+    n = len(arrival)
+    by_arrival = sorted(range(n), key=lambda i: (arrival[i], i))
+    remaining = list(burst)
+    start, completion, order, slices = [-1] * n, [0] * n, [], []
+    queue = deque()
+    nxt = 0
+    time = 0
+    while nxt < n or queue:
+        if not queue:
+            time = max(time, arrival[by_arrival[nxt]])
+        while nxt < n and arrival[by_arrival[nxt]] <= time:
+            queue.append(by_arrival[nxt])
+            nxt += 1
+        i = queue.popleft()
+        if start[i] < 0:
+            start[i] = time
+            order.append(i)
+        run = min(quantum, remaining[i])
+        slices.append((i, time, time + run))
+        time += run
+        remaining[i] -= run
+        while nxt < n and arrival[by_arrival[nxt]] <= time:
+            queue.append(by_arrival[nxt])
+            nxt += 1
+        if remaining[i]:
+            queue.append(i)
+        else:
+            completion[i] = time
+    return start, completion, order, merge(slices)
+
+
+REFERENCES = {
+    "fcfs": reference_fcfs,
+    "sjf": reference_sjf,
+    "srtf": reference_srtf,
+    "rr": reference_rr,
+    "priority": reference_priority,
+    "hrrn": reference_hrrn,
+}
+
+# Policy parameters exercised on top of the defaults
+PARAMS = {
+    "rr": [{"quantum": 1}, {"quantum": 2}, {"quantum": 4}, {"quantum": 7}],
+    "priority": [{"aging": 0}, {"aging": 0.1}, {"aging": 0.5}, {"aging": 2}],
+}
+
+
+def assert_matches_reference(policy, arrival, burst, priority=None, **params):
+    priority = [0] * len(arrival) if priority is None else priority
+    schedule = run_schedule(Workload(arrival, burst, priority), policy, **params)
+    start, completion, order, segments = REFERENCES[policy](list(arrival), list(burst), list(priority), **params)
+    assert schedule.order.tolist() == order
+    assert schedule.start.tolist() == start
+    assert schedule.completion.tolist() == completion
+    if segments is not None:
+        assert list(zip(*(col.tolist() for col in schedule.segments))) == segments
+
+
+def cases(policy):
+    return [(policy, params) for params in PARAMS.get(policy, [{}])]
+
+
+ALL_CASES = [case for policy in REFERENCES for case in cases(policy)]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Random small workloads
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("policy,params", ALL_CASES)
+@pytest.mark.parametrize("seed", range(4))
+def test_random_workloads(policy, params, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(60):
+        n = int(rng.integers(0, 9))
+        # Narrow ranges force equal arrivals and bursts; wide ones leave idle gaps
+        horizon = int(rng.choice([1, 3, 12, 40]))
+        arrival = rng.integers(0, horizon, n).tolist()
+        burst = rng.integers(1, int(rng.choice([2, 4, 10])), n).tolist()
+        priority = rng.integers(0, 4, n).tolist()
+        assert_matches_reference(policy, arrival, burst, priority, **params)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Edge cases and hand-checked schedules
+# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("policy,params", ALL_CASES)
+def test_edge_cases(policy, params):
+    assert_matches_reference(policy, [], [], **params)  # n = 0
+    assert_matches_reference(policy, [0], [5], **params)  # n = 1
+    assert_matches_reference(policy, [9], [3], **params)  # n = 1, idle start
+    assert_matches_reference(policy, [2, 2, 2, 2], [3, 3, 3, 3], **params)  # all tied
+    assert_matches_reference(policy, [0, 20, 50], [4, 4, 9], **params)  # idle gaps between jobs
+    assert_matches_reference(policy, [5, 0, 5, 0], [2, 2, 2, 2], [1, 1, 0, 0], **params)  # ties out of index order
+
+
+@pytest.mark.parametrize("policy", ["sjf", "fcfs", "priority", "hrrn"])
+def test_ties_keep_index_order(policy):
+    schedule = run_schedule(Workload([3, 3, 3], [4, 4, 4]), policy)
+    assert schedule.order.tolist() == [0, 1, 2]
+    assert schedule.start.tolist() == [3, 7, 11]
+
+
+def test_sjf_equal_bursts_break_by_arrival():
+    # P1 and P3 both have burst 2 when P1 finishes; P3 arrived first
+    schedule = run_schedule(Workload([0, 2, 1], [3, 2, 2]), "sjf")
+    assert schedule.order.tolist() == [0, 2, 1]
+
+
+def test_srtf_preemption():
+    # P2 arrives with 2 left against P1's 6 and takes the CPU; P1 resumes after
+    schedule = run_schedule(Workload([0, 2], [8, 2]), "srtf")
+    assert schedule.start.tolist() == [0, 2]
+    assert schedule.completion.tolist() == [10, 4]
+    assert [col.tolist() for col in schedule.segments] == [[0, 1, 0], [0, 2, 4], [2, 4, 10]]
+    # An equal remaining time does not preempt
+    schedule = run_schedule(Workload([0, 2], [4, 2]), "srtf")
+    assert schedule.completion.tolist() == [4, 6]
+
+
+def test_rr_quantum():
+    schedule = run_schedule(Workload([0, 0], [5, 3]), "rr", quantum=2)
+    assert [col.tolist() for col in schedule.segments] == [[0, 1, 0, 1, 0], [0, 2, 4, 6, 7], [2, 4, 6, 7, 8]]
+    assert schedule.completion.tolist() == [8, 7]
+    # A job alone runs on until the next arrival, which then queues ahead of it
+    schedule = run_schedule(Workload([0, 5], [10, 2]), "rr", quantum=2)
+    assert [col.tolist() for col in schedule.segments] == [[0, 1, 0], [0, 6, 8], [6, 8, 12]]
+    with pytest.raises(ValueError):
+        run_schedule(Workload([0], [1]), "rr", quantum=0)
+
+
+def test_priority_aging():
+    # Without aging the urgent late job (priority 0) jumps the old one (priority 5)
+    workload = Workload([0, 0, 6], [10, 4, 4], [0, 5, 0])
+    assert run_schedule(workload, "priority", aging=0).order.tolist() == [0, 2, 1]
+    # With aging 1, at t=10 P2 is at 5 - 10 = -5 and P3 only at 0 - 4 = -4
+    assert run_schedule(workload, "priority", aging=1).order.tolist() == [0, 1, 2]
+    with pytest.raises(ValueError):
+        run_schedule(workload, "priority", aging=-1)
+
+
+def test_hrrn_buckets():
+    # At t=10: P2 (burst 2) ratio (9 + 2) / 2, P3 (burst 10) ratio (10 + 10) / 10
+    schedule = run_schedule(Workload([0, 1, 0, 3], [10, 2, 10, 2]), "hrrn")
+    assert schedule.order.tolist() == [0, 1, 3, 2]
+    # Equal ratios go to the shorter burst: at t=4, (2 + 2) / 2 == (4 + 4) / 4
+    schedule = run_schedule(Workload([0, 2, 0], [4, 2, 4]), "hrrn")
+    assert schedule.order.tolist() == [0, 1, 2]
@@ -0,0 +1,87 @@
+# tests/test_export.py
+"""
+Parquet and Arrow IPC export → import round trips: per-job arrays, the
+segment timeline and the run metadata must come back unchanged.
+"""
+
+import io
+
+import numpy as np
+import pytest
+
+from scheduler import generate_workload, run_schedule, schedule_multicore
+from scheduler.export import export_schedule, import_results, import_schedule
+
+pytest.importorskip("pyarrow")  # scheduler.export imports it on first use
+
+EXTENSIONS = [".parquet", ".arrow"]
+METADATA = {"algorithm": "srtf", "seed": 3, "input": None, "quantum": 4}
+
+
+def assert_same_schedule(got, schedule):
+    for name in ("start", "completion", "tat", "wt", "response"):
+        assert (getattr(got, name) == getattr(schedule, name)).all(), name
+    for name in ("arrival", "burst", "priority"):
+        assert (getattr(got.workload, name) == getattr(schedule.workload, name)).all(), name
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+@pytest.mark.parametrize("algorithm", ["sjf", "srtf", "rr"])
+def test_round_trip(tmp_path, ext, algorithm):
+    workload = generate_workload(2_000, 3, "poisson", "exponential", rate=0.2)
+    schedule = run_schedule(workload, algorithm)
+    path = str(tmp_path / f"results{ext}")
+    export_schedule(schedule, path, METADATA)
+
+    got, metadata = import_schedule(path)
+    assert metadata == METADATA
+    assert_same_schedule(got, schedule)
+    assert (got.order == schedule.order).all()
+    for col, ref in zip(got.segments, schedule.segments):
+        assert (col == ref).all()
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+def test_round_trip_without_segments_column(tmp_path, ext):
+    # Non-preemptive runs store no segments column; start/completion rebuild them
+    workload = generate_workload(500, 1, "uniform", "uniform")
+    schedule = run_schedule(workload, "sjf")
+    path = str(tmp_path / f"results{ext}")
+    export_schedule(schedule, path)
+    columns, segments, metadata = import_results(path)
+    assert segments is None
+    assert metadata == {}
+    assert set(columns) == {"arrival", "burst", "start", "completion", "tat", "wt", "response", "priority"}
+    assert all(array.dtype == np.int32 for array in columns.values())
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+def test_round_trip_multicore(tmp_path, ext):
+    workload = generate_workload(2_000, 5, "bursty", "uniform", rate=0.4)
+    schedule = schedule_multicore(workload, 4, "per-core", True)
+    path = str(tmp_path / f"results{ext}")
+    export_schedule(schedule, path, {"queue": "per-core"})
+
+    got, metadata = import_schedule(path)
+    assert metadata == {"cores": 4, "steals": schedule.steals, "queue": "per-core"}
+    assert_same_schedule(got, schedule)
+    assert (got.core == schedule.core).all()
+    assert (got.cores, got.steals) == (4, schedule.steals)
+
+
+@pytest.mark.parametrize("ext", EXTENSIONS)
+def test_round_trip_file_object_and_bytes(ext):
+    schedule = run_schedule(generate_workload(300, 2, "poisson", "uniform", rate=0.1), "srtf")
+    buffer = io.BytesIO()
+    export_schedule(schedule, buffer, METADATA, format=ext[1:])
+    for source in (buffer.getvalue(), io.BytesIO(buffer.getvalue())):
+        got, metadata = import_schedule(source)
+        assert metadata == METADATA
+        assert_same_schedule(got, schedule)
+
+
+def test_import_rejects_other_files(tmp_path):
+    path = tmp_path / "trace.parquet"
+    path.write_text("id,arrival,burst\n")
+    with pytest.raises(ValueError):
+        import_schedule(str(path))
@@ -0,0 +1,88 @@
+# tests/test_incremental.py
+"""
+IncrementalScheduler against full reruns: random edit/add/remove sequences
+must give exactly the schedule run_schedule computes on the edited workload.
+"""
+
+import numpy as np
+import pytest
+
+from scheduler import Workload, generate_workload, run_schedule
+from scheduler.incremental import IncrementalScheduler
+
+
+def assert_matches_rerun(editor, policy):
+    schedule = editor.schedule()
+    ref = run_schedule(Workload(schedule.workload.arrival, schedule.workload.burst), policy)
+    assert (schedule.order == ref.order).all()
+    assert (schedule.start == ref.start).all()
+    assert (schedule.completion == ref.completion).all()
+
+
+def random_edits(editor, rng, horizon):
+    """Applies one batch of 1-3 random edits, adds or removals."""
+    for _ in range(int(rng.integers(1, 4))):
+        op, n = rng.integers(0, 3), len(editor)
+        if op == 0 and n:
+            arrival = int(rng.integers(0, horizon)) if rng.random() < 0.7 else None
+            burst = int(rng.integers(1, 10)) if rng.random() < 0.7 else None
+            editor.edit(int(rng.integers(0, n)), arrival, burst)
+        elif op == 1 or not n:
+            editor.add(int(rng.integers(0, horizon)), int(rng.integers(1, 10)))
+        else:
+            editor.remove(int(rng.integers(0, n)))
+
+
+@pytest.mark.parametrize("policy", ["sjf", "fcfs"])
+@pytest.mark.parametrize("seed", range(8))
+def test_random_edit_sequences(policy, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(25):
+        n = int(rng.integers(0, 60))
+        horizon = int(rng.integers(1, 120))  # from one burst of arrivals to sparse ones with idle gaps
+        editor = IncrementalScheduler(Workload(rng.integers(0, horizon, n), rng.integers(1, 10, n)), policy)
+        assert_matches_rerun(editor, policy)
+        for _ in range(10):
+            random_edits(editor, rng, horizon)
+            assert_matches_rerun(editor, policy)
+
+
+@pytest.mark.parametrize("policy", ["sjf", "fcfs"])
+def test_seeded_from_schedule(policy):
+    workload = generate_workload(5_000, 1, "poisson", "uniform", rate=0.06)
+    editor = IncrementalScheduler(workload, policy, run_schedule(workload, policy))
+    editor.edit(4_990, burst=2)
+    assert_matches_rerun(editor, policy)
+    # Only the tail after the edited job is replayed
+    assert editor.last_resume["kept"] > 4_900
+
+
+def test_copy_and_cancelled_resume():
+    workload = generate_workload(20_000, 2, "poisson", "uniform", rate=0.06)
+    editor = IncrementalScheduler(workload, "sjf")
+    before = editor.schedule()
+
+    other = editor.copy()
+    other.edit(0, burst=30)
+
+    def stop(done, total):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        other.schedule(stop)
+    # The aborted resume keeps its edits pending and the original is untouched
+    assert_matches_rerun(other, "sjf")
+    assert editor.schedule() is before
+    assert (editor.schedule().workload.burst == workload.burst).all()
+
+
+def test_invalid_edits():
+    editor = IncrementalScheduler(Workload([0, 1], [2, 3]), "sjf")
+    with pytest.raises(IndexError):
+        editor.edit(2, burst=1)
+    with pytest.raises(ValueError):
+        editor.edit(0, burst=0)
+    with pytest.raises(ValueError):
+        editor.add(-1, 5)
+    with pytest.raises(ValueError):
+        IncrementalScheduler(Workload([0], [1]), "rr")
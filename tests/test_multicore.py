@@ -0,0 +1,36 @@
+# tests/test_multicore.py
+"""
+Multi-core scheduling invariants for every queue mode: each job runs once,
+never before it arrives, and jobs on one core never overlap.
+"""
+
+import numpy as np
+import pytest
+
+from scheduler import generate_workload, run_schedule, schedule_multicore
+
+MODES = [("global", False), ("per-core", False), ("per-core", True)]
+
+
+@pytest.mark.parametrize("queue,steal", MODES)
+@pytest.mark.parametrize("policy", ["sjf", "fcfs"])
+@pytest.mark.parametrize("cores", [1, 3, 8])
+def test_valid_schedule(queue, steal, policy, cores):
+    workload = generate_workload(5_000, 7, "bursty", "uniform", rate=0.4)
+    schedule = schedule_multicore(workload, cores, queue, steal, policy)
+    assert sorted(schedule.order.tolist()) == list(range(len(workload)))
+    assert (schedule.start >= workload.arrival).all()
+    assert (schedule.completion == schedule.start + workload.burst).all()
+    for c in range(cores):
+        jobs = np.flatnonzero(schedule.core == c)
+        jobs = jobs[np.argsort(schedule.start[jobs])]
+        assert (schedule.start[jobs][1:] >= schedule.completion[jobs][:-1]).all()
+    if not steal:
+        assert schedule.steals == 0
+
+
+@pytest.mark.parametrize("queue,steal", MODES)
+def test_one_core_matches_single_core(queue, steal):
+    workload = generate_workload(5_000, 3, "poisson", "uniform", rate=0.06)
+    schedule = schedule_multicore(workload, 1, queue, steal)
+    assert (schedule.start == run_schedule(workload, "sjf").start).all()
@@ -0,0 +1,36 @@
+# tests/test_online.py
+"""
+Streaming quantiles: exact order statistics while the P² sketch still holds
+every observation, a close estimate afterwards.
+"""
+
+import numpy as np
+import pytest
+
+from scheduler.online import P2Quantile
+
+
+@pytest.mark.parametrize("p", [0.05, 0.25, 0.5, 0.95, 0.99])
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5])
+def test_exact_for_first_five(p, n):
+    values = [9, 1, 7, 3, 5][:n]
+    sketch = P2Quantile(p)
+    for x in values:
+        sketch.add(x)
+    assert sketch.value() == sorted(values)[round(p * (n - 1))]
+
+
+def test_five_observations_are_not_the_median():
+    sketch = P2Quantile(0.95)
+    for x in [9, 1, 7, 3, 5]:
+        sketch.add(x)
+    assert sketch.value() == 9
+
+
+@pytest.mark.parametrize("p", [0.5, 0.95])
+def test_estimate_on_a_long_stream(p):
+    values = np.random.default_rng(0).exponential(10, 50_000)
+    sketch = P2Quantile(p)
+    for x in values:
+        sketch.add(x)
+    assert sketch.value() == pytest.approx(np.quantile(values, p), rel=0.02)
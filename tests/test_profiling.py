@@ -0,0 +1,56 @@
+# tests/test_profiling.py
+"""
+The heap_operations counter must equal the pushes and pops the engines
+really make, and be absent for schedules that carry no count.
+"""
+
+import heapq
+import types
+
+import pytest
+
+import scheduler.engine
+import scheduler.multicore
+from scheduler import ALGORITHMS, Schedule, generate_workload, run_schedule, schedule_multicore
+from scheduler.profiling import Stats, record_schedule
+
+
+@pytest.fixture
+def heap_calls(monkeypatch):
+    calls = [0]
+
+    def counted(f):
+        def wrapper(*args):
+            calls[0] += 1
+            return f(*args)
+        return wrapper
+
+    proxy = types.SimpleNamespace(
+        heappush=counted(heapq.heappush), heappop=counted(heapq.heappop), heapify=heapq.heapify
+    )
+    monkeypatch.setattr(scheduler.engine, "heapq", proxy)
+    monkeypatch.setattr(scheduler.multicore, "heapq", proxy)
+    return calls
+
+
+@pytest.mark.parametrize("algorithm", list(ALGORITHMS))
+def test_engine_heap_ops_are_exact(heap_calls, algorithm):
+    workload = generate_workload(5_000, 4, "bursty", "uniform", rate=0.2)
+    stats = Stats()
+    run_schedule(workload, algorithm, stats=stats)
+    assert stats.snapshot()["counters"]["heap_operations"] == heap_calls[0]
+
+
+@pytest.mark.parametrize("queue,steal", [("global", False), ("per-core", False), ("per-core", True)])
+def test_multicore_heap_ops_are_exact(heap_calls, queue, steal):
+    workload = generate_workload(5_000, 4, "bursty", "uniform", rate=0.5)
+    assert schedule_multicore(workload, 4, queue, steal).heap_ops == heap_calls[0]
+
+
+def test_unknown_heap_ops_are_not_reported():
+    schedule = run_schedule(generate_workload(100, 1), "sjf")
+    stats = Stats()
+    record_schedule(stats, Schedule(schedule.workload, schedule.start, schedule.completion, schedule.order))
+    counters = stats.snapshot()["counters"]
+    assert counters["jobs"] == 100
+    assert "heap_operations" not in counters
@@ -0,0 +1,26 @@
+# tests/test_sweep.py
+"""
+Parameter sweeps: the table does not depend on how trials are chunked, and
+cells with fewer than two trials report no confidence interval (JSON null).
+"""
+
+import json
+
+from scheduler.sweep import run_sweep, sweep_grid
+
+
+def test_chunking_does_not_change_results():
+    grid = sweep_grid([50], [0.1, 0.5], ["uniform"])
+    one = run_sweep(grid, 6, workers=1, chunksize=6)
+    many = run_sweep(grid, 6, workers=2, chunksize=1)
+    for a, b in zip(one, many):
+        assert a["trials"] == b["trials"] == 6
+        assert abs(a["avg_wt"] - b["avg_wt"]) < 1e-9
+        assert abs(a["avg_wt_ci"] - b["avg_wt_ci"]) < 1e-9
+
+
+def test_single_trial_has_no_ci():
+    table = run_sweep(sweep_grid([20], [0.1], ["uniform"]), 1, workers=1)
+    assert table[0]["trials"] == 1
+    assert table[0]["avg_wt_ci"] is None and table[0]["avg_tat_ci"] is None
+    assert json.loads(json.dumps(table, allow_nan=False))[0]["avg_wt_ci"] is None
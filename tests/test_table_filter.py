@@ -0,0 +1,70 @@
+# tests/test_table_filter.py
+"""
+Server-side pool-table filtering, fed the filter_query strings that
+dash_table.DataTable emits (operators carry an 's'/'i' case prefix).
+"""
+
+import numpy as np
+import pytest
+
+import app
+
+
+def make_run(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = {
+        "id": np.arange(n),
+        "arrival": rng.integers(0, 30, n).astype(np.int32),
+        "burst": rng.integers(1, 31, n).astype(np.int32),
+    }
+    return {"columns": columns, "views": {}}
+
+
+def rows_for(run, query):
+    return app.table_rows(run, [], query)
+
+
+def test_case_prefixed_comparisons():
+    run = make_run()
+    burst, arrival = run["columns"]["burst"], run["columns"]["arrival"]
+    assert (rows_for(run, "{burst} s> 20") == np.flatnonzero(burst > 20)).all()
+    assert (rows_for(run, "{arrival} s= 5") == np.flatnonzero(arrival == 5)).all()
+    assert (rows_for(run, "{burst} i<= 3") == np.flatnonzero(burst <= 3)).all()
+    assert (rows_for(run, "{burst} s!= 7") == np.flatnonzero(burst != 7)).all()
+    # Unprefixed operators (typed by hand) keep working
+    assert (rows_for(run, "{burst} > 20") == np.flatnonzero(burst > 20)).all()
+
+
+def test_combined_terms():
+    run = make_run()
+    burst, arrival = run["columns"]["burst"], run["columns"]["arrival"]
+    rows = rows_for(run, "{burst} s> 20 && {arrival} s< 10")
+    assert (rows == np.flatnonzero((burst > 20) & (arrival < 10))).all()
+
+
+def test_id_contains_is_a_substring_match():
+    run = make_run(200)
+    rows = rows_for(run, "{id} scontains P5")
+    expected = [i for i in range(200) if "P5" in f"P{i + 1}"]
+    assert rows.tolist() == expected  # P5, P50..P59
+    assert rows_for(run, "{id} scontains p5").tolist() == []
+    assert rows_for(run, "{id} icontains p5").tolist() == expected
+    assert rows_for(run, "{id} scontains 12").tolist() == [i for i in range(200) if "12" in str(i + 1)]
+
+
+def test_id_equality_by_label():
+    run = make_run()
+    assert rows_for(run, "{id} s= P5").tolist() == [4]
+    assert rows_for(run, "{id} i= p5").tolist() == [4]
+
+
+def test_page_count_reflects_filter():
+    run = make_run()
+    expected = -(-int((run["columns"]["burst"] > 20).sum()) // 10)
+    assert -(-len(rows_for(run, "{burst} s> 20")) // 10) == expected < 100
+
+
+@pytest.mark.parametrize("query", ["{burst} sdatestartswith 2020", "{burst} s> abc", "{nope} s> 1"])
+def test_unusable_terms_raise(query):
+    with pytest.raises(ValueError):
+        rows_for(make_run(), query)
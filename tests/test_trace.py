@@ -0,0 +1,66 @@
+# tests/test_trace.py
+"""
+Trace readers narrow int64 values to the int32 job arrays: anything that
+would wrap must be rejected with the offending data row named.
+"""
+
+import pytest
+
+from scheduler.binary import convert_trace
+from scheduler.cli import main
+from scheduler.trace import read_workload
+
+
+def write_csv(path, rows):
+    path.write_text("id,arrival,burst\n" + "".join(f"P{i},{a},{b}\n" for i, (a, b) in enumerate(rows)))
+    return str(path)
+
+
+def test_read_workload_in_range(tmp_path):
+    # Largest arrival + every burst lands exactly on the int32 maximum
+    path = write_csv(tmp_path / "ok.csv", [(0, 3), (2**31 - 13, 9)])
+    workload = read_workload(path, chunk_size=1)
+    assert workload.arrival.tolist() == [0, 2**31 - 13]
+    assert workload.burst.tolist() == [3, 9]
+
+
+@pytest.mark.parametrize("bad", [(1_700_000_000_000, 5), (2**31 - 10, 10), (0, 2**31)])
+def test_read_workload_rejects_int32_overflow(tmp_path, bad):
+    path = write_csv(tmp_path / "bad.csv", [(0, 3), (1, 4), bad])
+    with pytest.raises(ValueError, match="data row 3"):
+        read_workload(path, chunk_size=2)
+
+
+def test_read_workload_rejects_cumulative_overflow(tmp_path):
+    # Each row fits, but the three bursts run past 2^31 back to back
+    path = write_csv(tmp_path / "sum.csv", [(2_147_483_630, 9)] * 3)
+    with pytest.raises(ValueError, match="data row 2"):
+        read_workload(path, chunk_size=1)
+
+
+@pytest.mark.parametrize("algorithm", ["sjf", "fcfs"])
+def test_cli_exits_2_on_cumulative_overflow(tmp_path, capsys, algorithm):
+    path = write_csv(tmp_path / "sum.csv", [(2_147_483_630, 9)] * 3)
+    with pytest.raises(SystemExit) as exc:
+        main(["run", "--input", path, "--algorithm", algorithm])
+    assert exc.value.code == 2
+    assert "past 2,147,483,647" in capsys.readouterr().err
+
+
+def test_cli_exits_2_on_overflow(tmp_path, capsys):
+    path = write_csv(tmp_path / "epoch.csv", [(1_700_000_000_000, 5)])
+    with pytest.raises(SystemExit) as exc:
+        main(["run", "--input", path])
+    assert exc.value.code == 2
+    assert "data row 1" in capsys.readouterr().err
+
+
+def test_convert_trace_rejects_int32_overflow(tmp_path):
+    src = write_csv(tmp_path / "bad.csv", [(0, 3), (1_700_000_000_000, 5)])
+    dst = tmp_path / "bad.npy"
+    with pytest.raises(ValueError, match="data row 2"):
+        convert_trace(src, str(dst))
+    assert not dst.exists()
+    src = write_csv(tmp_path / "sum.csv", [(2_147_483_630, 9)] * 3)
+    with pytest.raises(ValueError, match="data row 2"):
+        convert_trace(src, str(dst))